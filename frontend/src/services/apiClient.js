@@ -96,6 +96,52 @@ class LiveDataApiClient {
     }
   }
 
+  /**
+   * List cached games straight from the smart cache (no AI call)
+   * @param {string} sport - 'nfl', 'college', or null for both
+   * @param {string[]} fields - Optional game data paths to include, e.g. ['game_info']
+   */
+  async getGames(sport = null, fields = []) {
+    try {
+      const params = {};
+      if (sport) params.sport = sport;
+      if (fields.length) params.fields = fields.join(',');
+      const response = await this.client.get('/api/games', { params });
+      return response.data;
+    } catch (error) {
+      throw this.handleError(error, 'Games request failed');
+    }
+  }
+
+  /**
+   * Get cached data for a single game
+   * @param {string} sport - 'nfl' or 'college'
+   * @param {string} gameId - ESPN game ID
+   * @param {string[]} fields - Optional game data paths to include
+   */
+  async getGame(sport, gameId, fields = []) {
+    try {
+      const params = fields.length ? { fields: fields.join(',') } : {};
+      const response = await this.client.get(`/api/games/${sport}/${gameId}`, { params });
+      return response.data;
+    } catch (error) {
+      throw this.handleError(error, 'Game request failed');
+    }
+  }
+
+  /**
+   * Get every cached stat line for a player
+   * @param {string} playerId - ESPN player ID
+   */
+  async getPlayer(playerId) {
+    try {
+      const response = await this.client.get(`/api/players/${playerId}`);
+      return response.data;
+    } catch (error) {
+      throw this.handleError(error, 'Player request failed');
+    }
+  }
+
   /**
    * Clear cache for both NFL and College Football
    */
@@ -6,19 +6,49 @@ Clean Flask API backend for both NFL and College Football statistics
 import os
 import json
 import time
+import logging
+import sys
+import gzip
+import hashlib
 from datetime import datetime
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, Response
 from flask_cors import CORS
 from openai import OpenAI
 from dotenv import load_dotenv
 from smart_cache_manager import get_smart_espn_data, smart_cache
+from defensive_analysis import (
+    analyze_formation, encode_play, format_analysis, normalize_players, coach_cache_key, coach_answer_cache,
+    similar_plays, remember_play, format_similar_plays
+)
+from tracing import span, tracer
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS for all routes
 
+# LOG_LEVEL=DEBUG turns on per-request payload logging; APP_ENV=production defaults to WARNING
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'WARNING' if os.getenv('APP_ENV', '').lower() == 'production' else 'INFO').upper()
+# Configured on the 'nextgen' parent so the cache manager's 'nextgen.cache' logger shares it
+_app_logger = logging.getLogger('nextgen')
+if not _app_logger.handlers:
+    _log_handler = logging.StreamHandler(sys.stdout)
+    _log_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(message)s'))
+    _app_logger.addHandler(_log_handler)
+    _app_logger.propagate = False
+_app_logger.setLevel(LOG_LEVEL)
+logger = logging.getLogger('nextgen.api')
+
+# Seconds a chat request waits for ESPN refreshes before answering from cached (possibly stale) games
+CHAT_DATA_BUDGET_SECONDS = float(os.getenv('CHAT_DATA_BUDGET_SECONDS', 5))
+
 # Global chat session
 chat_session = None
 
+def _record_usage(llm_span, response):
+    """Attach token usage from an OpenAI response to its span"""
+    usage = getattr(response, 'usage', None)
+    if usage:
+        llm_span.set(prompt_tokens=usage.prompt_tokens, completion_tokens=usage.completion_tokens)
+
 class NextGenChatSession:
     """NextGen Live Football Stats chat session with OpenAI GPT-5-nano (NFL + College)"""
     
@@ -30,7 +60,7 @@ class NextGenChatSession:
         self.model = "gpt-5-nano-2025-08-07"
         self.conversation_history = []
         
-        print("🏈 NextGen Live Football Stats API initialized with OpenAI GPT-5-nano (NFL + College Football)")
+        logger.info("🏈 NextGen Live Football Stats API initialized with OpenAI GPT-5-nano (NFL + College Football)")
     
     def _filter_query_relevant_data(self, scraped_data: dict, user_input: str, sport: str = None) -> dict:
         """Filter scraped data to only include games relevant to the user's query"""
@@ -42,10 +72,10 @@ class NextGenChatSession:
         total_matches = sum(len(games) for games in matching_games.values())
         
         if total_matches == 0:
-            print(f"🔍 DEBUG: No specific game matches found for query, using all games")
+            logger.debug("🔍 No specific game matches found for query, using all games")
             return scraped_data
         
-        print(f"🎯 DEBUG: Found {total_matches} games matching query: {matching_games}")
+        logger.debug("🎯 Found %s games matching query: %s", total_matches, matching_games)
         
         # Create filtered dataset with only matching games
         filtered_games = {}
@@ -75,10 +105,60 @@ class NextGenChatSession:
         """Get AI response for defensive coaching with player coordinates"""
         try:
             total_start_time = time.time()
-            print(f"🏈 DEBUG: Processing defensive coaching query: '{user_input}'")
-            print(f"🏈 DEBUG: Player coordinates data size: {len(str(player_coordinates))} chars")
+            logger.debug("🏈 Processing defensive coaching query: '%s'", user_input)
+            
+            players = normalize_players(player_coordinates)
+            
+            # Same formation (within the fingerprint grid) + same question -> cached answer, no LLM call
+            cache_key = fingerprint = None
+            if players:
+                with span('coach.cache_lookup') as lookup_span:
+                    cache_key, fingerprint = coach_cache_key(players, user_input)
+                    cached = coach_answer_cache.get(cache_key)
+                    lookup_span.set(hit=cached is not None, fingerprint=fingerprint)
+                if cached:
+                    logger.info("🏈 Defensive coaching answer served from cache (formation %s)", fingerprint)
+                    return {
+                        **cached,
+                        'stats': {
+                            **cached['stats'],
+                            'cache': {'hit': True, 'fingerprint': fingerprint},
+                            'timing': {
+                                'total_duration': round(time.time() - total_start_time, 4),
+                                'cache_lookup_duration': round(lookup_span.duration, 4)
+                            }
+                        },
+                        'timestamp': datetime.now().isoformat()
+                    }
+            
+            # Read the coverage locally first so the model starts from a grounded analysis
+            with span('coach.analysis') as analysis_span:
+                try:
+                    analysis = analyze_formation(players)
+                except Exception as e:
+                    logger.warning("🏈 Local formation analysis failed, sending coordinates only: %s", e)
+                    analysis = None
+                analysis_span.set(analysed=analysis is not None)
+            analysis_duration = analysis_span.duration
+            
+            # Closest past looks from the formation library, then add this one to it
+            similar = []
+            if analysis:
+                with span('coach.similar_plays') as similar_span:
+                    try:
+                        similar = similar_plays(players, analysis, fingerprint)
+                        remember_play(players, analysis, fingerprint)
+                    except Exception as e:
+                        logger.warning("🏈 Formation library lookup failed: %s", e)
+                    similar_span.set(matches=len(similar))
             
             # Create system message for defensive coaching
+            prompt_span = span('coach.prompt_build').begin()
+            # Position/team/yards table; only payloads with no usable coordinates go out as JSON
+            if players:
+                coordinates_text = encode_play(players)
+            else:
+                coordinates_text = json.dumps(player_coordinates, separators=(',', ':'))
             system_message = """You are an elite American football defensive coach with decades of experience analyzing defensive coverage and player positioning. You have access to real-time player coordinates with x,y coordinates and yards relative to the line of scrimmage.
 
 EXPERTISE AREAS:
@@ -105,9 +185,25 @@ RESPONSE GUIDELINES:
 - Provide actionable defensive coaching advice
 - Consider down and distance context when available"""
 
-            user_message = f"""
-Player Coordinate Data:
-{json.dumps(player_coordinates, indent=2)}
+            similar_text = f"\nMost Similar Past Looks:\n{format_similar_plays(similar)}\n" if similar else ''
+            if analysis:
+                system_message += """
+- A local classifier has pre-computed the coverage read (shell, man/zone signals, DB leverage, safety depths); build on it, and say so if the coordinates contradict it"""
+                user_message = f"""
+Pre-computed Formation Analysis:
+{format_analysis(analysis)}
+{similar_text}
+Player Coordinates (yards; x = depth from line of scrimmage, y = width from field center):
+{coordinates_text}
+
+Coaching Question: {user_input}
+
+Please analyze the defensive positioning and provide expert coaching insights based on the analysis and formation shown.
+"""
+            else:
+                user_message = f"""
+Player Coordinate Data (yards; x = depth from line of scrimmage, y = width from field center):
+{coordinates_text}
 
 Coaching Question: {user_input}
 
@@ -119,33 +215,40 @@ Please analyze the defensive positioning and provide expert coaching insights ba
                 {"role": "system", "content": system_message},
                 {"role": "user", "content": user_message}
             ]
-            
-            # Calculate input sizes for tracking
-            total_input_size = len(system_message) + len(user_message)
-            coordinates_size = len(str(player_coordinates))
-            
-            print(f"🏈 DEBUG: OpenAI API Call Details:")
-            print(f"🏈 DEBUG: - Model: {self.model}")
-            print(f"🏈 DEBUG: - System message: {len(system_message):,} chars")
-            print(f"🏈 DEBUG: - User message: {len(user_message):,} chars")
-            print(f"🏈 DEBUG: - Coordinates data: {coordinates_size:,} chars")
-            print(f"🏈 DEBUG: - Total input size: {total_input_size:,} chars ({total_input_size/1024:.1f} KB)")
-            
-            print(f"🏈 DEBUG: Making OpenAI API call for defensive coaching...")
-            openai_start_time = time.time()
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages
-            )
-            openai_duration = time.time() - openai_start_time
-            
-            print(f"🏈 DEBUG: OpenAI response received in {openai_duration:.2f}s")
+            # Size of the payload as it used to be forwarded (indented JSON) vs the encoding sent
+            raw_coordinates_chars = len(json.dumps(player_coordinates, indent=2))
+            prompt_span.set(prompt_chars=len(system_message) + len(user_message),
+                            coordinates_chars=len(coordinates_text), raw_coordinates_chars=raw_coordinates_chars)
+            prompt_span.end()
+            prompt_duration = prompt_span.duration
+            
+            # Input sizes are only worth computing when someone reads them
+            if logger.isEnabledFor(logging.DEBUG):
+                total_input_size = len(system_message) + len(user_message)
+                coordinates_size = len(coordinates_text)
+                logger.debug("🏈 OpenAI API Call Details:")
+                logger.debug("🏈 - Model: %s", self.model)
+                logger.debug("🏈 - System message: %d chars", len(system_message))
+                logger.debug("🏈 - User message: %d chars", len(user_message))
+                logger.debug("🏈 - Coordinates data: %d chars", coordinates_size)
+                logger.debug("🏈 - Total input size: %d chars (%.1f KB)", total_input_size, total_input_size/1024)
+            
+            logger.debug("🏈 Making OpenAI API call for defensive coaching...")
+            with span('llm.call', model=self.model) as llm_span:
+                response = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages
+                )
+                _record_usage(llm_span, response)
+            openai_duration = llm_span.duration
+            
+            logger.debug("🏈 OpenAI response received in %.2fs", openai_duration)
             
             if response.choices and len(response.choices) > 0:
                 content = response.choices[0].message.content
-                print(f"🏈 DEBUG: Response content length: {len(content) if content else 0} chars")
+                logger.debug("🏈 Response content length: %s chars", len(content) if content else 0)
             else:
-                print(f"🏈 DEBUG: No response choices found!")
+                logger.warning("🏈 No response choices found!")
                 return {
                     'success': False,
                     'error': 'No response received from AI',
@@ -155,25 +258,39 @@ Please analyze the defensive positioning and provide expert coaching insights ba
             final_response = response.choices[0].message.content
             total_duration = time.time() - total_start_time
             
-            print(f"🏈 DEBUG: Defensive coaching response completed in {total_duration:.2f}s")
+            logger.info("🏈 Defensive coaching response completed in %.2fs", total_duration)
             
-            return {
+            result = {
                 'success': True,
                 'response': final_response,
                 'stats': {
                     'coordinates_processed': len(player_coordinates.get('players', [])) if isinstance(player_coordinates.get('players'), list) else 0,
+                    'coverage_analysis': {
+                        key: analysis[key] for key in ('coverage', 'safety_depths', 'db_leverage')
+                    } if analysis else None,
+                    'prompt_size': {
+                        'raw_coordinates_chars': raw_coordinates_chars,
+                        'encoded_coordinates_chars': len(coordinates_text),
+                        'reduction_pct': round(100 * (1 - len(coordinates_text) / raw_coordinates_chars), 1) if raw_coordinates_chars else 0.0,
+                        'prompt_chars': len(system_message) + len(user_message)
+                    },
+                    'similar_plays': similar,
+                    'cache': {'hit': False, 'fingerprint': fingerprint},
                     'timing': {
                         'total_duration': round(total_duration, 2),
-                        'openai_duration': round(openai_duration, 2)
+                        'analysis_duration': round(analysis_duration, 4),
+                        'prompt_build_duration': round(prompt_duration, 4),
+                        'openai_duration': round(openai_duration, 4)
                     }
                 },
                 'timestamp': datetime.now().isoformat()
             }
+            if cache_key:
+                coach_answer_cache.store(cache_key, result)
+            return result
             
         except Exception as e:
-            print(f"🏈 DEBUG: Exception in defensive coaching: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("🏈 Exception in defensive coaching: %s", e)
             return {
                 'success': False,
                 'error': f"Defensive coaching error: {str(e)}",
@@ -184,18 +301,13 @@ Please analyze the defensive positioning and provide expert coaching insights ba
         """Get AI response for user input with sport selection"""
         try:
             total_start_time = time.time()
-            print(f"🔍 DEBUG: Processing user input: '{user_input}'")
-            print(f"🔍 DEBUG: Sport filter: {sport}")
+            logger.debug("🔍 Processing user input: '%s'", user_input)
+            logger.debug("🔍 Sport filter: %s", sport)
             
             # Handle special commands
             if user_input.lower() == 'refresh':
-                # Clear smart cache for both sports
-                smart_cache.game_cache['college'].clear()
-                smart_cache.game_cache['nfl'].clear()
-                smart_cache.full_dataset_timestamp['college'] = None
-                smart_cache.full_dataset_timestamp['nfl'] = None
-                smart_cache.all_game_ids['college'].clear()
-                smart_cache.all_game_ids['nfl'].clear()
+                # Clear smart cache (memory and disk) for both sports
+                smart_cache.clear()
                 return {
                     'success': True,
                     'response': "🔄 Cache refreshed for both NFL and College Football - fetching fresh data on next query",
@@ -212,15 +324,25 @@ Please analyze the defensive positioning and provide expert coaching insights ba
                 # If no sport specified, get both
             
             # Get smart ESPN data with query context and sport preference
-            print(f"🔍 DEBUG: Fetching ESPN data...")
-            espn_start_time = time.time()
-            scraped_data = get_smart_espn_data(query_hint=user_input, sport=sport)
-            espn_duration = time.time() - espn_start_time
-            print(f"🔍 DEBUG: ESPN data retrieved in {espn_duration:.2f}s - Total games: {scraped_data.get('total_games', 0) if scraped_data else 0}")
+            logger.debug("🔍 Fetching ESPN data...")
+            with span('chat.espn_data', sport=sport) as espn_span:
+                # Week/season questions come from the backfilled archive when it has them;
+                # score/status questions are answered from the scoreboard without touching boxscores
+                scraped_data = smart_cache.get_archived_data(query_hint=user_input, sport=sport)
+                if not scraped_data:
+                    if smart_cache.is_score_query(user_input):
+                        scraped_data = smart_cache.get_scoreboard_data(query_hint=user_input, sport=sport)
+                    # Everything else - and score questions the scoreboard couldn't answer - uses boxscores
+                    if not scraped_data or not scraped_data.get('total_games'):
+                        scraped_data = get_smart_espn_data(query_hint=user_input, sport=sport,
+                                                           deadline_seconds=CHAT_DATA_BUDGET_SECONDS)
+                espn_span.set(source=scraped_data.get('source', 'boxscore') if scraped_data else None)
+            espn_duration = espn_span.duration
+            logger.debug("🔍 ESPN data retrieved in %.2fs - Total games: %s", espn_duration, scraped_data.get('total_games', 0) if scraped_data else 0)
             
             # Check if ESPN data retrieval failed
             if not scraped_data or not scraped_data.get('games'):
-                print(f"🔍 DEBUG: ESPN data retrieval failed - scraped_data: {bool(scraped_data)}")
+                logger.warning("🔍 ESPN data retrieval failed - scraped_data: %s", bool(scraped_data))
                 return {
                     'success': False,
                     'error': 'Unable to retrieve football data from ESPN',
@@ -228,22 +350,42 @@ Please analyze the defensive positioning and provide expert coaching insights ba
                 }
             
             # Filter data to only query-relevant games if specific matches found
-            original_game_count = len(scraped_data.get('games', {}))
-            filtered_data = self._filter_query_relevant_data(scraped_data, user_input, sport)
-            filtered_game_count = len(filtered_data.get('games', {}))
-            
-            print(f"🔍 DEBUG: Data filtering - Original: {original_game_count} games, Filtered: {filtered_game_count} games")
+            with span('chat.filter', sport=sport) as filter_span:
+                original_game_count = len(scraped_data.get('games', {}))
+                filtered_data = self._filter_query_relevant_data(scraped_data, user_input, sport)
+                filtered_game_count = len(filtered_data.get('games', {}))
+                filter_span.set(games_in=original_game_count, games_out=filtered_game_count)
+            filter_duration = filter_span.duration
+            
+            logger.debug("🔍 Data filtering - Original: %s games, Filtered: %s games", original_game_count, filtered_game_count)
             if filtered_game_count < original_game_count:
-                print(f"🎯 DEBUG: Using filtered dataset ({filtered_game_count} games) for faster LLM response")
+                logger.debug("🎯 Using filtered dataset (%s games) for faster LLM response", filtered_game_count)
                 scraped_data = filtered_data
+                if 'freshness' in scraped_data:
+                    scraped_data['freshness'] = smart_cache.describe_freshness(scraped_data)
             
             # Determine sports included in data
+            prompt_span = span('chat.prompt_build', sport=sport).begin()
             sports_included = scraped_data.get('sports', ['college'])
             sport_description = ' and '.join([s.title() for s in sports_included])
             
             # Send filtered data to OpenAI with context
             is_filtered = scraped_data.get('filtered', False)
             data_context = "filtered data focused on your query" if is_filtered else "comprehensive data"
+            if scraped_data.get('source') == 'scoreboard':
+                data_context = f"scoreboard summaries only - teams, scores, records and game clock ({data_context})"
+            elif scraped_data.get('source') == 'archive':
+                week_text = f"week {scraped_data['week']} of " if scraped_data.get('week') else ""
+                part_text = {1: "preseason", 3: "postseason"}.get(scraped_data.get('season_type'), "season")
+                data_context = f"archived games from {week_text}the {scraped_data['season']} {part_text} ({data_context})"
+            
+            freshness = scraped_data.get('freshness')
+            freshness_text = "Real-time with smart caching (2-10 minute intervals)"
+            if freshness and freshness['oldest_age_seconds'] is not None:
+                freshness_text = (f"cached {freshness['newest_age_seconds']:.0f}-{freshness['oldest_age_seconds']:.0f} seconds ago; "
+                                  f"{len(freshness['stale_games'])} games older than 2 minutes (listed in freshness.stale_games)")
+                if freshness['refreshing']:
+                    freshness_text += f"; {', '.join(freshness['refreshing'])} refresh still in progress"
             
             system_message = f"""You are NextGen Live Football Stats AI assistant, an expert in analyzing real-time football data.
 
@@ -251,7 +393,7 @@ DATA STRUCTURE YOU'RE WORKING WITH:
 - Source: ESPN live sports data ({data_context})
 - Sports: {sport_description}
 - Total Games: {scraped_data.get('total_games', 0)}
-- Data Freshness: Real-time with smart caching (2-10 minute intervals)
+- Data Freshness: {freshness_text}
 
 AVAILABLE DATA FIELDS:
 1. Game Info: team names, scores, game status, quarter/time remaining
@@ -272,6 +414,7 @@ RESPONSE GUIDELINES:
 - Focus on the most relevant and exciting information for the query
 - Use specific numbers, player names, and team names from the data
 - If data is filtered, you're seeing only games relevant to the user's query
+- If a game is in freshness.stale_games, mention that its numbers may be a few minutes behind
 - When comparing players or teams, use actual statistical data provided
 - Format statistics clearly (e.g., "245 passing yards, 3 TDs, 1 INT")"""
             
@@ -290,42 +433,47 @@ RESPONSE GUIDELINES:
                 *self.conversation_history,
                 {"role": "user", "content": user_message}
             ]
-            
-            # Calculate data sizes for comprehensive tracking
-            scraped_data_size = len(str(scraped_data))
-            total_input_size = len(system_message) + len(user_message)
-            
-            print(f"🔍 DEBUG: ESPN Data Analysis:")
-            print(f"🔍 DEBUG: - Raw scraped data size: {scraped_data_size:,} chars ({scraped_data_size/1024:.1f} KB)")
-            print(f"🔍 DEBUG: - Games in dataset: {scraped_data.get('total_games', 0)}")
-            print(f"🔍 DEBUG: - Sports included: {scraped_data.get('sports', [])}")
-            print(f"🔍 DEBUG: - Data is filtered: {scraped_data.get('filtered', False)}")
-            
-            print(f"🔍 DEBUG: OpenAI API Call Details:")
-            print(f"🔍 DEBUG: - Model: {self.model}")
-            print(f"🔍 DEBUG: - Total messages: {len(messages)}")
-            print(f"🔍 DEBUG: - System message: {len(system_message):,} chars")
-            print(f"🔍 DEBUG: - User message: {len(user_message):,} chars ({len(user_message)/1024:.1f} KB)")
-            print(f"🔍 DEBUG: - Total input size: {total_input_size:,} chars ({total_input_size/1024:.1f} KB)")
-            print(f"🔍 DEBUG: - Conversation history: {len(self.conversation_history)} messages")
-            
-            print(f"🔍 DEBUG: Making OpenAI API call...")
-            openai_start_time = time.time()
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages
-            )
-            openai_duration = time.time() - openai_start_time
-            
-            print(f"🔍 DEBUG: OpenAI response received in {openai_duration:.2f}s")
-            print(f"🔍 DEBUG: Response choices count: {len(response.choices) if response.choices else 0}")
+            prompt_span.set(prompt_chars=len(system_message) + len(user_message))
+            prompt_span.end()
+            prompt_duration = prompt_span.duration
+            
+            # Data sizes re-serialise the whole dataset, so only compute them for debug output
+            if logger.isEnabledFor(logging.DEBUG):
+                scraped_data_size = len(str(scraped_data))
+                total_input_size = len(system_message) + len(user_message)
+                
+                logger.debug("🔍 ESPN Data Analysis:")
+                logger.debug("🔍 - Raw scraped data size: %d chars (%.1f KB)", scraped_data_size, scraped_data_size/1024)
+                logger.debug("🔍 - Games in dataset: %s", scraped_data.get('total_games', 0))
+                logger.debug("🔍 - Sports included: %s", scraped_data.get('sports', []))
+                logger.debug("🔍 - Data is filtered: %s", scraped_data.get('filtered', False))
+                
+                logger.debug("🔍 OpenAI API Call Details:")
+                logger.debug("🔍 - Model: %s", self.model)
+                logger.debug("🔍 - Total messages: %s", len(messages))
+                logger.debug("🔍 - System message: %d chars", len(system_message))
+                logger.debug("🔍 - User message: %d chars (%.1f KB)", len(user_message), len(user_message)/1024)
+                logger.debug("🔍 - Total input size: %d chars (%.1f KB)", total_input_size, total_input_size/1024)
+                logger.debug("🔍 - Conversation history: %s messages", len(self.conversation_history))
+            
+            logger.debug("🔍 Making OpenAI API call...")
+            with span('llm.call', sport=sport, model=self.model) as llm_span:
+                response = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages
+                )
+                _record_usage(llm_span, response)
+            openai_duration = llm_span.duration
+            
+            logger.debug("🔍 OpenAI response received in %.2fs", openai_duration)
+            logger.debug("🔍 Response choices count: %s", len(response.choices) if response.choices else 0)
             if response.choices and len(response.choices) > 0:
                 content = response.choices[0].message.content
-                print(f"🔍 DEBUG: Response content length: {len(content) if content else 0} chars")
-                print(f"🔍 DEBUG: Response content preview: {content[:100] if content else 'NONE'}...")
+                logger.debug("🔍 Response content length: %s chars", len(content) if content else 0)
+                logger.debug("🔍 Response content preview: %s...", content[:100] if content else 'NONE')
             else:
-                print(f"🔍 DEBUG: No response choices found!")
-                print(f"🔍 DEBUG: Full response object: {response}")
+                logger.warning("🔍 No response choices found!")
+                logger.debug("🔍 Full response object: %s", response)
             
             # Update conversation history (keep last 10 exchanges)
             self.conversation_history.append({"role": "user", "content": user_input})
@@ -343,9 +491,9 @@ RESPONSE GUIDELINES:
             final_response = response.choices[0].message.content if response.choices else ""
             total_duration = time.time() - total_start_time
             
-            print(f"🔍 DEBUG: Final response being returned: {len(final_response)} chars")
-            print(f"🔍 DEBUG: Total request processing time: {total_duration:.2f}s")
-            print(f"🔍 DEBUG: Timing breakdown - ESPN: {espn_duration:.2f}s, OpenAI: {openai_duration:.2f}s, Other: {(total_duration - espn_duration - openai_duration):.2f}s")
+            logger.debug("🔍 Final response being returned: %s chars", len(final_response))
+            logger.info("🔍 Total request processing time: %.2fs", total_duration)
+            logger.debug("🔍 Timing breakdown - ESPN: %.2fs, OpenAI: %.2fs, Other: %.2fs", espn_duration, openai_duration, total_duration - espn_duration - openai_duration)
             
             return {
                 'success': True,
@@ -356,21 +504,20 @@ RESPONSE GUIDELINES:
                     'total_players': combined_stats.get('total_players_tracked', 0),
                     'total_teams': combined_stats.get('total_teams_tracked', 0),
                     'sports_included': sports_included,
+                    'data_freshness': dict(freshness, budget_seconds=CHAT_DATA_BUDGET_SECONDS) if freshness else None,
                     'timing': {
                         'total_duration': round(total_duration, 2),
-                        'espn_duration': round(espn_duration, 2),
-                        'openai_duration': round(openai_duration, 2)
+                        'espn_duration': round(espn_duration, 4),
+                        'filter_duration': round(filter_duration, 4),
+                        'prompt_build_duration': round(prompt_duration, 4),
+                        'openai_duration': round(openai_duration, 4)
                     }
                 },
                 'timestamp': datetime.now().isoformat()
             }
             
         except Exception as e:
-            print(f"🔍 DEBUG: Exception caught in get_response: {str(e)}")
-            print(f"🔍 DEBUG: Exception type: {type(e)}")
-            import traceback
-            print(f"🔍 DEBUG: Full traceback:")
-            traceback.print_exc()
+            logger.exception("🔍 Exception caught in get_response: %s (%s)", e, type(e).__name__)
             return {
                 'success': False,
                 'error': f"AI processing error: {str(e)}",
@@ -380,13 +527,13 @@ RESPONSE GUIDELINES:
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
-    print(f"🔍 DEBUG: Health check endpoint called")
-    print(f"🔍 DEBUG: Chat session initialized: {chat_session is not None}")
+    logger.debug("🔍 Health check endpoint called")
+    logger.debug("🔍 Chat session initialized: %s", chat_session is not None)
     
     if chat_session:
         cache_status = smart_cache.get_cache_status()
         combined_stats = cache_status.get('combined', {})
-        print(f"🔍 DEBUG: Cache status - Games: {combined_stats.get('total_games_cached', 0)}, Players: {combined_stats.get('total_players_tracked', 0)}")
+        logger.debug("🔍 Cache status - Games: %s, Players: %s", combined_stats.get('total_games_cached', 0), combined_stats.get('total_players_tracked', 0))
     
     return jsonify({
         'status': 'healthy',
@@ -399,12 +546,12 @@ def chat():
     """Main chat endpoint with sport selection"""
     global chat_session
     
-    print(f"🔍 DEBUG: /api/chat endpoint called")
-    print(f"🔍 DEBUG: Request method: {request.method}")
-    print(f"🔍 DEBUG: Request headers: {dict(request.headers)}")
+    logger.debug("🔍 /api/chat endpoint called")
+    logger.debug("🔍 Request method: %s", request.method)
+    logger.debug("🔍 Request headers: %s", request.headers)
     
     if not chat_session:
-        print(f"🔍 DEBUG: Chat session not initialized!")
+        logger.error("🔍 Chat session not initialized!")
         return jsonify({
             'success': False,
             'error': 'AI chat session not initialized'
@@ -412,10 +559,10 @@ def chat():
     
     try:
         data = request.json
-        print(f"🔍 DEBUG: Request JSON data: {data}")
+        logger.debug("🔍 Request JSON data: %s", data)
         
         if not data:
-            print(f"🔍 DEBUG: No JSON data provided in request")
+            logger.debug("🔍 No JSON data provided in request")
             return jsonify({
                 'success': False,
                 'error': 'No JSON data provided'
@@ -424,30 +571,28 @@ def chat():
         message = data.get('message', '').strip()
         sport = data.get('sport', None)  # Optional sport parameter
         
-        print(f"🔍 DEBUG: Extracted message: '{message}'")
-        print(f"🔍 DEBUG: Extracted sport filter: {sport}")
+        logger.debug("🔍 Extracted message: '%s'", message)
+        logger.debug("🔍 Extracted sport filter: %s", sport)
         
         if not message:
-            print(f"🔍 DEBUG: Empty message provided")
+            logger.debug("🔍 Empty message provided")
             return jsonify({
                 'success': False,
                 'error': 'No message provided'
             }), 400
         
-        print(f"🔍 DEBUG: Calling chat_session.get_response() with message length: {len(message)} chars")
-        response = chat_session.get_response(message, sport)
+        logger.debug("🔍 Calling chat_session.get_response() with message length: %s chars", len(message))
+        with span('chat.request', sport=sport):
+            response = chat_session.get_response(message, sport)
         
-        print(f"🔍 DEBUG: Response received from chat_session")
-        print(f"🔍 DEBUG: Response success: {response.get('success', False)}")
-        print(f"🔍 DEBUG: Response length: {len(response.get('response', '')) if response.get('response') else 0} chars")
+        logger.debug("🔍 Response received from chat_session")
+        logger.debug("🔍 Response success: %s", response.get('success', False))
+        logger.debug("🔍 Response length: %s chars", len(response.get('response', '')) if response.get('response') else 0)
         
         return jsonify(response)
         
     except Exception as e:
-        print(f"🔍 DEBUG: Exception in /api/chat endpoint: {str(e)}")
-        import traceback
-        print(f"🔍 DEBUG: Full traceback:")
-        traceback.print_exc()
+        logger.exception("🔍 Exception in /api/chat endpoint: %s", e)
         return jsonify({
             'success': False,
             'error': f'Server error: {str(e)}'
@@ -458,14 +603,14 @@ def get_stats():
     """Get current system statistics"""
     global chat_session
     
-    print(f"🔍 DEBUG: /api/stats endpoint called")
+    logger.debug("🔍 /api/stats endpoint called")
     
     if not chat_session:
-        print(f"🔍 DEBUG: Chat session not initialized for stats endpoint")
+        logger.error("🔍 Chat session not initialized for stats endpoint")
         return jsonify({'error': 'Service not initialized'}), 500
     
     try:
-        print(f"🔍 DEBUG: Getting smart cache status...")
+        logger.debug("🔍 Getting smart cache status...")
         # Get smart cache status
         cache_status = smart_cache.get_cache_status()
         
@@ -474,30 +619,27 @@ def get_stats():
         college_stats = cache_status.get('college', {})
         nfl_stats = cache_status.get('nfl', {})
         
-        print(f"🔍 DEBUG: Cache stats - Total games: {combined_stats.get('total_games_cached', 0)}")
-        print(f"🔍 DEBUG: Cache stats - Total players: {combined_stats.get('total_players_tracked', 0)}")
-        print(f"🔍 DEBUG: Cache stats - Total teams: {combined_stats.get('total_teams_tracked', 0)}")
-        print(f"🔍 DEBUG: Cache stats - College games: {college_stats.get('individual_games_cached', 0)}")
-        print(f"🔍 DEBUG: Cache stats - NFL games: {nfl_stats.get('individual_games_cached', 0)}")
-        print(f"🔍 DEBUG: Cache stats - College fresh games: {college_stats.get('fresh_games', 0)}")
-        print(f"🔍 DEBUG: Cache stats - NFL fresh games: {nfl_stats.get('fresh_games', 0)}")
+        logger.debug("🔍 Cache stats - Total games: %s", combined_stats.get('total_games_cached', 0))
+        logger.debug("🔍 Cache stats - Total players: %s", combined_stats.get('total_players_tracked', 0))
+        logger.debug("🔍 Cache stats - Total teams: %s", combined_stats.get('total_teams_tracked', 0))
+        logger.debug("🔍 Cache stats - College games: %s", college_stats.get('individual_games_cached', 0))
+        logger.debug("🔍 Cache stats - NFL games: %s", nfl_stats.get('individual_games_cached', 0))
+        logger.debug("🔍 Cache stats - College fresh games: %s", college_stats.get('fresh_games', 0))
+        logger.debug("🔍 Cache stats - NFL fresh games: %s", nfl_stats.get('fresh_games', 0))
         
         response_data = {
             'service': 'NextGen Live Football Stats (NFL + College)',
             'status': 'active',
             'cache': cache_status,
+            'coach_cache': coach_answer_cache.status(),
             'timestamp': datetime.now().isoformat()
         }
         
-        print(f"🔍 DEBUG: Stats response prepared, size: {len(str(response_data))} chars")
         
         return jsonify(response_data)
         
     except Exception as e:
-        print(f"🔍 DEBUG: Exception in /api/stats endpoint: {str(e)}")
-        import traceback
-        print(f"🔍 DEBUG: Full traceback:")
-        traceback.print_exc()
+        logger.exception("🔍 Exception in /api/stats endpoint: %s", e)
         return jsonify({
             'error': f'Stats error: {str(e)}'
         }), 500
@@ -505,28 +647,27 @@ def get_stats():
 @app.route('/api/cache/clear', methods=['POST'])
 def clear_cache():
     """Clear the smart cache for both sports"""
-    print(f"🔍 DEBUG: /api/cache/clear endpoint called")
+    logger.debug("🔍 /api/cache/clear endpoint called")
     
     try:
         # Log cache status before clearing
         cache_status_before = smart_cache.get_cache_status()
         combined_before = cache_status_before.get('combined', {})
-        print(f"🔍 DEBUG: Cache before clear - Games: {combined_before.get('total_games_cached', 0)}, Players: {combined_before.get('total_players_tracked', 0)}")
+        logger.debug("🔍 Cache before clear - Games: %s, Players: %s", combined_before.get('total_games_cached', 0), combined_before.get('total_players_tracked', 0))
+        
+        logger.debug("🔍 Clearing college cache...")
+        smart_cache.clear('college')
         
-        print(f"🔍 DEBUG: Clearing college cache...")
-        smart_cache.game_cache['college'].clear()
-        smart_cache.full_dataset_timestamp['college'] = None
-        smart_cache.all_game_ids['college'].clear()
+        logger.debug("🔍 Clearing NFL cache...")
+        smart_cache.clear('nfl')
         
-        print(f"🔍 DEBUG: Clearing NFL cache...")
-        smart_cache.game_cache['nfl'].clear()
-        smart_cache.full_dataset_timestamp['nfl'] = None
-        smart_cache.all_game_ids['nfl'].clear()
+        logger.debug("🔍 Clearing defensive coach answers...")
+        coach_answer_cache.clear()
         
         # Log cache status after clearing
         cache_status_after = smart_cache.get_cache_status()
         combined_after = cache_status_after.get('combined', {})
-        print(f"🔍 DEBUG: Cache after clear - Games: {combined_after.get('total_games_cached', 0)}, Players: {combined_after.get('total_players_tracked', 0)}")
+        logger.debug("🔍 Cache after clear - Games: %s, Players: %s", combined_after.get('total_games_cached', 0), combined_after.get('total_players_tracked', 0))
         
         response_data = {
             'success': True,
@@ -534,15 +675,12 @@ def clear_cache():
             'timestamp': datetime.now().isoformat()
         }
         
-        print(f"🔍 DEBUG: Cache clear successful")
+        logger.debug("🔍 Cache clear successful")
         
         return jsonify(response_data)
         
     except Exception as e:
-        print(f"🔍 DEBUG: Exception in /api/cache/clear endpoint: {str(e)}")
-        import traceback
-        print(f"🔍 DEBUG: Full traceback:")
-        traceback.print_exc()
+        logger.exception("🔍 Exception in /api/cache/clear endpoint: %s", e)
         return jsonify({
             'success': False,
             'error': f'Cache clear error: {str(e)}'
@@ -553,12 +691,12 @@ def defensive_coach():
     """Defensive coaching endpoint with player coordinates analysis"""
     global chat_session
     
-    print(f"🏈 DEBUG: /api/defensive-coach endpoint called")
-    print(f"🏈 DEBUG: Request method: {request.method}")
-    print(f"🏈 DEBUG: Request headers: {dict(request.headers)}")
+    logger.debug("🏈 /api/defensive-coach endpoint called")
+    logger.debug("🏈 Request method: %s", request.method)
+    logger.debug("🏈 Request headers: %s", request.headers)
     
     if not chat_session:
-        print(f"🏈 DEBUG: Chat session not initialized!")
+        logger.error("🏈 Chat session not initialized!")
         return jsonify({
             'success': False,
             'error': 'AI chat session not initialized'
@@ -566,10 +704,10 @@ def defensive_coach():
     
     try:
         data = request.json
-        print(f"🏈 DEBUG: Request JSON data keys: {list(data.keys()) if data else 'None'}")
+        logger.debug("🏈 Request JSON data keys: %s", list(data.keys()) if data else 'None')
         
         if not data:
-            print(f"🏈 DEBUG: No JSON data provided in request")
+            logger.debug("🏈 No JSON data provided in request")
             return jsonify({
                 'success': False,
                 'error': 'No JSON data provided'
@@ -578,48 +716,207 @@ def defensive_coach():
         message = data.get('message', '').strip()
         player_coordinates = data.get('coordinates', {})
         
-        print(f"🏈 DEBUG: Extracted message: '{message}'")
-        print(f"🏈 DEBUG: Coordinates data size: {len(str(player_coordinates))} chars")
+        logger.debug("🏈 Extracted message: '%s'", message)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🏈 Coordinates data size: %d chars", len(json.dumps(player_coordinates)))
         
         if not message:
-            print(f"🏈 DEBUG: Empty message provided")
+            logger.debug("🏈 Empty message provided")
             return jsonify({
                 'success': False,
                 'error': 'No message provided'
             }), 400
         
         if not player_coordinates:
-            print(f"🏈 DEBUG: No player coordinates provided")
+            logger.debug("🏈 No player coordinates provided")
             return jsonify({
                 'success': False,
                 'error': 'No player coordinates provided'
             }), 400
         
-        print(f"🏈 DEBUG: Calling defensive coaching analysis...")
-        response = chat_session.get_defensive_coaching_response(message, player_coordinates)
+        logger.debug("🏈 Calling defensive coaching analysis...")
+        with span('coach.request'):
+            response = chat_session.get_defensive_coaching_response(message, player_coordinates)
         
-        print(f"🏈 DEBUG: Defensive coaching response received")
-        print(f"🏈 DEBUG: Response success: {response.get('success', False)}")
-        print(f"🏈 DEBUG: Response length: {len(response.get('response', '')) if response.get('response') else 0} chars")
+        logger.debug("🏈 Defensive coaching response received")
+        logger.debug("🏈 Response success: %s", response.get('success', False))
+        logger.debug("🏈 Response length: %s chars", len(response.get('response', '')) if response.get('response') else 0)
         
         return jsonify(response)
         
     except Exception as e:
-        print(f"🏈 DEBUG: Exception in /api/defensive-coach endpoint: {str(e)}")
-        import traceback
-        print(f"🏈 DEBUG: Full traceback:")
-        traceback.print_exc()
+        logger.exception("🏈 Exception in /api/defensive-coach endpoint: %s", e)
         return jsonify({
             'success': False,
             'error': f'Server error: {str(e)}'
         }), 500
 
+# Read-only games API served straight from the smart cache (no LLM involved)
+VALID_SPORTS = ('college', 'nfl')
+GZIP_MIN_BYTES = 1024
+
+def _parse_fields(raw_fields):
+    """Parse a ?fields=a,b.c query value into a list of dotted paths"""
+    if not raw_fields:
+        return []
+    return [field.strip() for field in raw_fields.split(',') if field.strip()]
+
+def _select_fields(data: dict, fields: list) -> dict:
+    """Keep only the requested (optionally dotted) paths of a game payload"""
+    if not fields:
+        return data
+    
+    selected = {}
+    for field in fields:
+        source = data
+        target = selected
+        parts = field.split('.')
+        for i, part in enumerate(parts):
+            if not isinstance(source, dict) or part not in source:
+                break
+            if i == len(parts) - 1:
+                target[part] = source[part]
+            else:
+                source = source[part]
+                target = target.setdefault(part, {})
+    return selected
+
+def _game_summary(sport: str, game_id: str, game_entry: dict) -> dict:
+    """Lightweight description of a cached game built from its metadata"""
+    metadata = game_entry.get('metadata', {})
+    return {
+        'sport': sport,
+        'game_id': game_id,
+        'teams': metadata.get('teams', []),
+        'status': metadata.get('status', {}),
+        'players_tracked': len(metadata.get('players', [])),
+        'cached_at': game_entry['timestamp'].isoformat()
+    }
+
+def _cache_etag(entries, *extra) -> str:
+    """Validator derived from the identity and cache timestamp of every game in the response"""
+    digest = hashlib.sha1()
+    for sport, game_id, game_entry in sorted(entries, key=lambda e: (e[0], e[1])):
+        digest.update(f"{sport}:{game_id}:{game_entry['timestamp'].isoformat()};".encode())
+    for value in extra:
+        digest.update(f"|{value}".encode())
+    return digest.hexdigest()
+
+def _cached_json_response(payload: dict, etag: str, status: int = 200) -> Response:
+    """JSON response with a weak ETag, 304 revalidation and gzip when the client accepts it"""
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+        response.set_etag(etag, weak=True)
+        return response
+    
+    body = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+    response = Response(body, status=status, mimetype='application/json')
+    response.set_etag(etag, weak=True)
+    response.headers['Cache-Control'] = 'no-cache'
+    response.vary.add('Accept-Encoding')
+    
+    if len(body) >= GZIP_MIN_BYTES and 'gzip' in request.accept_encodings:
+        response.set_data(gzip.compress(body, compresslevel=5))
+        response.headers['Content-Encoding'] = 'gzip'
+    
+    return response
+
+@app.route('/api/games', methods=['GET'])
+def list_games():
+    """List cached games (summary by default, ?fields= to include game data)"""
+    sport = request.args.get('sport')
+    if sport and sport not in VALID_SPORTS:
+        return jsonify({'error': f"Invalid sport '{sport}', expected one of {list(VALID_SPORTS)}"}), 400
+    
+    fields = _parse_fields(request.args.get('fields'))
+    entries = smart_cache.get_cached_games(sport)
+    
+    games = []
+    for sport_key, game_id, game_entry in entries:
+        game = _game_summary(sport_key, game_id, game_entry)
+        if fields:
+            game['data'] = _select_fields(game_entry.get('data', {}), fields)
+        games.append(game)
+    
+    payload = {
+        'total_games': len(games),
+        'sports': [sport] if sport else list(VALID_SPORTS),
+        'games': games
+    }
+    return _cached_json_response(payload, _cache_etag(entries, sport, ','.join(fields)))
+
+@app.route('/api/games/<sport>/<game_id>', methods=['GET'])
+def get_game(sport, game_id):
+    """Full (or ?fields= projected) cached data for one game"""
+    if sport not in VALID_SPORTS:
+        return jsonify({'error': f"Invalid sport '{sport}', expected one of {list(VALID_SPORTS)}"}), 400
+    
+    game_entry = smart_cache.get_cached_game(game_id, sport)
+    if not game_entry or 'data' not in game_entry:
+        return jsonify({'error': f'{sport.title()} game {game_id} is not cached'}), 404
+    
+    fields = _parse_fields(request.args.get('fields'))
+    payload = _game_summary(sport, game_id, game_entry)
+    payload['data'] = _select_fields(game_entry['data'], fields)
+    
+    return _cached_json_response(payload, _cache_etag([(sport, game_id, game_entry)], ','.join(fields)))
+
+@app.route('/api/players/<player_id>', methods=['GET'])
+def get_player(player_id):
+    """Every cached stat line for an ESPN player ID"""
+    stat_lines = smart_cache.find_player_stats(player_id)
+    if not stat_lines:
+        return jsonify({'error': f'Player {player_id} not found in cached games'}), 404
+    
+    entries = [
+        (line['sport'], line['game_id'], smart_cache.get_cached_game(line['game_id'], line['sport']))
+        for line in stat_lines
+    ]
+    entries = [entry for entry in entries if entry[2]]
+    
+    payload = {
+        'player_id': player_id,
+        'name': stat_lines[0]['player'].get('name', ''),
+        'total_stat_lines': len(stat_lines),
+        'stat_lines': stat_lines
+    }
+    return _cached_json_response(payload, _cache_etag(entries, player_id))
+
+@app.route('/api/scoreboard', methods=['GET'])
+def get_scoreboard():
+    """Scores and game status for every game on the scoreboard (refreshed every 30s, no boxscores)"""
+    sport = request.args.get('sport')
+    if sport and sport not in VALID_SPORTS:
+        return jsonify({'error': f"Invalid sport '{sport}', expected one of {list(VALID_SPORTS)}"}), 400
+    
+    sports = [sport] if sport else list(VALID_SPORTS)
+    games = []
+    timestamps = []
+    for sport_key in sports:
+        summaries = smart_cache.get_scoreboard(sport_key)
+        timestamp = smart_cache.scoreboard_cache[sport_key]['timestamp']
+        timestamps.append(timestamp.isoformat() if timestamp else '')
+        games.extend(dict(summary, sport=sport_key) for summary in summaries.values())
+    
+    payload = {
+        'sports': sports,
+        'total_games': len(games),
+        'updated_at': dict(zip(sports, timestamps)),
+        'games': games
+    }
+    return _cached_json_response(payload, _cache_etag([], 'scoreboard', *sports, *timestamps))
+
+@app.route('/api/metrics', methods=['GET'])
+def metrics():
+    """Per-stage latency histograms in the Prometheus text format"""
+    return Response(tracer.render_prometheus(), mimetype='text/plain; version=0.0.4')
+
 # API-only root route
 @app.route('/')
 def api_info():
     """API information endpoint"""
-    print(f"🔍 DEBUG: Root endpoint (/) called")
-    print(f"🔍 DEBUG: Chat session status: {chat_session is not None}")
+    logger.debug("🔍 Root endpoint (/) called")
+    logger.debug("🔍 Chat session status: %s", chat_session is not None)
     
     return jsonify({
         'service': 'NextGen Live Football Stats API',
@@ -630,7 +927,12 @@ def api_info():
             'chat': '/api/chat (POST)',
             'defensive_coach': '/api/defensive-coach (POST)',
             'stats': '/api/stats',
-            'cache_clear': '/api/cache/clear (POST)'
+            'cache_clear': '/api/cache/clear (POST)',
+            'games': '/api/games?sport=&fields=',
+            'game': '/api/games/<sport>/<game_id>?fields=',
+            'player': '/api/players/<player_id>',
+            'scoreboard': '/api/scoreboard?sport=',
+            'metrics': '/api/metrics'
         },
         'documentation': 'https://github.com/your-repo/live-data',
         'status': 'running'
@@ -638,9 +940,9 @@ def api_info():
 
 @app.errorhandler(404)
 def not_found(error):
-    print(f"🔍 DEBUG: 404 error - Endpoint not found: {request.url}")
-    print(f"🔍 DEBUG: Request method: {request.method}")
-    print(f"🔍 DEBUG: Request path: {request.path}")
+    logger.debug("🔍 404 error - Endpoint not found: %s", request.url)
+    logger.debug("🔍 Request method: %s", request.method)
+    logger.debug("🔍 Request path: %s", request.path)
     
     return jsonify({
         'error': 'Endpoint not found',
@@ -650,18 +952,18 @@ def not_found(error):
             '/api/chat',
             '/api/defensive-coach',
             '/api/stats',
-            '/api/cache/clear'
+            '/api/cache/clear',
+            '/api/games',
+            '/api/games/<sport>/<game_id>',
+            '/api/players/<player_id>',
+            '/api/scoreboard',
+            '/api/metrics'
         ]
     }), 404
 
 @app.errorhandler(500)
 def internal_error(error):
-    print(f"🔍 DEBUG: 500 internal server error: {str(error)}")
-    print(f"🔍 DEBUG: Request URL: {request.url}")
-    print(f"🔍 DEBUG: Request method: {request.method}")
-    import traceback
-    print(f"🔍 DEBUG: Full traceback:")
-    traceback.print_exc()
+    logger.error("🔍 500 internal server error: %s (%s %s)", error, request.method, request.url, exc_info=True)
     
     return jsonify({
         'error': 'Internal server error',
@@ -683,6 +985,9 @@ def main():
     # Initialize chat session
     chat_session = NextGenChatSession(openai_api_key)
     
+    # Serve games warmed from disk immediately, refresh stale sports in the background
+    smart_cache.start_background_revalidation()
+    
     print("🚀 Starting NextGen Live Football Stats API Server...")
     print("   🏈 Supports both NFL and College Football")
     print("   API available at: http://localhost:5001")
@@ -692,6 +997,11 @@ def main():
     print("     POST /api/defensive-coach - Defensive coaching analysis with coordinates")
     print("     GET  /api/stats          - System statistics")
     print("     POST /api/cache/clear    - Clear cache")
+    print("     GET  /api/games          - Cached games (read-only, no LLM)")
+    print("     GET  /api/games/<sport>/<game_id> - Single cached game")
+    print("     GET  /api/players/<player_id>     - Cached stat lines for a player")
+    print("     GET  /api/scoreboard     - Scores and game status (scoreboard only)")
+    print("     GET  /api/metrics        - Prometheus stage latency histograms")
     
     # Use PORT environment variable for deployment platforms
     port = int(os.getenv('PORT', 5001))
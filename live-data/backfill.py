@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Historical Backfill for the Smart ESPN Cache
+Crawls a season's scoreboards week by week and archives every boxscore in the
+persistent store, tagged with season and week. Archived games are never warmed
+into the memory cache; the API reads them on demand for week/season questions.
+Each finished week is checkpointed, so an interrupted run resumes where it stopped.
+
+Usage:
+    python backfill.py --sport nfl --season 2024 [--weeks 1-18] [--season-type 2] [--workers 4]
+    python backfill.py --sport college --season 2024 --season-type 3   # bowls
+"""
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional, Any
+
+from cache_store import CacheBackend, create_default_store, extract_game_metadata
+from col_full_test import scrape_comprehensive_boxscore, scrape_scoreboard
+from nfl_scraper import scrape_comprehensive_nfl_boxscore, scrape_nfl_scoreboard
+from espn_http import espn_trigger, circuit_breaker, load_accounting
+from tracing import span
+
+# ESPN season types: 1 preseason, 2 regular season, 3 postseason
+REGULAR_SEASON = 2
+DEFAULT_WEEKS = {
+    'nfl': {1: range(1, 5), 2: range(1, 19), 3: range(1, 6)},
+    'college': {2: range(1, 16), 3: range(1, 2)}
+}
+
+def parse_weeks(spec: str) -> List[int]:
+    """'1-5,8,10-12' -> [1, 2, 3, 4, 5, 8, 10, 11, 12]"""
+    weeks = set()
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        if '-' in part:
+            first, last = part.split('-', 1)
+            weeks.update(range(int(first), int(last) + 1))
+        else:
+            weeks.add(int(part))
+    return sorted(weeks)
+
+def checkpoint_job(sport: str, season: int, season_type: int) -> str:
+    return f"{sport}:{season}:{season_type}"
+
+def _archive_game(store: CacheBackend, sport: str, game_id: str, season: int, season_type: int, week: int) -> bool:
+    """Scrape one boxscore (on a worker thread) and write it to the archive"""
+    with espn_trigger('backfill'):
+        if sport == 'nfl':
+            game_data = scrape_comprehensive_nfl_boxscore(game_id)
+        else:
+            game_data = scrape_comprehensive_boxscore(game_id)
+
+    if not game_data:
+        return False
+
+    try:
+        store.save_archived_game(sport, game_id, season, season_type, week, {
+            'data': game_data,
+            'timestamp': datetime.now(),
+            'metadata': extract_game_metadata(game_data)
+        })
+        return True
+    except Exception as e:
+        print(f"⚠️  Error archiving {sport} game {game_id}: {e}")
+        return False
+
+def backfill_week(store: CacheBackend, pool: ThreadPoolExecutor, sport: str, season: int,
+                  season_type: int, week: int) -> Dict[str, Any]:
+    """Archive every game on one week's scoreboard; checkpoints the week only if nothing failed"""
+    with span('backfill.week', sport=sport, season=season, season_type=season_type, week=week) as week_span:
+        with espn_trigger('backfill'):
+            if sport == 'nfl':
+                scoreboard = scrape_nfl_scoreboard(week=week, season=season, season_type=season_type)
+            else:
+                scoreboard = scrape_scoreboard(week=week, season=season, season_type=season_type)
+
+        game_ids = scoreboard['game_ids']
+        already_archived = store.archived_game_ids(sport, season, season_type, week)
+        pending = [game_id for game_id in game_ids if game_id not in already_archived]
+
+        results = list(pool.map(
+            lambda game_id: _archive_game(store, sport, game_id, season, season_type, week),
+            pending
+        ))
+        failed = [game_id for game_id, ok in zip(pending, results) if not ok]
+        week_span.set(games=len(game_ids), skipped=len(already_archived), failed=len(failed))
+
+    # An empty scoreboard may be a fetch error rather than a bye week, so it is retried next run
+    complete = bool(game_ids) and not failed
+    if complete:
+        store.save_checkpoint(checkpoint_job(sport, season, season_type), f"week:{week}", len(game_ids))
+
+    return {
+        'week': week,
+        'games': len(game_ids),
+        'archived': len(pending) - len(failed),
+        'skipped': len(game_ids) - len(pending),
+        'failed': failed,
+        'complete': complete
+    }
+
+def backfill_season(store: CacheBackend, sport: str, season: int, season_type: int = REGULAR_SEASON,
+                    weeks: Optional[List[int]] = None, workers: int = 4, force: bool = False) -> Dict[str, Any]:
+    """
+    Archive a whole season (or the given weeks) into the store.
+    Weeks already checkpointed are skipped unless force=True; games are fetched by
+    `workers` threads, all paced by the shared ESPN rate limiter.
+    """
+    if weeks is None:
+        weeks = list(DEFAULT_WEEKS[sport].get(season_type, []))
+
+    done = set() if force else store.load_checkpoints(checkpoint_job(sport, season, season_type))
+    todo = [week for week in weeks if f"week:{week}" not in done]
+    print(f"📚 Backfilling {sport} {season} (season type {season_type}): "
+          f"{len(todo)} weeks to crawl, {len(weeks) - len(todo)} already checkpointed")
+
+    start = time.perf_counter()
+    week_results = []
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix='backfill') as pool:
+        for week in todo:
+            if circuit_breaker.is_open():
+                print(f"🚧 ESPN circuit open - stopping; rerun to resume from week {week}")
+                break
+
+            result = backfill_week(store, pool, sport, season, season_type, week)
+            week_results.append(result)
+            status = "✅" if result['complete'] else "⚠️ "
+            print(f"{status} Week {week}: {result['games']} games, {result['archived']} archived, "
+                  f"{result['skipped']} already stored, {len(result['failed'])} failed")
+
+    return {
+        'sport': sport,
+        'season': season,
+        'season_type': season_type,
+        'weeks_requested': len(weeks),
+        'weeks_checkpointed_before': len(weeks) - len(todo),
+        'weeks': week_results,
+        'games_archived': sum(r['archived'] for r in week_results),
+        'elapsed_seconds': round(time.perf_counter() - start, 2)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sport', choices=['college', 'nfl'], required=True)
+    parser.add_argument('--season', type=int, required=True, help='Season year (e.g. 2024 for the 2024-25 season)')
+    parser.add_argument('--season-type', type=int, default=REGULAR_SEASON, help='1 preseason, 2 regular season, 3 postseason')
+    parser.add_argument('--weeks', help="Weeks to crawl, e.g. '1-5,8' (default: the whole season type)")
+    parser.add_argument('--workers', type=int, default=4, help='Concurrent boxscore fetches')
+    parser.add_argument('--force', action='store_true', help='Ignore checkpoints and re-crawl every week')
+    args = parser.parse_args()
+
+    store = create_default_store()
+    if store is None:
+        print("❌ Backfill needs a persistent store - set ESPN_CACHE_DB to a database path")
+        sys.exit(1)
+
+    weeks = parse_weeks(args.weeks) if args.weeks else None
+    summary = backfill_season(store, args.sport, args.season, args.season_type, weeks, args.workers, args.force)
+
+    espn_load = load_accounting.summary().get(args.sport, {}).get('backfill', {})
+    print(f"\n📈 Archived {summary['games_archived']} {args.sport} games in {summary['elapsed_seconds']}s "
+          f"({espn_load.get('requests', 0)} ESPN requests, {espn_load.get('bytes', 0) / 1e6:.1f} MB)")
+    incomplete = [r['week'] for r in summary['weeks'] if not r['complete']]
+    if incomplete:
+        print(f"⚠️  Weeks not checkpointed (rerun to retry): {incomplete}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,456 @@
+#!/usr/bin/env python3
+"""
+Persistent Cache Store for the Smart ESPN Cache Manager
+Pluggable backend interface plus an SQLite implementation that doubles as a
+shared cache (WAL mode + refresh leases) when several API workers run side by side
+"""
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, List, Optional, Any, Set, Tuple
+
+DEFAULT_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'espn_cache.db')
+
+def _timestamp_str(timestamp: datetime) -> str:
+    """Fixed-width ISO timestamp so stored values compare correctly as strings"""
+    return timestamp.isoformat(timespec='microseconds')
+
+def extract_game_metadata(game_data: Dict) -> Dict[str, Any]:
+    """Extract searchable metadata (teams, players, status) from scraped game data"""
+    metadata = {
+        'teams': [],
+        'players': [],
+        'game_id': game_data.get('game_id', ''),
+        'status': {}
+    }
+    
+    try:
+        # Extract teams from quarter_scores (most reliable)
+        game_info = game_data.get('game_info', {})
+        quarter_scores = game_info.get('quarter_scores', {})
+        if quarter_scores:
+            metadata['teams'] = list(quarter_scores.keys())
+        
+        # Extract game status
+        game_status = game_info.get('game_status', {})
+        if game_status:
+            metadata['status'] = {
+                'quarter': game_status.get('quarter', ''),
+                'time_remaining': game_status.get('time_remaining', '')
+            }
+        
+        # Extract all players from team stats
+        teams = game_data.get('teams', {})
+        all_players = []
+        
+        all_player_ids = []
+        
+        for team_name, team_data in teams.items():
+            # Check all stat categories (passing, rushing, receiving, etc.)
+            for stat_category, stat_data in team_data.items():
+                if isinstance(stat_data, dict) and 'players' in stat_data:
+                    players = stat_data['players']
+                    
+                    for player in players:
+                        player_name = player.get('name', '').strip()
+                        if player_name and player_name not in all_players:
+                            all_players.append(player_name)
+                        player_id = player.get('player_id')
+                        if player_id and player_id not in all_player_ids:
+                            all_player_ids.append(player_id)
+        
+        metadata['players'] = all_players
+        metadata['player_ids'] = all_player_ids
+        
+    except Exception as e:
+        print(f"⚠️  Error extracting metadata: {e}")
+    
+    return metadata
+
+class CacheBackend(ABC):
+    """
+    Storage interface behind SmartESPNCacheManager.
+    Backends hold the same {sport: {game_id: entry}} shape as the memory cache.
+    Shared backends (visible to other processes) also implement leases so only
+    one worker scrapes a given sport or game at a time.
+    """
+
+    shared = False
+
+    @abstractmethod
+    def save_game(self, sport: str, game_id: str, game_entry: Dict[str, Any]):
+        """Write (or overwrite) a single cached game"""
+
+    @abstractmethod
+    def delete_game(self, sport: str, game_id: str):
+        """Drop a single cached game"""
+
+    @abstractmethod
+    def save_dataset(self, sport: str, timestamp: Optional[datetime], game_ids: Set[str]):
+        """Record the last full refresh of a sport"""
+
+    @abstractmethod
+    def load_games(self, sport: str = None, after_version: Optional[int] = None) -> Dict[str, Dict[str, Dict]]:
+        """Load stored games as {sport: {game_id: entry}}, optionally only those written after a sequence number"""
+
+    @abstractmethod
+    def latest_version(self) -> int:
+        """Sequence number of the newest game write (0 before any)"""
+
+    @abstractmethod
+    def load_datasets(self) -> Dict[str, Tuple[Optional[datetime], Set[str]]]:
+        """Load full refresh state as {sport: (timestamp, game_ids)}"""
+
+    @abstractmethod
+    def clear(self, sport: str = None):
+        """Drop stored games and refresh state for one sport, or everything"""
+
+    @abstractmethod
+    def save_archived_game(self, sport: str, game_id: str, season: int, season_type: int, week: int,
+                           game_entry: Dict[str, Any]):
+        """Write (or overwrite) a historical game"""
+
+    @abstractmethod
+    def archived_game_ids(self, sport: str, season: int, season_type: int, week: int) -> Set[str]:
+        """IDs of the archived games for one week"""
+
+    @abstractmethod
+    def load_archived_games(self, sport: str = None, season: int = None, week: int = None,
+                            game_ids: List[str] = None, include_data: bool = True,
+                            season_type: int = None) -> Dict[str, Dict[str, Dict]]:
+        """Load archived games as {sport: {game_id: entry}}, filtered by season, season type, week or IDs"""
+
+    @abstractmethod
+    def save_checkpoint(self, job: str, unit: str, games: int):
+        """Mark one unit of a backfill job as done"""
+
+    @abstractmethod
+    def load_checkpoints(self, job: str) -> Set[str]:
+        """Units of a backfill job already done"""
+
+    def acquire_lease(self, name: str, ttl_seconds: float) -> bool:
+        """Try to become the only worker doing `name`; private backends always succeed"""
+        return True
+
+    def release_lease(self, name: str):
+        pass
+
+class SQLiteCacheStore(CacheBackend):
+    """
+    Durable, multi-process copy of the smart cache:
+    1. One row per cached game (data, timestamp, metadata) stamped with a store-wide
+       write sequence, so other workers can sync by sequence instead of wall clock
+    2. One row per sport for the last full refresh (timestamp, game IDs)
+    3. Leases with an owner and expiry so workers can elect a refresher
+    4. An archive of historical games tagged with season/week, written by backfill.py
+       and never warmed into memory, plus the backfill's per-week checkpoints
+    WAL mode lets every worker keep reading while one of them writes.
+    """
+
+    shared = True
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH):
+        self.db_path = db_path
+        self.owner_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, timeout=10, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._init_schema()
+
+    def _init_schema(self):
+        with self._lock, self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS games (
+                    sport TEXT NOT NULL,
+                    game_id TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    metadata TEXT NOT NULL,
+                    timestamp TEXT NOT NULL,
+                    PRIMARY KEY (sport, game_id)
+                )
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS datasets (
+                    sport TEXT PRIMARY KEY,
+                    timestamp TEXT,
+                    game_ids TEXT NOT NULL
+                )
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS leases (
+                    name TEXT PRIMARY KEY,
+                    owner TEXT NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS archive_games (
+                    sport TEXT NOT NULL,
+                    game_id TEXT NOT NULL,
+                    season INTEGER NOT NULL,
+                    season_type INTEGER NOT NULL,
+                    week INTEGER NOT NULL,
+                    data TEXT NOT NULL,
+                    metadata TEXT NOT NULL,
+                    timestamp TEXT NOT NULL,
+                    PRIMARY KEY (sport, game_id)
+                )
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS backfill_checkpoints (
+                    job TEXT NOT NULL,
+                    unit TEXT NOT NULL,
+                    games INTEGER NOT NULL,
+                    completed_at TEXT NOT NULL,
+                    PRIMARY KEY (job, unit)
+                )
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS sequences (
+                    name TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL
+                )
+            """)
+            # Stores created before write sequences existed get the column added in place
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(games)")}
+            if 'version' not in columns:
+                self._conn.execute("ALTER TABLE games ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS games_by_timestamp ON games (sport, timestamp)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS games_by_version ON games (sport, version)")
+            self._conn.execute("DROP INDEX IF EXISTS archive_by_week")
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS archive_by_season_week ON archive_games (sport, season, season_type, week)"
+            )
+
+    def save_game(self, sport: str, game_id: str, game_entry: Dict[str, Any]):
+        """
+        Write (or overwrite) a single cached game. The row gets the next write sequence
+        number inside the same write transaction; SQLite serialises writers, so sequence
+        order is commit order and readers never see a lower number appear later.
+        """
+        row = (
+            sport,
+            game_id,
+            json.dumps(game_entry['data'], separators=(',', ':')),
+            json.dumps(game_entry.get('metadata', {}), separators=(',', ':')),
+            _timestamp_str(game_entry['timestamp'])
+        )
+        with self._lock:
+            try:
+                self._conn.execute("BEGIN IMMEDIATE")
+                self._conn.execute(
+                    "INSERT INTO sequences (name, value) VALUES ('games', 1) "
+                    "ON CONFLICT(name) DO UPDATE SET value = value + 1"
+                )
+                (version,) = self._conn.execute("SELECT value FROM sequences WHERE name = 'games'").fetchone()
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO games (sport, game_id, data, metadata, timestamp, version) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    row + (version,)
+                )
+                self._conn.execute("COMMIT")
+            except sqlite3.Error:
+                if self._conn.in_transaction:
+                    self._conn.execute("ROLLBACK")
+                raise
+
+    def delete_game(self, sport: str, game_id: str):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM games WHERE sport = ? AND game_id = ?", (sport, game_id))
+
+    def save_dataset(self, sport: str, timestamp: Optional[datetime], game_ids: Set[str]):
+        """Record the outcome of a full refresh for a sport"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO datasets (sport, timestamp, game_ids) VALUES (?, ?, ?)",
+                (sport, _timestamp_str(timestamp) if timestamp else None, json.dumps(sorted(game_ids)))
+            )
+
+    def load_games(self, sport: str = None, after_version: Optional[int] = None) -> Dict[str, Dict[str, Dict]]:
+        """Load stored games as {sport: {game_id: cache entry}}, optionally only those written after a sequence number"""
+        query = "SELECT sport, game_id, data, metadata, timestamp FROM games WHERE 1 = 1"
+        params = []
+        if sport:
+            query += " AND sport = ?"
+            params.append(sport)
+        if after_version is not None:
+            query += " AND version > ?"
+            params.append(after_version)
+
+        games: Dict[str, Dict[str, Dict]] = {}
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+
+        for sport, game_id, data, metadata, timestamp in rows:
+            games.setdefault(sport, {})[game_id] = {
+                'data': json.loads(data),
+                'timestamp': datetime.fromisoformat(timestamp),
+                'metadata': json.loads(metadata)
+            }
+        return games
+
+    def latest_version(self) -> int:
+        """Sequence number of the newest committed game write (0 before any)"""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM sequences WHERE name = 'games'").fetchone()
+        return row[0] if row else 0
+
+    def load_datasets(self) -> Dict[str, Tuple[Optional[datetime], Set[str]]]:
+        """Load full refresh state as {sport: (timestamp, game_ids)}"""
+        with self._lock:
+            rows = self._conn.execute("SELECT sport, timestamp, game_ids FROM datasets").fetchall()
+
+        return {
+            sport: (datetime.fromisoformat(timestamp) if timestamp else None, set(json.loads(game_ids)))
+            for sport, timestamp, game_ids in rows
+        }
+
+    def clear(self, sport: str = None):
+        """Drop stored games and refresh state for one sport, or everything"""
+        with self._lock, self._conn:
+            if sport:
+                self._conn.execute("DELETE FROM games WHERE sport = ?", (sport,))
+                self._conn.execute("DELETE FROM datasets WHERE sport = ?", (sport,))
+            else:
+                self._conn.execute("DELETE FROM games")
+                self._conn.execute("DELETE FROM datasets")
+
+    def save_archived_game(self, sport: str, game_id: str, season: int, season_type: int, week: int,
+                           game_entry: Dict[str, Any]):
+        """Write (or overwrite) a historical game; archived games are only read on demand"""
+        row = (
+            sport,
+            game_id,
+            season,
+            season_type,
+            week,
+            json.dumps(game_entry['data'], separators=(',', ':')),
+            json.dumps(game_entry.get('metadata', {}), separators=(',', ':')),
+            _timestamp_str(game_entry['timestamp'])
+        )
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO archive_games "
+                "(sport, game_id, season, season_type, week, data, metadata, timestamp) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                row
+            )
+
+    def archived_game_ids(self, sport: str, season: int, season_type: int, week: int) -> Set[str]:
+        """IDs already archived for one scoreboard week (lets a backfill skip them on resume)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT game_id FROM archive_games WHERE sport = ? AND season = ? AND season_type = ? AND week = ?",
+                (sport, season, season_type, week)
+            ).fetchall()
+        return {game_id for (game_id,) in rows}
+
+    def load_archived_games(self, sport: str = None, season: int = None, week: int = None,
+                            game_ids: List[str] = None, include_data: bool = True,
+                            season_type: int = None) -> Dict[str, Dict[str, Dict]]:
+        """
+        Load archived games as {sport: {game_id: entry}} where entries also carry season,
+        season_type and week. Week numbers repeat across season types, so week lookups
+        should pass season_type too. include_data=False reads metadata only (for searching).
+        """
+        if game_ids is not None and not game_ids:
+            return {}
+
+        columns = "sport, game_id, season, season_type, week, metadata, timestamp"
+        if include_data:
+            columns += ", data"
+        query = f"SELECT {columns} FROM archive_games WHERE 1 = 1"
+        params = []
+        if sport:
+            query += " AND sport = ?"
+            params.append(sport)
+        if season is not None:
+            query += " AND season = ?"
+            params.append(season)
+        if season_type is not None:
+            query += " AND season_type = ?"
+            params.append(season_type)
+        if week is not None:
+            query += " AND week = ?"
+            params.append(week)
+        if game_ids is not None:
+            query += f" AND game_id IN ({', '.join('?' for _ in game_ids)})"
+            params.extend(game_ids)
+        query += " ORDER BY season DESC, season_type DESC, week DESC"
+
+        games: Dict[str, Dict[str, Dict]] = {}
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+
+        for row in rows:
+            sport, game_id, season, season_type, week, metadata, timestamp = row[:7]
+            entry = {
+                'season': season,
+                'season_type': season_type,
+                'week': week,
+                'timestamp': datetime.fromisoformat(timestamp),
+                'metadata': json.loads(metadata)
+            }
+            if include_data:
+                entry['data'] = json.loads(row[7])
+            games.setdefault(sport, {})[game_id] = entry
+        return games
+
+    def save_checkpoint(self, job: str, unit: str, games: int):
+        """Mark one unit of a backfill job (e.g. a scoreboard week) as complete"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO backfill_checkpoints (job, unit, games, completed_at) VALUES (?, ?, ?, ?)",
+                (job, unit, games, _timestamp_str(datetime.now()))
+            )
+
+    def load_checkpoints(self, job: str) -> Set[str]:
+        with self._lock:
+            rows = self._conn.execute("SELECT unit FROM backfill_checkpoints WHERE job = ?", (job,)).fetchall()
+        return {unit for (unit,) in rows}
+
+    def acquire_lease(self, name: str, ttl_seconds: float) -> bool:
+        """Atomically take (or extend) a lease unless another live owner holds it"""
+        now = time.time()
+        with self._lock:
+            try:
+                self._conn.execute("BEGIN IMMEDIATE")
+                row = self._conn.execute("SELECT owner, expires_at FROM leases WHERE name = ?", (name,)).fetchone()
+                if row and row[0] != self.owner_id and row[1] > now:
+                    self._conn.execute("ROLLBACK")
+                    return False
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO leases (name, owner, expires_at) VALUES (?, ?, ?)",
+                    (name, self.owner_id, now + ttl_seconds)
+                )
+                self._conn.execute("COMMIT")
+                return True
+            except sqlite3.Error:
+                if self._conn.in_transaction:
+                    self._conn.execute("ROLLBACK")
+                raise
+
+    def release_lease(self, name: str):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM leases WHERE name = ? AND owner = ?", (name, self.owner_id))
+
+def create_default_store() -> Optional[CacheBackend]:
+    """
+    Build the store configured by ESPN_CACHE_DB.
+    Unset uses espn_cache.db next to this file; 'none' (or empty) keeps the cache memory-only.
+    """
+    db_path = os.getenv('ESPN_CACHE_DB', DEFAULT_DB_PATH)
+    if not db_path or db_path.lower() == 'none':
+        return None
+
+    try:
+        return SQLiteCacheStore(db_path)
+    except sqlite3.Error as e:
+        print(f"⚠️  Could not open persistent cache at {db_path}: {e} - running memory-only")
+        return None
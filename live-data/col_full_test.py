@@ -1,9 +1,16 @@
 import requests
 from bs4 import BeautifulSoup
 import json
+import os
 import re
 from datetime import datetime
-import time
+
+from espn_http import fetch, record_parse
+from espn_scoreboard import league_scoreboard_url, extract_scoreboard_game_ids, extract_scoreboard_summaries
+from tracing import span
+
+# Overridable so scrapes can be replayed from a local fixture server
+ESPN_BASE_URL = os.getenv('ESPN_BASE_URL', 'https://www.espn.com')
 
 def scrape_all_boxscores():
     """Main function to scrape all games and their detailed box scores"""
@@ -29,12 +36,10 @@ def scrape_all_boxscores():
     for i, game_id in enumerate(game_ids, 1):
         print(f"Scraping game {i}/{len(game_ids)}: {game_id}")
         
+        # Pacing comes from the shared ESPN rate limiter (espn_http)
         game_data = scrape_comprehensive_boxscore(game_id)
         if game_data:
             all_games_data['games'][game_id] = game_data
-        
-        # Small delay to be respectful
-        time.sleep(1)
     
     # Step 3: Save all data
     filename = f"all_college_football_games_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
@@ -42,64 +47,77 @@ def scrape_all_boxscores():
     
     return all_games_data
 
-def scrape_game_ids_from_scoreboard(url="https://www.espn.com/college-football/scoreboard"):
-    """Extract all game IDs from the scoreboard"""
+def scrape_game_ids_from_scoreboard(url=None, week=None, season=None, season_type=None, date=None):
+    """Extract all game IDs from the scoreboard (current, or a given week/season/date)"""
+    return scrape_scoreboard(url, week=week, season=season, season_type=season_type, date=date)['game_ids']
+
+def scoreboard_url(week=None, season=None, season_type=None, date=None):
+    """Scoreboard URL, addressed by week (+ season, season type) or by date (YYYYMMDD)"""
+    return league_scoreboard_url(ESPN_BASE_URL, 'college-football', week, season, season_type, date)
+
+def scrape_scoreboard(url=None, week=None, season=None, season_type=None, date=None):
+    """Fetch the scoreboard once and return its game IDs plus a score/status summary per game"""
     
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    }
+    if url is None:
+        url = scoreboard_url(week, season, season_type, date)
     
     try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Find all box score links
-        box_score_links = soup.find_all('a', href=re.compile(r'/college-football/boxscore/_/gameId/\d+'))
-        
-        game_ids = []
-        for link in box_score_links:
-            href = link.get('href')
-            game_id = extract_game_id(href)
-            if game_id and game_id not in game_ids:
-                game_ids.append(game_id)
-        
-        return game_ids
+        with span('espn.scoreboard_fetch', sport='college') as fetch_span:
+            html = fetch(url, 'college')
+            fetch_span.set(bytes=len(html))
+        with span('espn.scoreboard_parse', sport='college') as parse_span:
+            scoreboard = parse_scoreboard(html)
+        record_parse('college', parse_span.duration)
+        return scoreboard
         
     except requests.RequestException as e:
         print(f"Error fetching scoreboard: {e}")
-        return []
+        return {'game_ids': [], 'summaries': {}}
 
-def extract_game_id(href):
-    """Extract game ID from href"""
-    match = re.search(r'gameId/(\d+)', href)
-    return match.group(1) if match else None
+def parse_scoreboard(html):
+    """Parse scoreboard HTML into game IDs and per-game summaries"""
+    
+    soup = BeautifulSoup(html, 'html.parser')
+    
+    return {
+        'game_ids': extract_scoreboard_game_ids(soup, 'college-football'),
+        'summaries': extract_scoreboard_summaries(soup)
+    }
+
+def parse_game_ids_from_scoreboard(html):
+    """Extract game IDs from scoreboard HTML"""
+    
+    return extract_scoreboard_game_ids(BeautifulSoup(html, 'html.parser'), 'college-football')
 
 def scrape_comprehensive_boxscore(game_id):
     """Scrape comprehensive box score for a single game"""
     
-    url = f"https://www.espn.com/college-football/boxscore/_/gameId/{game_id}"
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    }
+    url = f"{ESPN_BASE_URL}/college-football/boxscore/_/gameId/{game_id}"
     
     try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        game_data = {
-            'game_id': game_id,
-            'game_info': scrape_game_info(soup),
-            'teams': scrape_detailed_boxscore(soup)
-        }
-        
+        with span('espn.game_fetch', sport='college', game_id=game_id) as fetch_span:
+            html = fetch(url, 'college')
+            fetch_span.set(bytes=len(html))
+        with span('espn.game_parse', sport='college', game_id=game_id) as parse_span:
+            game_data = parse_comprehensive_boxscore(game_id, html)
+        record_parse('college', parse_span.duration)
         return game_data
         
     except requests.RequestException as e:
         print(f"Error fetching game {game_id}: {e}")
         return None
 
+def parse_comprehensive_boxscore(game_id, html):
+    """Parse box score HTML into game data"""
+    
+    soup = BeautifulSoup(html, 'html.parser')
+    
+    return {
+        'game_id': game_id,
+        'game_info': scrape_game_info(soup),
+        'teams': scrape_detailed_boxscore(soup)
+    }
+
 def scrape_game_info(soup):
     """Extract game information from Gamestrip__Container"""
     
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Local Formation Analysis for the Defensive Coach
+Runs the field mapper's coverage classifier (defensive_coverage.py) on the
+posted player coordinates before the LLM is called, so the prompt carries a compact,
+pre-computed read of the formation - shell, man/zone signals, DB leverage, deep-safety
+depths - plus a compact coordinate table (encode_play) instead of the raw mapper JSON.
+Answers are cached by formation fingerprint + normalized question, so repeated or
+near-identical formations skip the LLM entirely. Every analysed play is added to a
+formation library (formation_index.py) whose most similar past looks feed the prompt.
+"""
+import hashlib
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Tuple
+
+# The classifier is shared with the field mapper scripts in test/; numpy is its only dependency
+try:
+    from defensive_coverage import (
+        classify_coverage_v2, distance_matrix, nearest_receivers, player_positions,
+        DEEP_ZONE_YARDS, SAFETY_POSITIONS, DB_POSITIONS, RECEIVER_POSITIONS
+    )
+    from formation_index import FormationIndex
+    COVERAGE_AVAILABLE = True
+except ImportError:
+    COVERAGE_AVAILABLE = False
+
+OFFENSIVE_POSITIONS = ('QB', 'RB', 'WR', 'C', 'OG', 'OT', 'FB', 'TE')
+
+# Formations whose players land in the same grid cells share cached coaching answers
+FINGERPRINT_GRID_YARDS = float(os.getenv('COACH_FINGERPRINT_GRID_YARDS', '1.0'))
+COACH_CACHE_MAX_ENTRIES = int(os.getenv('COACH_CACHE_MAX_ENTRIES', '256'))
+COACH_CACHE_TTL_SECONDS = float(os.getenv('COACH_CACHE_TTL_SECONDS', '86400'))
+
+# Library of analysed plays, kept in the user's data directory rather than the source tree
+# ('none' keeps it in memory only); the oldest plays are dropped past the cap
+DEFAULT_FORMATION_LIBRARY = os.path.join(
+    os.getenv('XDG_DATA_HOME') or os.path.join(os.path.expanduser('~'), '.local', 'share'),
+    'nextgen-live-data', 'formation_library.jsonl'
+)
+FORMATION_LIBRARY_PATH = os.getenv('FORMATION_LIBRARY', DEFAULT_FORMATION_LIBRARY)
+FORMATION_LIBRARY_MAX_PLAYS = int(os.getenv('FORMATION_LIBRARY_MAX_PLAYS', '50000'))
+SIMILAR_PLAYS_K = int(os.getenv('COACH_SIMILAR_PLAYS', '3'))
+# The only library fields that reach prompts and responses: derived from coordinates,
+# never user text (libraries written by older versions may also hold the question asked)
+SIMILAR_PLAY_FIELDS = ('play_id', 'distance', 'shell', 'primary_guess', 'source')
+
+def _yards(value: float) -> float:
+    """Round to 0.1 yd without producing -0.0"""
+    return round(value, 1) + 0.0
+
+def _coordinate(coordinates: Dict, key: str, camel_key: str) -> Optional[float]:
+    value = coordinates.get(key, coordinates.get(camel_key))
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return float(value)
+
+def normalize_players(player_coordinates: Dict) -> List[Dict[str, Any]]:
+    """
+    Players from either payload shape the endpoint receives - field mapper output
+    (team, x_yards/y_yards) or hand-written JSON (xYards/yYards, no team) - as
+    {position, team, coordinates: {x_yards, y_yards}}. Players without usable
+    coordinates are dropped; a missing team is inferred from the position.
+    Plays filmed from the other end of the field are turned round (see _orient).
+    """
+    players = player_coordinates.get('players') if isinstance(player_coordinates, dict) else None
+    if not isinstance(players, list):
+        return []
+
+    normalized = []
+    for player in players:
+        if not isinstance(player, dict) or not isinstance(player.get('coordinates'), dict):
+            continue
+        x_yards = _coordinate(player['coordinates'], 'x_yards', 'xYards')
+        y_yards = _coordinate(player['coordinates'], 'y_yards', 'yYards')
+        if x_yards is None or y_yards is None:
+            continue
+
+        position = str(player.get('position', '')).upper()
+        team = player.get('team') or ('offense' if position in OFFENSIVE_POSITIONS else 'defense')
+        normalized.append({
+            'position': position,
+            'team': team,
+            'coordinates': {'x_yards': x_yards, 'y_yards': y_yards}
+        })
+    return _orient(normalized)
+
+def _orient(players: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Put the defense on the +x side of the line, as the field mapper's coordinate system
+    specifies. A look filmed from the other end arrives with the defense at -x; turning
+    it round (x, y -> -x, -y) gives the same look as seen from the usual end - left and
+    right from the offense's point of view are unchanged - so the analysis, the prompt
+    and the cache key all see one orientation.
+    """
+    defense_x = [p['coordinates']['x_yards'] for p in players if p['team'] == 'defense']
+    offense_x = [p['coordinates']['x_yards'] for p in players if p['team'] == 'offense']
+    defense_depth = sum(defense_x) / len(defense_x) if defense_x else 0.0
+    offense_depth = sum(offense_x) / len(offense_x) if offense_x else 0.0
+    if defense_depth >= offense_depth:
+        return players
+    for p in players:
+        p['coordinates'] = {'x_yards': -p['coordinates']['x_yards'] + 0.0, 'y_yards': -p['coordinates']['y_yards'] + 0.0}
+    return players
+
+def _db_leverage(players: List[Dict]) -> List[Dict[str, Any]]:
+    """Each DB's nearest receiver, cushion (yards off) and inside/outside leverage"""
+    dbs = [p for p in players if p['team'] == 'defense' and p['position'] in DB_POSITIONS]
+    receivers = [p for p in players if p['team'] == 'offense' and p['position'] in RECEIVER_POSITIONS]
+    if not dbs or not receivers:
+        return []
+
+    db_xy = player_positions(dbs)
+    receiver_xy = player_positions(receivers)
+    nearest, distances = nearest_receivers(distance_matrix(db_xy, receiver_xy))
+
+    leverage = []
+    for db, (db_x, db_y), receiver, distance in zip(dbs, db_xy.tolist(), nearest.tolist(), distances.tolist()):
+        receiver_x, receiver_y = receiver_xy[receiver].tolist()
+        leverage.append({
+            'position': db['position'],
+            'depth': _yards(db_x),
+            'receiver': receivers[receiver]['position'],
+            'distance': _yards(distance),
+            'cushion': _yards(db_x - receiver_x),
+            # y is measured from the middle of the field, so inside means nearer to y=0
+            'leverage': 'inside' if abs(db_y) < abs(receiver_y) else 'outside'
+        })
+    return leverage
+
+def analyze_formation(players: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Coverage read for normalize_players output, or None when it cannot be analysed locally"""
+    if not COVERAGE_AVAILABLE or not players:
+        return None
+
+    coverage = classify_coverage_v2({'players': players})
+    safeties = sorted(
+        (p for p in players if p['team'] == 'defense' and p['position'] in SAFETY_POSITIONS),
+        key=lambda p: -p['coordinates']['x_yards']
+    )
+    return {
+        'coverage': coverage,
+        'safety_depths': [
+            {'position': s['position'], 'depth': _yards(s['coordinates']['x_yards']),
+             'width': _yards(s['coordinates']['y_yards']),
+             'deep': s['coordinates']['x_yards'] >= DEEP_ZONE_YARDS}
+            for s in safeties
+        ],
+        'db_leverage': _db_leverage(players),
+        'offense_count': sum(p['team'] == 'offense' for p in players),
+        'defense_count': sum(p['team'] == 'defense' for p in players)
+    }
+
+def format_analysis(analysis: Dict[str, Any]) -> str:
+    """Prompt text for an analyze_formation result"""
+    coverage = analysis['coverage']
+    signals = coverage['analysis']
+    lines = [
+        f"Shell: {coverage['shell']} (deep safeties: {signals['deep_safeties_found']})",
+        f"Likely coverage: {coverage['primary_guess']} (alternative: {coverage['secondary_guess']})",
+        f"Man signals: {signals['man_coverage_signals']}, zone signals: {signals['zone_coverage_signals']}",
+        f"Average LB depth: {signals['avg_linebacker_depth_yards']} yds",
+        f"Players: {analysis['offense_count']} offense, {analysis['defense_count']} defense"
+    ]
+    for s in analysis['safety_depths']:
+        lines.append(f"Safety {s['position']}: {s['depth']} yds deep, {s['width']} wide"
+                     f"{' (deep zone)' if s['deep'] else ''}")
+    for db in analysis['db_leverage']:
+        lines.append(f"{db['position']} at {db['depth']} yds: nearest {db['receiver']} {db['distance']} yds away, "
+                     f"{db['cushion']} yds cushion, {db['leverage']} leverage")
+    return '\n'.join(lines)
+
+def encode_play(players: List[Dict[str, Any]]) -> str:
+    """
+    Compact prompt encoding of normalized players: one block per team (defense first),
+    rows of 'POS x y' in yards at fixed 0.1 precision, deepest player first. Detection
+    ids, pixels, bounding boxes and confidences are left out - they don't help the model.
+    """
+    blocks = []
+    for team in ('defense', 'offense'):
+        members = [p for p in players if p['team'] == team]
+        if not members:
+            continue
+        members.sort(key=lambda p: -abs(p['coordinates']['x_yards']))
+        rows = [f"{team} (pos x y, deepest first):"]
+        rows.extend(f"{p['position']} {_yards(p['coordinates']['x_yards']):.1f} {_yards(p['coordinates']['y_yards']):.1f}"
+                    for p in members)
+        blocks.append('\n'.join(rows))
+    return '\n'.join(blocks)
+
+def formation_fingerprint(players: List[Dict[str, Any]], grid_yards: float = FINGERPRINT_GRID_YARDS) -> str:
+    """
+    Fingerprint of a formation, canonical for ordering and for the end it was filmed from:
+    1. Each player becomes (team, position, x, y) with x/y quantised to grid_yards
+       (x is already relative to the line of scrimmage, y to the field center)
+    2. Players are sorted, so detection order doesn't matter
+    3. normalize_players has already turned plays filmed from the other end round,
+       so both ends of the field give the same key
+    A left/right mirror image (y -> -y alone) deliberately keeps its own key: it is a
+    different look - the strength, leverage and width the answer describes switch
+    sides - so a cached answer for one would be wrong for the other.
+    """
+    cells = sorted((p['team'], p['position'],
+                    int(round(p['coordinates']['x_yards'] / grid_yards)),
+                    int(round(p['coordinates']['y_yards'] / grid_yards))) for p in players)
+    return hashlib.sha1(repr(cells).encode('utf-8')).hexdigest()[:16]
+
+def normalize_question(question: str) -> str:
+    """Lowercase, punctuation stripped, whitespace collapsed"""
+    return ' '.join(re.sub(r'[^a-z0-9]+', ' ', question.lower()).split())
+
+def coach_cache_key(players: List[Dict[str, Any]], question: str) -> Tuple[str, str]:
+    """(cache key, formation fingerprint) for a coaching request"""
+    fingerprint = formation_fingerprint(players)
+    return f"{fingerprint}:{normalize_question(question)}", fingerprint
+
+class CoachAnswerCache:
+    """LRU of {cache key: (stored_at, coaching result)} with a TTL and hit/miss counters; max_entries 0 disables it"""
+
+    def __init__(self, max_entries: int = COACH_CACHE_MAX_ENTRIES, ttl_seconds: float = COACH_CACHE_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: 'OrderedDict[str, Tuple[float, Dict]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def get(self, key: str) -> Optional[Dict]:
+        if not self.enabled:
+            return None
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and now - entry[0] > self.ttl_seconds:
+                del self._entries[key]
+                entry = None
+            if entry:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        return entry[1] if entry else None
+
+    def store(self, key: str, result: Dict):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = (time.time(), result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'enabled': self.enabled,
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+                'grid_yards': FINGERPRINT_GRID_YARDS
+            }
+
+# Shared by every request handled by this process
+coach_answer_cache = CoachAnswerCache()
+
+def _create_formation_index():
+    if not COVERAGE_AVAILABLE:
+        return None
+    if FORMATION_LIBRARY_PATH.lower() == 'none':
+        return FormationIndex(max_plays=FORMATION_LIBRARY_MAX_PLAYS)
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(FORMATION_LIBRARY_PATH)), exist_ok=True)
+        return FormationIndex(FORMATION_LIBRARY_PATH, max_plays=FORMATION_LIBRARY_MAX_PLAYS)
+    except OSError as e:
+        print(f"⚠️  Formation library {FORMATION_LIBRARY_PATH} unavailable ({e}) - keeping it in memory")
+        return FormationIndex(max_plays=FORMATION_LIBRARY_MAX_PLAYS)
+
+formation_index = _create_formation_index()
+
+def similar_plays(players: List[Dict[str, Any]], analysis: Dict[str, Any], fingerprint: str,
+                  k: int = SIMILAR_PLAYS_K) -> List[Dict[str, Any]]:
+    """Most similar past looks in the formation library (the play itself excluded), derived fields only"""
+    if formation_index is None or not k:
+        return []
+    plays = formation_index.query(players, analysis['coverage'], k=k, exclude=fingerprint)
+    return [{field: play[field] for field in SIMILAR_PLAY_FIELDS if field in play} for play in plays]
+
+def remember_play(players: List[Dict[str, Any]], analysis: Dict[str, Any], fingerprint: str):
+    """
+    Add an analysed coaching play to the formation library, keyed by its fingerprint.
+    The library is shared by every user, so only the formation is kept - not the question.
+    """
+    if formation_index is None:
+        return
+    formation_index.add(fingerprint, players, analysis['coverage'], meta={
+        'source': 'defensive-coach',
+        'analysed_at': time.strftime('%Y-%m-%dT%H:%M:%S')
+    })
+
+def format_similar_plays(plays: List[Dict[str, Any]]) -> str:
+    """Prompt lines for similar_plays results"""
+    lines = []
+    for i, play in enumerate(plays, 1):
+        lines.append(f"{i}. {play['shell']}, read as {play['primary_guess']} "
+                     f"(distance {play['distance']}, {play.get('source', 'library')})")
+    return '\n'.join(lines)
@@ -0,0 +1,209 @@
+import json
+import math
+import sys
+from pathlib import Path
+
+import numpy as np
+
+try:
+    from scipy.optimize import linear_sum_assignment
+except ImportError:  # optional: greedy matching is used instead
+    linear_sum_assignment = None
+
+# --- Configuration Thresholds ---
+DEEP_ZONE_YARDS = 9.0
+MAN_COVERAGE_PROXIMITY_YARDS = 6.0
+PRESS_COVERAGE_YARDS = 2.0
+SHALLOW_CORNER_YARDS = 4.0 # For differentiating Cover 2 Zone
+TAMPA_LB_DEPTH_YARDS = 6.0 # A linebacker this deep is carrying the middle hole
+
+# --- Position Groups ---
+SAFETY_POSITIONS = ("S", "FS", "SS")
+DB_POSITIONS = ("DB", "CB")
+LB_POSITIONS = ("LB", "MLB", "OLB")
+RECEIVER_POSITIONS = ("WR", "TE")
+
+def calculate_distance(p1, p2):
+    """Calculates the Euclidean distance between two players."""
+    return math.sqrt(
+        (p1['coordinates']['x_yards'] - p2['coordinates']['x_yards'])**2 +
+        (p1['coordinates']['y_yards'] - p2['coordinates']['y_yards'])**2
+    )
+
+def player_positions(players):
+    """(N, 2) array of (x_yards, y_yards) for a list of mapped players."""
+    return np.array([[p['coordinates']['x_yards'], p['coordinates']['y_yards']] for p in players],
+                    dtype=float).reshape(-1, 2)
+
+def distance_matrix(a, b):
+    """
+    Pairwise Euclidean distances between two (N, 2) / (M, 2) position arrays, shape (N, M).
+    Same arithmetic as calculate_distance, so values match it exactly.
+    """
+    delta = a[:, None, :] - b[None, :, :]
+    return np.sqrt(delta[..., 0]**2 + delta[..., 1]**2)
+
+def nearest_receivers(distances):
+    """Index of and distance to the closest receiver for every DB (row) in one pass."""
+    nearest = np.argmin(distances, axis=1)
+    return nearest, distances[np.arange(len(distances)), nearest]
+
+def match_one_to_one(distances, max_distance):
+    """
+    One receiver per DB: (db, receiver) index pairs minimising total distance,
+    keeping only pairs closer than max_distance. Hungarian assignment when scipy
+    is installed, closest-pair-first greedy otherwise.
+    """
+    if distances.size == 0:
+        return []
+
+    if linear_sum_assignment is not None:
+        rows, cols = linear_sum_assignment(distances)
+        return [(r, c) for r, c in zip(rows.tolist(), cols.tolist()) if distances[r, c] < max_distance]
+
+    pairs, used_rows, used_cols = [], set(), set()
+    for flat in np.argsort(distances, axis=None, kind='stable').tolist():
+        r, c = divmod(flat, distances.shape[1])
+        if distances[r, c] >= max_distance:
+            break
+        if r not in used_rows and c not in used_cols:
+            used_rows.add(r)
+            used_cols.add(c)
+            pairs.append((r, c))
+    return sorted(pairs)
+
+def classify_coverage_v2(play_data, one_to_one=False):
+    """
+    Classifies defensive coverage with more nuance by analyzing player alignments
+    relative to each other to infer man vs. zone indicators.
+
+    DB-to-receiver distances are computed as one matrix. By default every DB is
+    paired with its nearest receiver (two DBs may share one). With one_to_one=True
+    each receiver is covered by at most one DB (optimal assignment), DBs left
+    without a receiver in range count as zone, and the matchups are reported.
+    """
+    # --- Player Filtering ---
+    defense = [p for p in play_data.get("players", []) if p.get("team") == "defense"]
+    offense = [p for p in play_data.get("players", []) if p.get("team") == "offense"]
+
+    safeties = [p for p in defense if p.get("position") in SAFETY_POSITIONS]
+    dbs = [p for p in defense if p.get("position") in DB_POSITIONS]
+    lbs = [p for p in defense if p.get("position") in LB_POSITIONS]
+    receivers = [p for p in offense if p.get("position") in RECEIVER_POSITIONS]
+
+    # --- Core Analysis ---
+    deep_safeties = [s for s in safeties if s['coordinates']['x_yards'] >= DEEP_ZONE_YARDS]
+    num_deep_safeties = len(deep_safeties)
+
+    # 1. Analyze Man vs. Zone Indicators by pairing DBs to nearest WRs
+    man_signals = 0
+    zone_signals = 0
+    shallow_corners = 0
+    matchups = []
+    
+    # Only run this analysis if there are receivers and DBs to pair
+    if receivers and dbs:
+        db_xy = player_positions(dbs)
+        distances = distance_matrix(db_xy, player_positions(receivers))
+
+        if one_to_one:
+            pairs = match_one_to_one(distances, MAN_COVERAGE_PROXIMITY_YARDS)
+            man_signals = len(pairs)
+            matchups = [{
+                "defender": dbs[r].get("detection_id"),
+                "receiver": receivers[c].get("detection_id"),
+                "distance_yards": round(float(distances[r, c]), 2)
+            } for r, c in pairs]
+        else:
+            # Closest receiver to every DB at once
+            _, distance_to_receiver = nearest_receivers(distances)
+            man_signals = int(np.count_nonzero(distance_to_receiver < MAN_COVERAGE_PROXIMITY_YARDS))
+        zone_signals = len(dbs) - man_signals
+
+        # Check for shallow corners specifically for Cover 2 Zone diagnosis
+        shallow_corners = int(np.count_nonzero(db_xy[:, 0] < SHALLOW_CORNER_YARDS))
+
+    # 2. Analyze Linebacker Depth
+    lb_depths = [lb['coordinates']['x_yards'] for lb in lbs if 'coordinates' in lb]
+    avg_lb_depth = sum(lb_depths) / len(lb_depths) if lb_depths else 0
+
+    # --- Decision Logic ---
+    primary_guess = "Unknown"
+    secondary_guess = "None"
+    shell = "Unknown"
+
+    if num_deep_safeties == 0:
+        shell = "Zero-High"
+        primary_guess = "Cover 0 (Man Blitz)"
+        secondary_guess = "Cover 1 Robber (with a lurking LB/S)"
+
+    elif num_deep_safeties == 1:
+        shell = "Single-High"
+        if man_signals > zone_signals:
+            primary_guess = "Cover 1 (Man Free)"
+            secondary_guess = "Cover 3 (Zone)"
+        else:
+            primary_guess = "Cover 3 (Zone)"
+            secondary_guess = "Cover 1 (Man Free)"
+
+    elif num_deep_safeties == 2:
+        shell = "Two-High"
+        # Check for Tampa 2 first (deep middle LB)
+        if any(d > TAMPA_LB_DEPTH_YARDS for d in lb_depths):
+             primary_guess = "Tampa 2 (Zone)"
+             secondary_guess = "Cover 2 Zone"
+        # If DBs are playing tight man, it's likely Cover 2 Man
+        elif man_signals > zone_signals and zone_signals <= 1:
+            primary_guess = "Cover 2 Man"
+            secondary_guess = "Quarters (Man-match)"
+        # If corners are pressed shallow, they are likely playing the flats
+        elif shallow_corners >= 2:
+            primary_guess = "Cover 2 Zone"
+            secondary_guess = "Quarters (Trap)"
+        # Default two-high zone look is Quarters, the most common modern coverage
+        else:
+            primary_guess = "Cover 4 / Quarters (Zone)"
+            secondary_guess = "Cover 2 Zone"
+
+    result = {
+        "primary_guess": primary_guess,
+        "secondary_guess": secondary_guess,
+        "shell": shell,
+        "analysis": {
+            "deep_safeties_found": num_deep_safeties,
+            "man_coverage_signals": man_signals,
+            "zone_coverage_signals": zone_signals,
+            "avg_linebacker_depth_yards": round(avg_lb_depth, 2)
+        }
+    }
+    if one_to_one:
+        result["analysis"]["man_matchups"] = matchups
+    return result
+
+# --- Example Usage ---
+if __name__ == "__main__":
+    def find_play_json(cli_path=None):
+        if cli_path and Path(cli_path).exists():
+            return Path(cli_path)
+        
+        script_dir = Path(__file__).resolve().parent
+        candidates = [script_dir / "play.json", Path.cwd() / "play.json"]
+        for c in candidates:
+            if c.exists():
+                return c
+        raise FileNotFoundError(f"play.json not found in checked locations: {candidates}")
+
+    # Load play.json (either provided as CLI arg or found in candidates)
+    cli = sys.argv[1] if len(sys.argv) > 1 else None
+    try:
+        play_path = find_play_json(cli)
+    except FileNotFoundError as e:
+        print("Error:", e)
+        sys.exit(2)
+
+    with play_path.open('r', encoding='utf-8') as pf:
+        play_data = json.load(pf)
+
+    # Run analysis
+    result = classify_coverage_v2(play_data)
+    print(json.dumps(result, indent=2))
\ No newline at end of file
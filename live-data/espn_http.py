@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+"""
+Shared ESPN HTTP Layer for the NFL and College Football scrapers
+Every outbound ESPN request goes through fetch(), which:
+1. Sends conditional requests (ETag / Last-Modified) and serves 304s from a small body cache
+2. Accounts requests, bytes, 304s, errors and parse time per sport and per trigger
+   (full refresh, query-matched refresh, stale sweep, ...) with rolling-window rates
+3. Waits on a shared token bucket whose rate backs off on 429/5xx and recovers on success
+4. Trips a circuit breaker after repeated failures so callers fall back to cached data
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Optional, Any, Tuple
+
+import requests
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+REQUEST_TIMEOUT_SECONDS = 15
+BODY_CACHE_MAX_ENTRIES = 256
+DEFAULT_TRIGGER = 'direct'
+
+# Rolling windows are kept as fixed time buckets so summaries stay cheap
+WINDOW_BUCKET_SECONDS = 10
+WINDOW_BUCKETS = 30
+COUNTER_FIELDS = ('requests', 'bytes', 'not_modified', 'errors', 'throttled', 'parse_seconds')
+
+# Outbound rate: starts at ESPN_MAX_RPS, halves on 429/5xx, climbs back additively on success
+ESPN_MAX_RPS = float(os.getenv('ESPN_MAX_RPS', '5'))
+ESPN_MIN_RPS = 0.2
+ESPN_BURST = int(os.getenv('ESPN_BURST', '10'))
+RATE_RECOVERY_STEP = 0.25
+DEFAULT_BACKOFF_SECONDS = 2.0
+MAX_BACKOFF_SECONDS = 60.0
+MAX_RETRIES = 2
+
+# Circuit breaker: open after this many consecutive failures, retry one probe after the cooldown
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_COOLDOWN_SECONDS = 30.0
+
+_trigger_local = threading.local()
+
+@contextmanager
+def espn_trigger(name: str):
+    """Attribute ESPN requests made on this thread to `name` (nested triggers win)"""
+    previous = getattr(_trigger_local, 'name', None)
+    _trigger_local.name = name
+    try:
+        yield
+    finally:
+        _trigger_local.name = previous
+
+def current_trigger() -> str:
+    return getattr(_trigger_local, 'name', None) or DEFAULT_TRIGGER
+
+class RollingCounters:
+    """Lifetime totals plus per-bucket counts over the last WINDOW_BUCKETS * WINDOW_BUCKET_SECONDS"""
+
+    def __init__(self):
+        self.totals = dict.fromkeys(COUNTER_FIELDS, 0)
+        # Ring of [bucket_index, {field: value}]
+        self._buckets = [[-1, dict.fromkeys(COUNTER_FIELDS, 0)] for _ in range(WINDOW_BUCKETS)]
+
+    def add(self, now: float, **amounts):
+        index = int(now // WINDOW_BUCKET_SECONDS)
+        slot = self._buckets[index % WINDOW_BUCKETS]
+        if slot[0] != index:
+            slot[0] = index
+            slot[1] = dict.fromkeys(COUNTER_FIELDS, 0)
+        for field, amount in amounts.items():
+            self.totals[field] += amount
+            slot[1][field] += amount
+
+    def summary(self, now: float) -> Dict[str, Any]:
+        oldest = int(now // WINDOW_BUCKET_SECONDS) - WINDOW_BUCKETS + 1
+        window = dict.fromkeys(COUNTER_FIELDS, 0)
+        for index, counts in self._buckets:
+            if index >= oldest:
+                for field in COUNTER_FIELDS:
+                    window[field] += counts[field]
+
+        window_minutes = WINDOW_BUCKETS * WINDOW_BUCKET_SECONDS / 60
+        summary = {field: round(value, 4) if field == 'parse_seconds' else value for field, value in self.totals.items()}
+        summary['window'] = {
+            'minutes': window_minutes,
+            'requests_per_minute': round(window['requests'] / window_minutes, 2),
+            'bytes_per_minute': round(window['bytes'] / window_minutes),
+            'not_modified_per_minute': round(window['not_modified'] / window_minutes, 2),
+            'errors_per_minute': round(window['errors'] / window_minutes, 2),
+            'throttled_per_minute': round(window['throttled'] / window_minutes, 2),
+            'parse_seconds_per_minute': round(window['parse_seconds'] / window_minutes, 4)
+        }
+        return summary
+
+class ESPNLoadAccounting:
+    """Scrape cost per (sport, trigger), summarised for get_cache_status"""
+
+    def __init__(self):
+        self._counters: Dict[Tuple[str, str], RollingCounters] = {}
+        self._lock = threading.Lock()
+
+    def record(self, sport: str, trigger: str = None, **amounts):
+        key = (sport, trigger or current_trigger())
+        with self._lock:
+            counters = self._counters.get(key)
+            if counters is None:
+                counters = self._counters[key] = RollingCounters()
+            counters.add(time.time(), **amounts)
+
+    def summary(self) -> Dict[str, Any]:
+        """{sport: {trigger: totals + window rates, 'total': ...}}"""
+        now = time.time()
+        summary: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            for (sport, trigger), counters in sorted(self._counters.items()):
+                summary.setdefault(sport, {})[trigger] = counters.summary(now)
+
+        for sport, triggers in summary.items():
+            total = dict.fromkeys(COUNTER_FIELDS, 0)
+            for stats in triggers.values():
+                for field in COUNTER_FIELDS:
+                    total[field] += stats[field]
+            total['parse_seconds'] = round(total['parse_seconds'], 4)
+            triggers['total'] = total
+        return summary
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+
+class ConditionalBodyCache:
+    """LRU of {url: (etag, last_modified, body)} used to revalidate pages with 304s"""
+
+    def __init__(self, max_entries: int = BODY_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[str, Tuple[Optional[str], Optional[str], bytes]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def validators(self, url: str) -> Dict[str, str]:
+        with self._lock:
+            entry = self._entries.get(url)
+        if not entry:
+            return {}
+        etag, last_modified, _ = entry
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        return headers
+
+    def body(self, url: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry:
+                self._entries.move_to_end(url)
+        return entry[2] if entry else None
+
+    def store(self, url: str, response: requests.Response):
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+        with self._lock:
+            self._entries[url] = (etag, last_modified, response.content)
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+class CircuitOpenError(requests.RequestException):
+    """Raised instead of contacting ESPN while the circuit breaker is open"""
+
+class AdaptiveRateLimiter:
+    """
+    Token bucket shared by every scraper thread:
+    1. acquire() blocks until a token is available (burst up to `capacity`)
+    2. throttled() halves the rate and pauses everyone until Retry-After / backoff expires
+    3. succeeded() raises the rate additively back towards max_rate (AIMD)
+    """
+
+    def __init__(self, max_rate: float = ESPN_MAX_RPS, capacity: int = ESPN_BURST, min_rate: float = ESPN_MIN_RPS):
+        self.max_rate = max_rate
+        self.min_rate = min(min_rate, max_rate)
+        self.rate = max_rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.paused_until = 0.0
+        self._backoff = DEFAULT_BACKOFF_SECONDS
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self.paused_until and self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = max(self.paused_until - now, (1 - self.tokens) / self.rate)
+            time.sleep(wait)
+
+    def throttled(self, retry_after: Optional[float] = None):
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate / 2)
+            delay = retry_after if retry_after is not None else self._backoff
+            self._backoff = min(MAX_BACKOFF_SECONDS, self._backoff * 2)
+            self.paused_until = max(self.paused_until, now + min(delay, MAX_BACKOFF_SECONDS))
+            self.tokens = 0.0
+
+    def succeeded(self):
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + RATE_RECOVERY_STEP)
+            self._backoff = DEFAULT_BACKOFF_SECONDS
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'rate_per_second': round(self.rate, 3),
+                'max_rate_per_second': self.max_rate,
+                'paused_for_seconds': round(max(0.0, self.paused_until - time.monotonic()), 2)
+            }
+
+class CircuitBreaker:
+    """
+    closed -> open after `failure_threshold` consecutive failures;
+    open -> half-open after `cooldown` seconds, letting a single probe through;
+    the probe's outcome closes or re-opens the circuit.
+    """
+
+    def __init__(self, failure_threshold: int = BREAKER_FAILURE_THRESHOLD, cooldown: float = BREAKER_COOLDOWN_SECONDS):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self.times_opened = 0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return 'closed'
+        if self._probe_in_flight or time.monotonic() - self.opened_at >= self.cooldown:
+            return 'half_open'
+        return 'open'
+
+    def is_open(self) -> bool:
+        """True while requests would be refused (callers should serve cached data)"""
+        with self._lock:
+            return self.state == 'open' or (self.state == 'half_open' and self._probe_in_flight)
+
+    def before_request(self) -> bool:
+        """Raise CircuitOpenError while refusing requests; True when this request is the half-open probe"""
+        with self._lock:
+            state = self.state
+            if state == 'open' or (state == 'half_open' and self._probe_in_flight):
+                raise CircuitOpenError(f"ESPN circuit open after {self.consecutive_failures} consecutive failures")
+            if state == 'half_open':
+                self._probe_in_flight = True
+                return True
+            return False
+    
+    def release_probe(self):
+        """The probe ended without a verdict (e.g. an unexpected error) - let the next request probe instead"""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_success(self):
+        with self._lock:
+            self.consecutive_failures = 0
+            self.opened_at = None
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.consecutive_failures += 1
+            was_probe = self._probe_in_flight
+            self._probe_in_flight = False
+            if was_probe:
+                # Probe failed: stay open for another cooldown
+                self.opened_at = time.monotonic()
+            elif self.opened_at is None and self.consecutive_failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+                self.times_opened += 1
+                print(f"🚧 ESPN circuit open after {self.consecutive_failures} consecutive failures - serving cached data for {self.cooldown:.0f}s")
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'state': self.state,
+                'consecutive_failures': self.consecutive_failures,
+                'times_opened': self.times_opened
+            }
+
+load_accounting = ESPNLoadAccounting()
+body_cache = ConditionalBodyCache()
+rate_limiter = AdaptiveRateLimiter()
+circuit_breaker = CircuitBreaker()
+_session_local = threading.local()
+
+def _session() -> requests.Session:
+    """One keep-alive session per thread (requests.Session is not thread-safe)"""
+    session = getattr(_session_local, 'session', None)
+    if session is None:
+        session = _session_local.session = requests.Session()
+        session.headers.update(HEADERS)
+    return session
+
+def _retry_after_seconds(response: requests.Response) -> Optional[float]:
+    """Retry-After in seconds (HTTP-date values fall back to the default backoff)"""
+    value = response.headers.get('Retry-After')
+    try:
+        return max(0.0, float(value)) if value else None
+    except ValueError:
+        return None
+
+def _is_throttle(status_code: int) -> bool:
+    return status_code == 429 or status_code >= 500
+
+def fetch(url: str, sport: str) -> bytes:
+    """
+    GET an ESPN page and return its body, revalidating against the body cache.
+    Waits on the shared rate limiter, retries 429/5xx with backoff, and raises
+    requests.RequestException (CircuitOpenError while ESPN is failing) on failure.
+    """
+    is_probe = circuit_breaker.before_request()
+    try:
+        return _fetch(url, sport)
+    finally:
+        # Every outcome above records success or failure; this only catches paths that
+        # did neither, so a stuck half-open probe can never refuse requests forever
+        if is_probe:
+            circuit_breaker.release_probe()
+
+def _fetch(url: str, sport: str) -> bytes:
+    headers = body_cache.validators(url)
+    for attempt in range(MAX_RETRIES + 1):
+        rate_limiter.acquire()
+        try:
+            response = _session().get(url, headers=headers, timeout=REQUEST_TIMEOUT_SECONDS)
+        except requests.RequestException:
+            load_accounting.record(sport, requests=1, errors=1)
+            rate_limiter.throttled()
+            if attempt < MAX_RETRIES:
+                continue
+            circuit_breaker.record_failure()
+            raise
+
+        if _is_throttle(response.status_code):
+            load_accounting.record(sport, requests=1, errors=1, throttled=1)
+            rate_limiter.throttled(_retry_after_seconds(response))
+            if attempt < MAX_RETRIES:
+                continue
+            circuit_breaker.record_failure()
+            response.raise_for_status()
+
+        if response.status_code == 304:
+            # ESPN answered either way
+            rate_limiter.succeeded()
+            circuit_breaker.record_success()
+            load_accounting.record(sport, requests=1, not_modified=1)
+            cached = body_cache.body(url)
+            if cached is not None:
+                return cached
+            # Validator outlived its body (evicted meanwhile) - fetch unconditionally
+            headers = {}
+            continue
+
+        # ESPN answered; a 404 for one game is not a reason to back off
+        rate_limiter.succeeded()
+        circuit_breaker.record_success()
+        try:
+            response.raise_for_status()
+        except requests.RequestException:
+            load_accounting.record(sport, requests=1, errors=1)
+            raise
+
+        body_cache.store(url, response)
+        load_accounting.record(sport, requests=1, bytes=len(response.content))
+        return response.content
+
+    raise requests.RequestException(f"Gave up on {url} after {MAX_RETRIES + 1} attempts")
+
+def traffic_status() -> Dict[str, Any]:
+    """Rate limiter and circuit breaker state for status endpoints"""
+    return {
+        'rate_limiter': rate_limiter.status(),
+        'circuit': circuit_breaker.status()
+    }
+
+def record_parse(sport: str, seconds: float):
+    """Charge HTML parse time to the current trigger"""
+    load_accounting.record(sport, parse_seconds=seconds)
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Shared ESPN Scoreboard Parsing for the NFL and College Football scrapers
+Both leagues use the same scoreboard page layout, so the URL scheme, game ID
+extraction and per-game score/status summaries live here once; the scrapers
+only supply their league path ('nfl' or 'college-football').
+"""
+import re
+
+def league_scoreboard_url(base_url, league, week=None, season=None, season_type=None, date=None):
+    """
+    Scoreboard URL for a league, addressed by week (+ season, season type) or by
+    date (YYYYMMDD). With no week/season/date this is the current scoreboard.
+    """
+    url = f"{base_url}/{league}/scoreboard"
+    if date:
+        return f"{url}/_/date/{date}"
+    
+    parts = []
+    if week is not None:
+        parts.append(f"week/{week}")
+    if season is not None:
+        parts.append(f"year/{season}")
+    if season_type is not None:
+        parts.append(f"seasontype/{season_type}")
+    return f"{url}/_/{'/'.join(parts)}" if parts else url
+
+def extract_scoreboard_game_ids(soup, league):
+    """Game IDs in scoreboard order, taken from the league's box score links"""
+    
+    # Find all box score links
+    box_score_links = soup.find_all('a', href=re.compile(rf'/{league}/boxscore/_/gameId/\d+'))
+    
+    game_ids = []
+    for link in box_score_links:
+        href = link.get('href')
+        game_id = extract_game_id(href)
+        if game_id and game_id not in game_ids:
+            game_ids.append(game_id)
+    
+    return game_ids
+
+def extract_scoreboard_summaries(soup):
+    """Teams, scores, records and clock for every game card on the scoreboard"""
+    
+    summaries = {}
+    for section in soup.find_all('section', class_='Scoreboard'):
+        game_id = section.get('id')
+        if not game_id:
+            continue
+        
+        time_div = section.find(class_='ScoreCell__Time')
+        summary = {
+            'game_id': game_id,
+            'status': parse_scoreboard_status(time_div.get_text(' ', strip=True) if time_div else ''),
+            'teams': []
+        }
+        
+        for item in section.find_all('li', class_='ScoreboardScoreCell__Item'):
+            classes = item.get('class', [])
+            name_div = item.find(class_='ScoreCell__TeamName')
+            score_div = item.find(class_='ScoreCell__Score')
+            record_span = item.find(class_='ScoreboardScoreCell__Record')
+            summary['teams'].append({
+                'name': name_div.get_text().strip() if name_div else '',
+                'score': score_div.get_text().strip() if score_div else '',
+                'record': record_span.get_text().strip() if record_span else '',
+                'home_away': 'home' if 'ScoreboardScoreCell__Item--home' in classes else 'away',
+                'winner': 'ScoreboardScoreCell__Item--winner' in classes
+            })
+        
+        summaries[game_id] = summary
+    
+    return summaries
+
+def parse_scoreboard_status(text):
+    """Split a scoreboard status line ("7:42 - 3rd", "Halftime", "Final/OT", "8:00 PM ET") into parts"""
+    
+    lower = text.lower()
+    status = {'detail': text, 'state': 'scheduled', 'clock': '', 'period': ''}
+    if lower.startswith('final'):
+        status['state'] = 'final'
+    elif any(word in lower for word in ('postponed', 'canceled', 'cancelled', 'delayed', 'suspended')):
+        status['state'] = 'postponed'
+    elif ' - ' in text:
+        status['clock'], status['period'] = [part.strip() for part in text.split(' - ', 1)]
+        status['state'] = 'in_progress'
+    elif 'halftime' in lower or lower.startswith('end of'):
+        status['period'] = text
+        status['state'] = 'in_progress'
+    return status
+
+def extract_game_id(href):
+    """Extract game ID from href"""
+    match = re.search(r'gameId/(\d+)', href)
+    return match.group(1) if match else None
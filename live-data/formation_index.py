@@ -0,0 +1,312 @@
+"""
+Formation similarity search over a library of analysed plays.
+
+Every play is stored as a fixed-length feature vector:
+1. Per position group (DL, LB, DB, S, OL, backs, receivers) a histogram of player
+   depth |x| and a histogram of width |y| in yards - absolute values, so a look and
+   its mirror image (or the same look from the other sideline) land on the same vector
+2. A one-hot of the coverage shell from classify_coverage_v2, weighted by SHELL_WEIGHT
+k nearest neighbours are found by vectorised brute force (one matrix-vector product
+over the whole library), which answers in a few milliseconds for 50k plays on a
+single core. The library is a JSONL file that adds are appended to, so the API
+workers and the batch pipeline can all add to it cheaply (under a file lock); with
+max_plays the oldest plays are dropped and the file is compacted once it outgrows the cap.
+
+Usage:
+    python formation_index.py library.jsonl play.json [-k 5]
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process lock, so give the library a single writer
+    fcntl = None
+
+import numpy as np
+
+from defensive_coverage import classify_coverage_v2
+
+POSITION_GROUPS = (
+    ('defense', ('DE', 'DT')),
+    ('defense', ('LB', 'MLB', 'OLB')),
+    ('defense', ('DB', 'CB')),
+    ('defense', ('S', 'FS', 'SS')),
+    ('offense', ('C', 'OG', 'OT')),
+    ('offense', ('QB', 'RB', 'FB')),
+    ('offense', ('WR', 'TE'))
+)
+DEPTH_EDGES_YARDS = (1.0, 3.0, 5.0, 7.0, 10.0, 13.0)  # 7 bins of |x|
+WIDTH_EDGES_YARDS = (3.0, 6.0, 10.0, 15.0, 20.0)      # 6 bins of |y|
+SHELLS = ('Zero-High', 'Single-High', 'Two-High', 'Unknown')
+SHELL_WEIGHT = 2.0
+
+DEPTH_BINS = len(DEPTH_EDGES_YARDS) + 1
+WIDTH_BINS = len(WIDTH_EDGES_YARDS) + 1
+GROUP_FEATURES = DEPTH_BINS + WIDTH_BINS
+FEATURE_LENGTH = len(POSITION_GROUPS) * GROUP_FEATURES + len(SHELLS)
+
+_GROUP_OF = {(team, position): i for i, (team, positions) in enumerate(POSITION_GROUPS) for position in positions}
+
+def formation_features(players, shell='Unknown'):
+    """
+    Feature vector (FEATURE_LENGTH,) for mapped players ({team, position,
+    coordinates: {x_yards, y_yards}}) and a coverage shell.
+    """
+    rows = [(_GROUP_OF[(p.get('team'), p.get('position'))], p['coordinates']['x_yards'], p['coordinates']['y_yards'])
+            for p in players if (p.get('team'), p.get('position')) in _GROUP_OF]
+    features = np.zeros(FEATURE_LENGTH, dtype=np.float32)
+    if rows:
+        group, x, y = (np.array(column) for column in zip(*rows))
+        depth_bin = np.digitize(np.abs(x), DEPTH_EDGES_YARDS)
+        width_bin = np.digitize(np.abs(y), WIDTH_EDGES_YARDS)
+        offsets = group * GROUP_FEATURES
+        size = len(POSITION_GROUPS) * GROUP_FEATURES
+        features[:size] = (np.bincount(offsets + depth_bin, minlength=size) +
+                           np.bincount(offsets + DEPTH_BINS + width_bin, minlength=size))
+
+    shell_index = SHELLS.index(shell) if shell in SHELLS else SHELLS.index('Unknown')
+    features[-len(SHELLS) + shell_index] = SHELL_WEIGHT
+    return features
+
+class FormationIndex:
+    """
+    Library of play feature vectors with k-nearest-neighbour search:
+    1. add() appends a play (to memory and, with a path, to the JSONL library)
+    2. query() returns the k closest stored plays by Euclidean distance
+    3. With max_plays, going over the cap drops the oldest tenth of the library and
+       compacts the file in a background thread, so neither grows without bound
+    Play ids are unique; adding a known id is a no-op.
+
+    Several processes (API workers, the batch pipeline) may share one file. Appends and
+    compactions hold an exclusive lock on <library>.lock, and every add first reads
+    what other processes appended since - or the whole file, after another process
+    compacted it - so a compaction always starts from every play on disk.
+    """
+
+    def __init__(self, path=None, max_plays=None):
+        self.path = Path(path) if path else None
+        self.max_plays = max_plays
+        self._lock = threading.Lock()
+        self._reset()
+        # Position in the library file read so far, and which file (a compaction replaces it)
+        self._file_id = None
+        self._offset = 0
+        self._compacting = False
+        if self.path:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self._file_lock():
+                records = self._catch_up()
+                # Duplicates, stale layouts and plays over the cap are dropped from the file as well
+                if records > self._count or self._over_cap():
+                    self._compact()
+
+    def __len__(self):
+        return self._count
+
+    def _reset(self):
+        # Features are small counts, so float32 is exact and halves the scan
+        self._vectors = np.empty((0, FEATURE_LENGTH), dtype=np.float32)
+        self._norms = np.empty(0, dtype=np.float32)
+        self._count = 0
+        self.play_ids = []
+        self.metadata = []
+        self._rows = {}
+
+    @contextmanager
+    def _file_lock(self):
+        """Exclusive lock on the library file, shared by every process and thread using it"""
+        if fcntl is None:
+            yield
+            return
+        with open(self.path.with_name(self.path.name + '.lock'), 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _catch_up(self):
+        """
+        Read plays appended to the file since the last read (the whole file when it was
+        replaced by a compaction). Caller holds the file lock. Returns the records read.
+        """
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return 0
+        file_id = (stat.st_dev, stat.st_ino)
+        reload = file_id != self._file_id or stat.st_size < self._offset
+        if not reload and stat.st_size == self._offset:
+            return 0
+
+        # Parse without holding _lock so queries carry on meanwhile
+        parsed = []
+        with self.path.open('rb') as f:
+            f.seek(0 if reload else self._offset)
+            data = f.read()
+        # Only whole lines (without fcntl a writer may be mid-line)
+        data = data[:data.rfind(b'\n') + 1]
+        for line in data.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            parsed.append((record['play_id'], np.asarray(record['features'], dtype=np.float32), record.get('meta', {})))
+
+        with self._lock:
+            if reload:
+                self._reset()
+            for play_id, vector, meta in parsed:
+                # Written with a different feature layout - skip rather than compare apples to oranges
+                if vector.shape == (FEATURE_LENGTH,) and play_id not in self._rows:
+                    self._append(play_id, vector, meta)
+        self._file_id = file_id
+        self._offset = (0 if reload else self._offset) + len(data)
+        return len(parsed)
+
+    def _append(self, play_id, vector, meta):
+        if self._count == len(self._vectors):
+            # Grow by doubling so adds stay amortised O(1)
+            capacity = max(64, 2 * len(self._vectors))
+            self._vectors = np.resize(self._vectors, (capacity, FEATURE_LENGTH))
+            self._norms = np.resize(self._norms, capacity)
+        self._vectors[self._count] = vector
+        self._norms[self._count] = vector @ vector
+        self._rows[play_id] = self._count
+        self._count += 1
+        self.play_ids.append(play_id)
+        self.metadata.append(meta)
+
+    def _over_cap(self):
+        return bool(self.max_plays) and self._count > self.max_plays
+
+    def _evict(self):
+        """Drop the oldest plays (rows are in insertion order) down to a tenth below the cap"""
+        count = self._count - self.max_plays + self.max_plays // 10
+        keep = self._count - count
+        self._vectors[:keep] = self._vectors[count:self._count]
+        self._norms[:keep] = self._norms[count:self._count]
+        self._count = keep
+        del self.play_ids[:count]
+        del self.metadata[:count]
+        self._rows = {play_id: row for row, play_id in enumerate(self.play_ids)}
+
+    @staticmethod
+    def _record(play_id, vector, meta):
+        return json.dumps({'play_id': play_id, 'features': vector.tolist(), 'meta': meta}, separators=(',', ':')) + '\n'
+
+    def _compact(self):
+        """
+        Trim to the cap and rewrite the file from every play on disk. Caller holds the
+        file lock; _lock is only held to trim and snapshot, not while writing.
+        """
+        self._catch_up()
+        with self._lock:
+            if self._over_cap():
+                self._evict()
+            lines = [self._record(self.play_ids[i], self._vectors[i], self.metadata[i]) for i in range(self._count)]
+
+        temp_path = self.path.with_name(self.path.name + '.tmp')
+        with temp_path.open('w', encoding='utf-8') as f:
+            f.writelines(lines)
+        os.replace(temp_path, self.path)
+        stat = os.stat(self.path)
+        self._file_id = (stat.st_dev, stat.st_ino)
+        self._offset = stat.st_size
+
+    def _compact_in_background(self):
+        with self._lock:
+            if self._compacting:
+                return
+            self._compacting = True
+
+        def run():
+            try:
+                with self._file_lock():
+                    self._compact()
+            except OSError as e:
+                print(f"⚠️  Could not compact formation library {self.path}: {e}", file=sys.stderr)
+            finally:
+                self._compacting = False
+        threading.Thread(target=run, name='formation-library-compact', daemon=True).start()
+
+    def add(self, play_id, players, coverage=None, meta=None):
+        """
+        Store a play. coverage is a classify_coverage_v2 result (computed when omitted);
+        its shell and guesses are kept in the metadata. Returns False for a known id.
+        """
+        coverage = coverage or classify_coverage_v2({'players': players})
+        meta = dict(meta or {}, shell=coverage['shell'], primary_guess=coverage['primary_guess'])
+        vector = formation_features(players, coverage['shell'])
+        if not self.path:
+            with self._lock:
+                if play_id in self._rows:
+                    return False
+                self._append(play_id, vector, meta)
+                if self._over_cap():
+                    self._evict()
+            return True
+
+        with self._file_lock():
+            self._catch_up()
+            with self._lock:
+                if play_id in self._rows:
+                    return False
+                self._append(play_id, vector, meta)
+                over_cap = self._over_cap()
+            with self.path.open('a', encoding='utf-8') as f:
+                f.write(self._record(play_id, vector, meta))
+            # Nobody else can write while we hold the lock, so the file ends with our own
+            # line, which is already in memory - the next catch-up starts after it
+            stat = os.stat(self.path)
+            self._file_id = (stat.st_dev, stat.st_ino)
+            self._offset = stat.st_size
+        if over_cap:
+            self._compact_in_background()
+        return True
+
+    def query(self, players, coverage=None, k=5, exclude=None):
+        """
+        The k stored plays closest to a formation, nearest first:
+        [{'play_id', 'distance', **metadata}, ...]. exclude skips one play id (e.g. itself).
+        """
+        coverage = coverage or classify_coverage_v2({'players': players})
+        vector = formation_features(players, coverage['shell'])
+        with self._lock:
+            count = self._count
+            if not count:
+                return []
+            # |a - b|^2 = |a|^2 + |b|^2 - 2ab over the whole library in one product
+            distances = self._norms[:count] + vector @ vector - 2 * (self._vectors[:count] @ vector)
+
+            excluded_row = self._rows.get(exclude) if exclude is not None else None
+            excluded = excluded_row is not None
+            if excluded:
+                distances[excluded_row] = np.inf
+            k = min(k + excluded, count)
+            nearest = np.argpartition(distances, k - 1)[:k]
+            nearest = nearest[np.argsort(distances[nearest], kind='stable')]
+            return [dict(self.metadata[i], play_id=self.play_ids[i],
+                         distance=round(float(np.sqrt(max(distances[i], 0.0))), 3))
+                    for i in nearest.tolist() if np.isfinite(distances[i])][:k - excluded]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('library', help='Formation library (.jsonl), as written by FormationIndex')
+    parser.add_argument('play', help='Play in the map_coordinates format (e.g. output.json)')
+    parser.add_argument('-k', type=int, default=5, help='Number of similar plays to return')
+    args = parser.parse_args()
+
+    index = FormationIndex(args.library)
+    with open(args.play, 'r', encoding='utf-8') as f:
+        play_data = json.load(f)
+    print(json.dumps(index.query(play_data.get('players', []), k=args.k), indent=2))
+    print(f"{len(index)} plays in library", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
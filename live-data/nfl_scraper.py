@@ -6,9 +6,16 @@ Similar to col_full_test.py but for NFL games from ESPN
 import requests
 from bs4 import BeautifulSoup
 import json
+import os
 import re
 from datetime import datetime
-import time
+
+from espn_http import fetch, record_parse
+from espn_scoreboard import league_scoreboard_url, extract_scoreboard_game_ids, extract_scoreboard_summaries
+from tracing import span
+
+# Overridable so scrapes can be replayed from a local fixture server
+ESPN_BASE_URL = os.getenv('ESPN_BASE_URL', 'https://www.espn.com')
 
 def scrape_all_nfl_boxscores():
     """Main function to scrape all NFL games and their detailed box scores"""
@@ -35,12 +42,10 @@ def scrape_all_nfl_boxscores():
     for i, game_id in enumerate(game_ids, 1):
         print(f"Scraping NFL game {i}/{len(game_ids)}: {game_id}")
         
+        # Pacing comes from the shared ESPN rate limiter (espn_http)
         game_data = scrape_comprehensive_nfl_boxscore(game_id)
         if game_data:
             all_games_data['games'][game_id] = game_data
-        
-        # Small delay to be respectful
-        time.sleep(1)
     
     # Step 3: Save all data
     filename = f"all_nfl_games_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
@@ -48,65 +53,78 @@ def scrape_all_nfl_boxscores():
     
     return all_games_data
 
-def scrape_nfl_game_ids_from_scoreboard(url="https://www.espn.com/nfl/scoreboard"):
-    """Extract all game IDs from the NFL scoreboard"""
+def scrape_nfl_game_ids_from_scoreboard(url=None, week=None, season=None, season_type=None, date=None):
+    """Extract all game IDs from the NFL scoreboard (current, or a given week/season/date)"""
+    return scrape_nfl_scoreboard(url, week=week, season=season, season_type=season_type, date=date)['game_ids']
+
+def nfl_scoreboard_url(week=None, season=None, season_type=None, date=None):
+    """NFL scoreboard URL, addressed by week (+ season, season type) or by date (YYYYMMDD)"""
+    return league_scoreboard_url(ESPN_BASE_URL, 'nfl', week, season, season_type, date)
+
+def scrape_nfl_scoreboard(url=None, week=None, season=None, season_type=None, date=None):
+    """Fetch the NFL scoreboard once and return its game IDs plus a score/status summary per game"""
     
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    }
+    if url is None:
+        url = nfl_scoreboard_url(week, season, season_type, date)
     
     try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Find all box score links for NFL
-        box_score_links = soup.find_all('a', href=re.compile(r'/nfl/boxscore/_/gameId/\d+'))
-        
-        game_ids = []
-        for link in box_score_links:
-            href = link.get('href')
-            game_id = extract_game_id(href)
-            if game_id and game_id not in game_ids:
-                game_ids.append(game_id)
-        
-        return game_ids
+        with span('espn.scoreboard_fetch', sport='nfl') as fetch_span:
+            html = fetch(url, 'nfl')
+            fetch_span.set(bytes=len(html))
+        with span('espn.scoreboard_parse', sport='nfl') as parse_span:
+            scoreboard = parse_nfl_scoreboard(html)
+        record_parse('nfl', parse_span.duration)
+        return scoreboard
         
     except requests.RequestException as e:
         print(f"Error fetching NFL scoreboard: {e}")
-        return []
+        return {'game_ids': [], 'summaries': {}}
+
+def parse_nfl_scoreboard(html):
+    """Parse NFL scoreboard HTML into game IDs and per-game summaries"""
+    
+    soup = BeautifulSoup(html, 'html.parser')
+    
+    return {
+        'game_ids': extract_scoreboard_game_ids(soup, 'nfl'),
+        'summaries': extract_scoreboard_summaries(soup)
+    }
 
-def extract_game_id(href):
-    """Extract game ID from href"""
-    match = re.search(r'gameId/(\d+)', href)
-    return match.group(1) if match else None
+def parse_nfl_game_ids_from_scoreboard(html):
+    """Extract game IDs from NFL scoreboard HTML"""
+    
+    return extract_scoreboard_game_ids(BeautifulSoup(html, 'html.parser'), 'nfl')
 
 def scrape_comprehensive_nfl_boxscore(game_id):
     """Scrape comprehensive box score for a single NFL game"""
     
-    url = f"https://www.espn.com/nfl/boxscore/_/gameId/{game_id}"
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    }
+    url = f"{ESPN_BASE_URL}/nfl/boxscore/_/gameId/{game_id}"
     
     try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        game_data = {
-            'sport': 'nfl',
-            'game_id': game_id,
-            'game_info': scrape_nfl_game_info(soup),
-            'teams': scrape_detailed_nfl_boxscore(soup)
-        }
-        
+        with span('espn.game_fetch', sport='nfl', game_id=game_id) as fetch_span:
+            html = fetch(url, 'nfl')
+            fetch_span.set(bytes=len(html))
+        with span('espn.game_parse', sport='nfl', game_id=game_id) as parse_span:
+            game_data = parse_comprehensive_nfl_boxscore(game_id, html)
+        record_parse('nfl', parse_span.duration)
         return game_data
         
     except requests.RequestException as e:
         print(f"Error fetching NFL game {game_id}: {e}")
         return None
 
+def parse_comprehensive_nfl_boxscore(game_id, html):
+    """Parse NFL box score HTML into game data"""
+    
+    soup = BeautifulSoup(html, 'html.parser')
+    
+    return {
+        'sport': 'nfl',
+        'game_id': game_id,
+        'game_info': scrape_nfl_game_info(soup),
+        'teams': scrape_detailed_nfl_boxscore(soup)
+    }
+
 def scrape_nfl_game_info(soup):
     """Extract NFL game information from Gamestrip__Container"""
     
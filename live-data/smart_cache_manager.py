@@ -4,13 +4,53 @@ Smart Cache Manager for ESPN Football Data (NFL and College Football)
 Implements intelligent caching with game-specific updates for both sports
 """
 import json
+import logging
+import os
 import time
+import heapq
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from collections import Counter
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Set
-from col_full_test import scrape_comprehensive_boxscore, scrape_game_ids_from_scoreboard
-from nfl_scraper import scrape_comprehensive_nfl_boxscore, scrape_nfl_game_ids_from_scoreboard
+from typing import Dict, List, Optional, Any, Set, Tuple
+from cache_store import CacheBackend, create_default_store, extract_game_metadata
+from col_full_test import scrape_comprehensive_boxscore, scrape_scoreboard
+from nfl_scraper import scrape_comprehensive_nfl_boxscore, scrape_nfl_scoreboard
+from espn_http import espn_trigger, load_accounting, circuit_breaker, traffic_status
+from tracing import span, tracer
 import re
 
+logger = logging.getLogger('nextgen.cache')
+
+# Questions answerable from the scoreboard alone (scores, clock, results)... Whole words
+# only: "who scored", "finally", "heartbeat" and "quarterly" are not score questions
+SCORE_QUERY_PATTERN = re.compile(
+    r"\b(?:scores?|winning|losing|leading|who won|who is up|who's up|final|halftime|"
+    r"quarters?|time left|status|results?|beat)\b"
+)
+# ...unless they also ask for anything only a boxscore has. Whole words only, so team
+# names ("Ohio State") and score words ("status") never read as stat requests
+STAT_QUERY_PATTERN = re.compile(
+    r"\b(?:yards?|yardage|yds|touchdowns?|tds?|pass(?:es|ing|er|ers)?|rush(?:es|ing|er|ers)?|"
+    r"receiv(?:e|es|ing|er|ers)|receptions?|catch(?:es)?|tackles?|sacks?|interceptions?|ints?|"
+    r"stats?|statistics|leaders?|players?|carr(?:y|ies)|completions?|completed|fumbles?|"
+    r"field goals?|kick(?:er|ers|ing)|punt(?:s|er|ers|ing)?|qbs?|quarterbacks?|attempts?)\b"
+)
+
+# Questions about a specific week or a past season are answered from the backfilled archive.
+# A year only counts as a season in season context ("in 2019", "week 3 of 2019", "the 2019
+# season") - a bare 4-digit number is as likely a stat ("2000 rushing yards")
+HISTORICAL_WEEK_PATTERN = re.compile(r'\bweek\s*(\d{1,2})\b')
+HISTORICAL_SEASON_PATTERN = re.compile(
+    r'\b(?:in|during|of|since|season)\s+(?:the\s+)?(19[5-9]\d|20\d{2})\b(?!\s*(?:yards?|yds|points?|pts)\b)'
+    r'|\b(19[5-9]\d|20\d{2})\s+(?:regular\s+|nfl\s+|college\s+)?(?:season|playoffs?|postseason|preseason|bowl)'
+)
+LAST_SEASON_PHRASES = ('last season', 'last year')
+# ESPN season types (see backfill.py); a week without one of these means the regular season
+POSTSEASON_PHRASES = ('playoff', 'postseason', 'post-season', 'bowl', 'wild card', 'wildcard')
+PRESEASON_PHRASES = ('preseason', 'pre-season')
+PRESEASON, REGULAR_SEASON, POSTSEASON = 1, 2, 3
+
 class SmartESPNCacheManager:
     """
     Smart caching system that:
@@ -18,9 +58,15 @@ class SmartESPNCacheManager:
     2. Full dataset refresh every 10 minutes
     3. Player-to-game mapping for targeted updates
     4. Supports both NFL and College Football
+    5. Optional persistent store so restarts warm from disk
+    6. Shared stores let several workers split scraping via leases
+    7. Memory ceiling with eviction of finished, off-scoreboard games first
+    8. Scoreboard summaries on a 30-second cadence for score/status questions
+    9. Historical week/season questions read from the backfilled archive in the store
+    10. Per-request deadlines: late refreshes finish in the background, stale games are flagged
     """
     
-    def __init__(self):
+    def __init__(self, store: Optional[CacheBackend] = None):
         # Individual game cache: {sport: {game_id: {'data': game_data, 'timestamp': datetime, 'metadata': metadata}}}
         self.game_cache: Dict[str, Dict[str, Dict]] = {
             'college': {},
@@ -37,11 +83,303 @@ class SmartESPNCacheManager:
             'nfl': set()
         }
         
+        # Scoreboard summaries per sport: {'timestamp': datetime, 'games': {game_id: summary}}
+        self.scoreboard_cache: Dict[str, Dict[str, Any]] = {
+            'college': {'timestamp': None, 'games': {}},
+            'nfl': {'timestamp': None, 'games': {}}
+        }
+        
         # Cache duration settings
         self.individual_game_cache_minutes = 2
         self.full_dataset_cache_minutes = 10
+        self.scoreboard_cache_seconds = 30
+        self.smart_data_deadline_seconds = 60  # Default wait for refreshes when the caller sets no budget
+        self.archive_result_limit = 40  # Archived games per sport handed to the prompt
+        
+        # Memory accounting: estimated bytes per sport, ceiling and eviction counts
+        self.max_cache_bytes = int(float(os.getenv('ESPN_CACHE_MAX_MB', 64)) * 1024 * 1024)
+        # Eviction goes down to this low-water mark so one sorted pass covers many later inserts
+        self.evict_to_bytes = int(self.max_cache_bytes * 0.9)
+        self.cache_bytes: Dict[str, int] = {
+            'college': 0,
+            'nfl': 0
+        }
+        self.eviction_count: Dict[str, int] = {
+            'college': 0,
+            'nfl': 0
+        }
+        
+        # Incrementally maintained aggregates so get_cache_status never scans the cache:
+        # player/team reference counts, the set of fresh games per sport, and a heap of
+        # (expires_at, sport, game_id, timestamp) that retires fresh games lazily and is drained on insert
+        self._lock = threading.RLock()
+        self._player_refcounts: Counter = Counter()
+        self._team_refcounts: Counter = Counter()
+        self._fresh_games: Dict[str, Set[str]] = {
+            'college': set(),
+            'nfl': set()
+        }
+        self._freshness_heap: List[tuple] = []
+        
+        # Persistent second tier (write-through, read on startup)
+        self.store = store
+        self._revalidation_thread: Optional[threading.Thread] = None
+        
+        # Runs per-sport refreshes off the request thread so requests can stop waiting at a deadline.
+        # Refreshes are keyed by sport and query so concurrent requests share one instead of queueing
+        # duplicates, and at most max_pending_refreshes are queued or running at once
+        self._sport_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='smart-data')
+        self.max_pending_refreshes = 16
+        self._sport_refreshes: Dict[Tuple[str, str], Future] = {}
+        
+        # Refreshes running in this process, so requests that arrive mid-refresh share it
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        
+        # Shared store coordination: store write sequence synced up to per sport, lease lifetimes
+        self._store_sync_version: Dict[str, int] = {
+            'college': 0,
+            'nfl': 0
+        }
+        self.full_refresh_lease_seconds = 300
+        self.game_refresh_lease_seconds = 60
         
         print("🧠 Smart ESPN Cache Manager initialized (NFL + College Football)")
+        
+        if self.store:
+            self.warm_from_store()
+    
+    def warm_from_store(self):
+        """Load games and full refresh state from the persistent store into memory"""
+        try:
+            # Read the sequence first: rows written meanwhile are simply synced again later
+            latest_version = self.store.latest_version()
+            stored_games = self.store.load_games()
+            for sport, games in stored_games.items():
+                if sport in self.game_cache:
+                    for game_id, game_entry in games.items():
+                        self._put_in_memory(sport, game_id, game_entry, enforce_ceiling=False)
+            # One eviction pass for the whole store instead of one per loaded game
+            self._enforce_memory_ceiling()
+            for sport in self._store_sync_version:
+                self._store_sync_version[sport] = latest_version
+            
+            for sport, (timestamp, game_ids) in self.store.load_datasets().items():
+                if sport in self.full_dataset_timestamp:
+                    self.full_dataset_timestamp[sport] = timestamp
+                    self.all_game_ids[sport] = game_ids
+            
+            print(f"💾 Warmed cache from disk: {len(self.game_cache['college'])} college, "
+                  f"{len(self.game_cache['nfl'])} NFL games")
+        except Exception as e:
+            print(f"⚠️  Error warming cache from disk: {e}")
+    
+    def sync_from_store(self, sport: str = 'college'):
+        """Pull games and refresh state written by other workers into the memory cache"""
+        if not self.store or not self.store.shared:
+            return
+        
+        try:
+            # Sequence numbers follow commit order, unlike wall-clock timestamps: a row another
+            # worker stamped earlier but committed later still has a higher sequence number.
+            # Take the sequence before reading so nothing committed in between is skipped.
+            latest_version = self.store.latest_version()
+            newer_games = self.store.load_games(sport, after_version=self._store_sync_version[sport])
+            games = newer_games.get(sport, {})
+            for game_id, game_entry in games.items():
+                cached = self.game_cache[sport].get(game_id)
+                if not cached or cached['timestamp'] < game_entry['timestamp']:
+                    self._put_in_memory(sport, game_id, game_entry, enforce_ceiling=False)
+            self._enforce_memory_ceiling()
+            self._store_sync_version[sport] = max(self._store_sync_version[sport], latest_version)
+            
+            timestamp, game_ids = self.store.load_datasets().get(sport, (None, set()))
+            local_timestamp = self.full_dataset_timestamp[sport]
+            if timestamp and (local_timestamp is None or timestamp > local_timestamp):
+                self.full_dataset_timestamp[sport] = timestamp
+                self.all_game_ids[sport] = game_ids
+            
+            if games:
+                print(f"🔗 Synced {len(games)} {sport} games written by other workers")
+        except Exception as e:
+            print(f"⚠️  Error syncing {sport} games from shared store: {e}")
+    
+    def _acquire_lease(self, name: str, ttl_seconds: float) -> bool:
+        """Take a scrape lease from the store; without a shared store this worker always owns it"""
+        if not self.store:
+            return True
+        try:
+            return self.store.acquire_lease(name, ttl_seconds)
+        except Exception as e:
+            print(f"⚠️  Error acquiring lease {name}: {e} - scraping anyway")
+            return True
+    
+    def _release_lease(self, name: str):
+        if not self.store:
+            return
+        try:
+            self.store.release_lease(name)
+        except Exception as e:
+            print(f"⚠️  Error releasing lease {name}: {e}")
+    
+    def start_background_revalidation(self):
+        """Refresh any sport whose warmed dataset is stale without blocking startup"""
+        if self._revalidation_thread and self._revalidation_thread.is_alive():
+            return
+        
+        def revalidate():
+            for sport in ['college', 'nfl']:
+                if not self.is_full_dataset_fresh(sport):
+                    print(f"🔄 Background revalidation of {sport} data warmed from disk")
+                    self.full_refresh(sport)
+        
+        self._revalidation_thread = threading.Thread(target=revalidate, name='cache-revalidation', daemon=True)
+        self._revalidation_thread.start()
+    
+    @staticmethod
+    def _estimate_entry_bytes(game_entry: Dict[str, Any]) -> int:
+        """Approximate footprint of a cache entry from its serialised size"""
+        return (len(json.dumps(game_entry.get('data', {}), separators=(',', ':'))) +
+                len(json.dumps(game_entry.get('metadata', {}), separators=(',', ':'))))
+    
+    @staticmethod
+    def _is_game_final(game_entry: Dict[str, Any]) -> bool:
+        """True once ESPN reports the game as finished"""
+        status = game_entry.get('metadata', {}).get('status', {})
+        status_text = f"{status.get('quarter', '')} {status.get('time_remaining', '')}".lower()
+        return 'final' in status_text
+    
+    def _put_in_memory(self, sport: str, game_id: str, game_entry: Dict[str, Any], enforce_ceiling: bool = True):
+        """
+        Insert or replace a memory cache entry, keeping byte accounting, aggregates and the ceiling.
+        Bulk loads pass enforce_ceiling=False and call _enforce_memory_ceiling once afterwards.
+        """
+        game_entry['size_bytes'] = self._estimate_entry_bytes(game_entry)
+        
+        with self._lock:
+            self._remove_from_memory(sport, game_id)
+            
+            self.game_cache[sport][game_id] = game_entry
+            self.cache_bytes[sport] += game_entry['size_bytes']
+            
+            metadata = game_entry.get('metadata', {})
+            self._player_refcounts.update(metadata.get('players', []))
+            self._team_refcounts.update(metadata.get('teams', []))
+            
+            expires_at = game_entry['timestamp'] + timedelta(minutes=self.individual_game_cache_minutes)
+            if expires_at > datetime.now():
+                self._fresh_games[sport].add(game_id)
+                heapq.heappush(self._freshness_heap, (expires_at, sport, game_id, game_entry['timestamp']))
+            
+            # Drain on every insert so processes that never serve cache status don't grow the heap
+            self._expire_fresh_games()
+            self._compact_freshness_heap()
+            
+            if enforce_ceiling:
+                self._enforce_memory_ceiling(keep=(sport, game_id))
+    
+    def _remove_from_memory(self, sport: str, game_id: str):
+        with self._lock:
+            game_entry = self.game_cache[sport].pop(game_id, None)
+            if not game_entry:
+                return
+            
+            self.cache_bytes[sport] -= game_entry.get('size_bytes', 0)
+            self._fresh_games[sport].discard(game_id)
+            
+            metadata = game_entry.get('metadata', {})
+            self._player_refcounts.subtract(metadata.get('players', []))
+            self._team_refcounts.subtract(metadata.get('teams', []))
+            for counts, names in ((self._player_refcounts, metadata.get('players', [])),
+                                  (self._team_refcounts, metadata.get('teams', []))):
+                for name in names:
+                    if counts.get(name, 0) <= 0:
+                        counts.pop(name, None)
+    
+    def _expire_fresh_games(self):
+        """Retire games whose freshness window has passed; each heap item is popped once"""
+        now = datetime.now()
+        with self._lock:
+            while self._freshness_heap and self._freshness_heap[0][0] <= now:
+                _, sport, game_id, timestamp = heapq.heappop(self._freshness_heap)
+                game_entry = self.game_cache[sport].get(game_id)
+                # Skip heap items superseded by a newer scrape of the same game
+                if game_entry and game_entry['timestamp'] == timestamp:
+                    self._fresh_games[sport].discard(game_id)
+    
+    def _compact_freshness_heap(self):
+        """Drop heap items for re-scraped or evicted games once they outnumber the live fresh games"""
+        with self._lock:
+            fresh_count = sum(len(game_ids) for game_ids in self._fresh_games.values())
+            if len(self._freshness_heap) <= 2 * fresh_count + 64:
+                return
+            
+            self._freshness_heap = [
+                (expires_at, sport, game_id, timestamp)
+                for expires_at, sport, game_id, timestamp in self._freshness_heap
+                if game_id in self._fresh_games[sport]
+                and self.game_cache[sport].get(game_id, {}).get('timestamp') == timestamp
+            ]
+            heapq.heapify(self._freshness_heap)
+    
+    def _enforce_memory_ceiling(self, keep: tuple = None):
+        """
+        Once the estimated size passes max_cache_bytes, evict games down to evict_to_bytes.
+        Order: finished games no longer on the scoreboard, other off-scoreboard games,
+        finished games still listed, then everything else - oldest first within each group.
+        Evicted games stay in the persistent store.
+        """
+        if sum(self.cache_bytes.values()) <= self.max_cache_bytes:
+            return
+        
+        with self._lock:
+            candidates = []
+            for sport, game_id, game_entry in self.get_cached_games():
+                if (sport, game_id) == keep:
+                    continue
+                on_scoreboard = game_id in self.all_game_ids[sport]
+                is_final = self._is_game_final(game_entry)
+                candidates.append(((on_scoreboard, not is_final, game_entry['timestamp']), sport, game_id))
+            candidates.sort(key=lambda candidate: candidate[0])
+            
+            evicted = 0
+            for _, sport, game_id in candidates:
+                if sum(self.cache_bytes.values()) <= self.evict_to_bytes:
+                    break
+                self._remove_from_memory(sport, game_id)
+                self.eviction_count[sport] += 1
+                evicted += 1
+                logger.debug("Evicted %s game %s from memory", sport, game_id)
+            
+            logger.info("Evicted %d games from memory (cache over %.1f MB, now %.1f MB)", evicted,
+                        self.max_cache_bytes / 1024 / 1024, sum(self.cache_bytes.values()) / 1024 / 1024)
+    
+    def _store_game(self, sport: str, game_id: str, game_entry: Dict[str, Any]):
+        """Put a game into the memory cache and write it through to the persistent store"""
+        self._put_in_memory(sport, game_id, game_entry)
+        
+        if self.store:
+            try:
+                self.store.save_game(sport, game_id, game_entry)
+            except Exception as e:
+                print(f"⚠️  Error persisting {sport} game {game_id}: {e}")
+    
+    def clear(self, sport: str = None):
+        """Clear memory and persistent cache for one sport, or both"""
+        for sport_key in ([sport] if sport else ['college', 'nfl']):
+            with self._lock:
+                for game_id in list(self.game_cache[sport_key].keys()):
+                    self._remove_from_memory(sport_key, game_id)
+            self.full_dataset_timestamp[sport_key] = None
+            self.all_game_ids[sport_key].clear()
+            self.scoreboard_cache[sport_key] = {'timestamp': None, 'games': {}}
+            self._store_sync_version[sport_key] = 0
+        
+        if self.store:
+            try:
+                self.store.clear(sport)
+            except Exception as e:
+                print(f"⚠️  Error clearing persistent cache: {e}")
     
     def is_individual_game_fresh(self, game_id: str, sport: str = 'college') -> bool:
         """Check if individual game cache is fresh (< 2 minutes)"""
@@ -64,19 +402,209 @@ class SmartESPNCacheManager:
         return time_elapsed < timedelta(minutes=self.full_dataset_cache_minutes)
     
     def get_current_game_ids(self, sport: str = 'college') -> List[str]:
-        """Get current game IDs from ESPN scoreboard"""
+        """Get current game IDs from ESPN scoreboard (also refreshes the scoreboard summaries)"""
         try:
-            if sport == 'nfl':
-                game_ids = scrape_nfl_game_ids_from_scoreboard()
-            else:
-                game_ids = scrape_game_ids_from_scoreboard()
-            return game_ids or []
+            return self._scrape_scoreboard(sport)['game_ids'] or []
         except Exception as e:
             print(f"⚠️  Error getting {sport} game IDs: {e}")
             return []
     
+    def _scrape_scoreboard(self, sport: str) -> Dict[str, Any]:
+        """Fetch the scoreboard once, keeping its per-game summaries"""
+        scoreboard = scrape_nfl_scoreboard() if sport == 'nfl' else scrape_scoreboard()
+        if scoreboard['game_ids'] or scoreboard['summaries']:
+            self.scoreboard_cache[sport] = {'timestamp': datetime.now(), 'games': scoreboard['summaries']}
+        return scoreboard
+    
+    def is_scoreboard_fresh(self, sport: str = 'college') -> bool:
+        """Check if the scoreboard summaries are fresh (< 30 seconds)"""
+        timestamp = self.scoreboard_cache[sport]['timestamp']
+        return timestamp is not None and datetime.now() - timestamp < timedelta(seconds=self.scoreboard_cache_seconds)
+    
+    def get_scoreboard(self, sport: str = 'college') -> Dict[str, Dict]:
+        """Score/status summaries for a sport, re-reading only the scoreboard page when they are stale"""
+        if not self.is_scoreboard_fresh(sport) and not circuit_breaker.is_open():
+            try:
+                with espn_trigger('scoreboard'):
+                    self._scrape_scoreboard(sport)
+            except Exception as e:
+                print(f"⚠️  Error refreshing {sport} scoreboard: {e}")
+        return self.scoreboard_cache[sport]['games']
+    
+    @staticmethod
+    def is_score_query(query: str) -> bool:
+        """True for score/status questions that the scoreboard summaries can answer on their own"""
+        query_lower = query.lower()
+        if not SCORE_QUERY_PATTERN.search(query_lower):
+            return False
+        return not STAT_QUERY_PATTERN.search(query_lower)
+    
+    def get_scoreboard_data(self, query_hint: str = "", sport: str = None) -> Dict[str, Any]:
+        """
+        Scoreboard-only counterpart of get_smart_data: same dataset shape, but games are
+        lightweight summaries (teams, scores, records, clock) and no boxscore is fetched
+        """
+        sports_to_process = [sport] if sport else ['college', 'nfl']
+        query_lower = query_hint.lower().strip()
+        games = {}
+        filtered = False
+        
+        for sport_key in sports_to_process:
+            summaries = self.get_scoreboard(sport_key)
+            matches = [
+                game_id for game_id, summary in summaries.items()
+                if query_lower and any(
+                    team['name'] and (team['name'].lower() in query_lower or query_lower in team['name'].lower())
+                    for team in summary['teams']
+                )
+            ]
+            filtered = filtered or bool(matches)
+            for game_id in matches or list(summaries):
+                games[f"{sport_key}_{game_id}"] = summaries[game_id]
+        
+        return {
+            'scrape_timestamp': datetime.now().isoformat(),
+            'total_games': len(games),
+            'sports': sports_to_process,
+            'source': 'scoreboard',
+            'filtered': filtered,
+            'games': games
+        }
+    
+    @staticmethod
+    def current_season() -> int:
+        """Season year of the current football season (a season runs August to February)"""
+        today = datetime.now()
+        return today.year if today.month >= 8 else today.year - 1
+    
+    @classmethod
+    def parse_historical_query(cls, query: str) -> Optional[Dict[str, Optional[int]]]:
+        """
+        {'season', 'season_type', 'week'} for questions about a given week or a past season, else None.
+        season_type is None (any) for whole-season questions that name no part of the season.
+        """
+        query_lower = query.lower()
+        week_match = HISTORICAL_WEEK_PATTERN.search(query_lower)
+        season_match = HISTORICAL_SEASON_PATTERN.search(query_lower)
+        
+        week = int(week_match.group(1)) if week_match else None
+        season = int(next(year for year in season_match.groups() if year)) if season_match else None
+        if season is None and any(phrase in query_lower for phrase in LAST_SEASON_PHRASES):
+            season = cls.current_season() - 1
+        
+        if week is None and (season is None or season >= cls.current_season()):
+            return None
+        
+        # Week numbers restart in each part of the season, so a week needs its season type
+        if any(phrase in query_lower for phrase in POSTSEASON_PHRASES):
+            season_type = POSTSEASON
+        elif any(phrase in query_lower for phrase in PRESEASON_PHRASES):
+            season_type = PRESEASON
+        else:
+            season_type = REGULAR_SEASON if week is not None else None
+        return {
+            'season': season if season is not None else cls.current_season(),
+            'season_type': season_type,
+            'week': week
+        }
+    
+    @staticmethod
+    def _metadata_matches(metadata: Dict[str, Any], query_lower: str) -> bool:
+        """Same team/player matching as find_games_by_query, for a single game's metadata"""
+        names = metadata.get('teams', []) + metadata.get('players', [])
+        return any(name.lower() in query_lower or query_lower in name.lower() for name in names if name)
+    
+    def get_archived_data(self, query_hint: str = "", sport: str = None) -> Optional[Dict[str, Any]]:
+        """
+        Historical counterpart of get_smart_data: games for the week/season named in the
+        query, read straight from the store's archive (never scraped, never cached in memory).
+        Returns None when the query isn't historical or nothing for it has been backfilled.
+        """
+        historical = self.parse_historical_query(query_hint)
+        if not historical or not self.store:
+            return None
+        
+        sports_to_process = [sport] if sport else ['college', 'nfl']
+        query_lower = query_hint.lower().strip()
+        games = {}
+        filtered = False
+        
+        with span('cache.archive_read', sport=sport, **historical) as archive_span:
+            for sport_key in sports_to_process:
+                try:
+                    # Search metadata only, then load full data for the games we keep
+                    candidates = self.store.load_archived_games(
+                        sport_key, historical['season'], historical['week'],
+                        season_type=historical['season_type'], include_data=False
+                    ).get(sport_key, {})
+                    matches = [game_id for game_id, entry in candidates.items()
+                               if self._metadata_matches(entry['metadata'], query_lower)]
+                    filtered = filtered or bool(matches)
+                    selected = (matches or list(candidates))[:self.archive_result_limit]
+                    
+                    archived = self.store.load_archived_games(sport_key, game_ids=selected).get(sport_key, {})
+                    for game_id, entry in archived.items():
+                        games[f"{sport_key}_{game_id}"] = dict(entry['data'], season=entry['season'],
+                                                                season_type=entry['season_type'], week=entry['week'])
+                except Exception as e:
+                    print(f"⚠️  Error reading archived {sport_key} games: {e}")
+            archive_span.set(games=len(games))
+        
+        if not games:
+            return None
+        
+        return {
+            'scrape_timestamp': datetime.now().isoformat(),
+            'total_games': len(games),
+            'sports': sports_to_process,
+            'source': 'archive',
+            'season': historical['season'],
+            'season_type': historical['season_type'],
+            'week': historical['week'],
+            'filtered': filtered,
+            'games': games
+        }
+    
+    def _run_once(self, key: str, work):
+        """Run `work` unless `key` is already running in this process; late callers wait for and share its result"""
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+        
+        if not owner:
+            return future.result()
+        
+        try:
+            result = work()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+    
     def update_individual_game(self, game_id: str, sport: str = 'college') -> Optional[Dict]:
         """Update cache for a specific game by re-scraping that game's boxscore"""
+        lease_name = f"game:{sport}:{game_id}"
+        return self._run_once(lease_name, lambda: self._update_individual_game(game_id, sport, lease_name))
+    
+    def _update_individual_game(self, game_id: str, sport: str, lease_name: str) -> Optional[Dict]:
+        """Re-scrape one game under its lease (one caller per process at a time)"""
+        if not self._acquire_lease(lease_name, self.game_refresh_lease_seconds):
+            print(f"⏭️  {sport.title()} game {game_id} is being re-scraped by another worker - skipping")
+            return None
+        
+        try:
+            return self._scrape_individual_game(game_id, sport)
+        finally:
+            self._release_lease(lease_name)
+    
+    def _scrape_individual_game(self, game_id: str, sport: str) -> Optional[Dict]:
+        """Scrape one boxscore and cache it (caller holds the game lease)"""
         try:
             print(f"🎯 Re-scraping individual {sport} game: {game_id}")
             print(f"   📡 Fetching fresh data from ESPN for {sport} game {game_id}...")
@@ -89,14 +617,15 @@ class SmartESPNCacheManager:
             
             if game_data:
                 # Extract metadata (players and teams)
-                metadata = self._extract_game_metadata(game_data)
+                with span('cache.metadata_extract', sport=sport, game_id=game_id):
+                    metadata = self._extract_game_metadata(game_data)
                 
                 # Update cache with fresh data
-                self.game_cache[sport][game_id] = {
+                self._store_game(sport, game_id, {
                     'data': game_data,
                     'timestamp': datetime.now(),
                     'metadata': metadata
-                }
+                })
                 
                 print(f"✅ {sport.title()} game {game_id} re-scraped and cached successfully")
                 print(f"   📊 Teams: {', '.join(metadata.get('teams', []))}")
@@ -117,7 +646,30 @@ class SmartESPNCacheManager:
             return None
     
     def full_refresh(self, sport: str = 'college') -> Dict[str, Any]:
-        """Perform full dataset refresh for specified sport"""
+        """Perform full dataset refresh for specified sport (one worker at a time with a shared store)"""
+        lease_name = f"refresh:{sport}"
+        return self._run_once(lease_name, lambda: self._leased_full_refresh(sport, lease_name))
+    
+    def _leased_full_refresh(self, sport: str, lease_name: str) -> Dict[str, Any]:
+        """Full refresh under the sport's lease (one caller per process at a time)"""
+        if not self._acquire_lease(lease_name, self.full_refresh_lease_seconds):
+            print(f"⏭️  Another worker is refreshing {sport} - serving shared cache")
+            return {}
+        
+        try:
+            with espn_trigger('full_refresh'), span('cache.full_refresh', sport=sport) as refresh_span:
+                updated_games = self._full_refresh(sport, lease_name)
+                refresh_span.set(games_updated=len(updated_games))
+                return updated_games
+        finally:
+            self._release_lease(lease_name)
+    
+    def _full_refresh(self, sport: str, lease_name: str = None) -> Dict[str, Any]:
+        """
+        Scrape the scoreboard and every game for a sport (caller holds the refresh lease).
+        The lease is renewed before each game, so a refresh slowed down by the rate limiter
+        never outlives it; if another worker has taken it over, this refresh stops.
+        """
         print(f"🔄 Performing full {sport} dataset refresh...")
         
         # Get current game IDs for the sport
@@ -131,222 +683,322 @@ class SmartESPNCacheManager:
         # Update all games
         updated_games = {}
         for game_id in current_game_ids:
+            if lease_name and not self._acquire_lease(lease_name, self.full_refresh_lease_seconds):
+                print(f"⏭️  Lost the {sport} refresh lease to another worker - stopping after {len(updated_games)} games")
+                return updated_games
             game_data = self.update_individual_game(game_id, sport)
             if game_data:
                 updated_games[game_id] = game_data
         
+        # ESPN started failing part-way through: keep serving what we have and retry later
+        if circuit_breaker.is_open():
+            print(f"🚧 ESPN unavailable during {sport} refresh - {len(updated_games)} games updated, keeping stale data")
+            return updated_games
+        
         # Update metadata
         self.all_game_ids[sport] = set(current_game_ids)
         self.full_dataset_timestamp[sport] = datetime.now()
         
+        if self.store:
+            try:
+                self.store.save_dataset(sport, self.full_dataset_timestamp[sport], self.all_game_ids[sport])
+            except Exception as e:
+                print(f"⚠️  Error persisting {sport} refresh state: {e}")
+        
         print(f"✅ Full {sport} refresh complete: {len(updated_games)} games updated")
         return updated_games
     
     def _extract_game_metadata(self, game_data: Dict) -> Dict[str, Any]:
         """Extract metadata (teams and players) from game data"""
-        metadata = {
-            'teams': [],
-            'players': [],
-            'game_id': game_data.get('game_id', ''),
-            'status': {}
-        }
+        return extract_game_metadata(game_data)
+    
+    def find_games_by_query(self, query: str, sport: str = None) -> Dict[str, List[str]]:
+        """Find games that match the query (teams or players) across sports"""
+        query_lower = query.lower().strip()
+        matching_games = {'college': [], 'nfl': []}
         
-        try:
-            # Extract teams from quarter_scores (most reliable)
-            game_info = game_data.get('game_info', {})
-            quarter_scores = game_info.get('quarter_scores', {})
-            if quarter_scores:
-                metadata['teams'] = list(quarter_scores.keys())
+        # Snapshot: refreshes on other threads add and evict games while we search
+        for sport_key, game_id, game_entry in self.get_cached_games(sport):
+            metadata = game_entry.get('metadata', {})
             
-            # Extract game status
-            game_status = game_info.get('game_status', {})
-            if game_status:
-                metadata['status'] = {
-                    'quarter': game_status.get('quarter', ''),
-                    'time_remaining': game_status.get('time_remaining', '')
-                }
+            # Check teams
+            teams = metadata.get('teams', [])
+            for team in teams:
+                if team.lower() in query_lower or query_lower in team.lower():
+                    if game_id not in matching_games[sport_key]:
+                        matching_games[sport_key].append(game_id)
             
-            # Extract all players from team stats
-            teams = game_data.get('teams', {})
-            all_players = []
+            # Check players
+            players = metadata.get('players', [])
+            for player in players:
+                if player.lower() in query_lower or query_lower in player.lower():
+                    if game_id not in matching_games[sport_key]:
+                        matching_games[sport_key].append(game_id)
+        
+        return matching_games
+    
+    def get_cached_games(self, sport: str = None) -> List[tuple]:
+        """Snapshot of cached (sport, game_id, entry) tuples without triggering any scraping"""
+        sports_to_list = [sport] if sport else ['college', 'nfl']
+        snapshot = []
+        for sport_key in sports_to_list:
+            for game_id, game_entry in list(self.game_cache.get(sport_key, {}).items()):
+                snapshot.append((sport_key, game_id, game_entry))
+        return snapshot
+    
+    def get_cached_game(self, game_id: str, sport: str) -> Optional[Dict]:
+        """Return the cache entry for a single game, or None if it isn't cached"""
+        return self.game_cache.get(sport, {}).get(game_id)
+    
+    def find_player_stats(self, player_id: str) -> List[Dict[str, Any]]:
+        """Collect every cached stat line for an ESPN player ID across games and sports"""
+        stat_lines = []
+        for sport_key, game_id, game_entry in self.get_cached_games():
+            if player_id not in game_entry.get('metadata', {}).get('player_ids', []):
+                continue
             
+            teams = game_entry.get('data', {}).get('teams', {})
             for team_name, team_data in teams.items():
-                # Check all stat categories (passing, rushing, receiving, etc.)
                 for stat_category, stat_data in team_data.items():
-                    if isinstance(stat_data, dict) and 'players' in stat_data:
-                        players = stat_data['players']
-                        
-                        for player in players:
-                            player_name = player.get('name', '').strip()
-                            if player_name and player_name not in all_players:
-                                all_players.append(player_name)
-            
-            metadata['players'] = all_players
-            
-        except Exception as e:
-            print(f"⚠️  Error extracting metadata: {e}")
-        
-        return metadata
+                    if not isinstance(stat_data, dict):
+                        continue
+                    for player in stat_data.get('players', []):
+                        if player.get('player_id') == player_id:
+                            stat_lines.append({
+                                'sport': sport_key,
+                                'game_id': game_id,
+                                'team': team_name,
+                                'category': stat_category,
+                                'player': player,
+                                'cached_at': game_entry['timestamp'].isoformat()
+                            })
+        return stat_lines
     
-    def find_games_by_query(self, query: str, sport: str = None) -> Dict[str, List[str]]:
-        """Find games that match the query (teams or players) across sports"""
-        query_lower = query.lower().strip()
-        matching_games = {'college': [], 'nfl': []}
+    def _process_sport(self, sport: str, query_hint: str) -> Dict[str, Dict]:
+        """Refresh one sport's dataset and its query-matched or stale games; returns the games it re-scraped"""
+        updated_games = {}
         
-        # Search specified sport or all sports
-        sports_to_search = [sport] if sport else ['college', 'nfl']
+        print(f"\n🏈 Processing {sport.upper()} data...")
         
-        for sport_key in sports_to_search:
-            if sport_key not in self.game_cache:
-                continue
-                
-            for game_id, game_entry in self.game_cache[sport_key].items():
-                metadata = game_entry.get('metadata', {})
-                
-                # Check teams
-                teams = metadata.get('teams', [])
-                for team in teams:
-                    if team.lower() in query_lower or query_lower in team.lower():
-                        if game_id not in matching_games[sport_key]:
-                            matching_games[sport_key].append(game_id)
-                
-                # Check players
-                players = metadata.get('players', [])
-                for player in players:
-                    if player.lower() in query_lower or query_lower in player.lower():
-                        if game_id not in matching_games[sport_key]:
-                            matching_games[sport_key].append(game_id)
+        # Pick up anything other workers scraped since we last looked
+        self.sync_from_store(sport)
         
-        return matching_games
+        # While ESPN is failing, answer from the (possibly stale) cache without scraping
+        if circuit_breaker.is_open():
+            print(f"🚧 ESPN circuit open - serving cached {sport} data")
+            return updated_games
+        
+        # Check if full dataset needs refresh for this sport
+        if not self.is_full_dataset_fresh(sport):
+            print(f"🔄 {sport.title()} dataset expired - performing full refresh")
+            refreshed_games = self.full_refresh(sport)
+            for game_id, game_data in refreshed_games.items():
+                updated_games[f"{sport}_{game_id}"] = game_data
+        else:
+            print(f"📋 {sport.title()} dataset is fresh")
+        
+        # Find games that match the query (teams or players)
+        if query_hint:
+            matching_games = self.find_games_by_query(query_hint, sport)
+            sport_matches = matching_games.get(sport, [])
+            print(f"🔍 Query '{query_hint}' matches {len(sport_matches)} {sport} games: {sport_matches}")
+            
+            # Update matching games if they're stale
+            if sport_matches:
+                print(f"🎯 Found {len(sport_matches)} {sport} games matching query - checking freshness...")
+                for game_id in sport_matches:
+                    if not self.is_individual_game_fresh(game_id, sport):
+                        print(f"🔄 {sport.title()} game {game_id} is stale (>2 min) - re-scraping...")
+                        with espn_trigger('query_match'):
+                            updated_data = self.update_individual_game(game_id, sport)
+                        if updated_data:
+                            updated_games[f"{sport}_{game_id}"] = updated_data
+                    else:
+                        print(f"✅ {sport.title()} game {game_id} is fresh (<2 min) - using cached data")
+        
+        # If no specific matches, update a few stale games to keep data fresh
+        if not query_hint or not matching_games.get(sport, []):
+            print(f"🔍 Checking for any stale {sport} games to refresh...")
+            stale_games = [game_id for game_id in list(self.game_cache[sport]) 
+                          if not self.is_individual_game_fresh(game_id, sport)]
+            if stale_games:
+                print(f"🔄 Found {len(stale_games)} stale {sport} games, re-scraping first 2...")
+                # Update a few stale games to keep data fresh
+                for game_id in stale_games[:2]:  # Limit to 2 per sport
+                    with espn_trigger('stale_sweep'):
+                        updated_data = self.update_individual_game(game_id, sport)
+                    if updated_data:
+                        updated_games[f"{sport}_{game_id}"] = updated_data
+            else:
+                print(f"✅ All {sport} games are fresh - no re-scraping needed")
+        
+        return updated_games
     
-    def get_smart_data(self, query_hint: str = "", sport: str = None) -> Dict[str, Any]:
+    def _process_sport_in_span(self, sport: str, query_hint: str, parent_span) -> Dict[str, Dict]:
+        """_process_sport on a pool thread, traced under the request that submitted it"""
+        with tracer.attach(parent_span), span('cache.sport_refresh', sport=sport):
+            return self._process_sport(sport, query_hint)
+    
+    def _submit_sport_refresh(self, sport: str, query_hint: str, parent_span) -> Optional[Future]:
+        """
+        Start (or join) the background refresh of one sport for a query:
+        1. A refresh already queued or running for the same sport and query is shared
+        2. With max_pending_refreshes outstanding, join any refresh of the sport instead
+        3. Returns None when there is nothing to join and no room - callers serve the cache
+        """
+        key = (sport, ' '.join(query_hint.lower().split()))
+        with self._inflight_lock:
+            future = self._sport_refreshes.get(key)
+            if future:
+                return future
+            if len(self._sport_refreshes) >= self.max_pending_refreshes:
+                return next((f for (sport_key, _), f in self._sport_refreshes.items() if sport_key == sport), None)
+            
+            future = self._sport_executor.submit(self._process_sport_in_span, sport, query_hint, parent_span)
+            self._sport_refreshes[key] = future
+        
+        def forget(done_future):
+            with self._inflight_lock:
+                if self._sport_refreshes.get(key) is done_future:
+                    del self._sport_refreshes[key]
+        future.add_done_callback(forget)
+        return future
+    
+    def get_smart_data(self, query_hint: str = "", sport: str = None,
+                       deadline_seconds: Optional[float] = None) -> Dict[str, Any]:
         """
         Smart data retrieval based on query context
         
         Args:
             query_hint: User's query to help identify which games to prioritize
             sport: Specific sport to focus on ('college', 'nfl', or None for both)
+            deadline_seconds: Latency budget; refreshes still running after it finish in the background.
+                A sport with nothing cached at all is waited for up to smart_data_deadline_seconds
+                instead, since there is no stale data to fall back on
         
         Returns:
-            Complete dataset with smart caching
+            Complete dataset with smart caching, plus 'freshness' (data age, stale games,
+            sports still refreshing)
         """
         # Determine which sports to process
         sports_to_process = [sport] if sport else ['college', 'nfl']
         all_updated_games = {}
+        deadline = self.smart_data_deadline_seconds if deadline_seconds is None else deadline_seconds
         
+        # Sports share no state, so refresh them side by side and wait for the slower one -
+        # but only until the deadline; anything later keeps running and lands in the cache
+        started = time.monotonic()
+        parent_span = tracer.current_span()
+        futures = {}
         for sport_key in sports_to_process:
-            print(f"\n🏈 Processing {sport_key.upper()} data...")
-            
-            # Check if full dataset needs refresh for this sport
-            if not self.is_full_dataset_fresh(sport_key):
-                print(f"🔄 {sport_key.title()} dataset expired - performing full refresh")
-                updated_games = self.full_refresh(sport_key)
-                for game_id, game_data in updated_games.items():
-                    all_updated_games[f"{sport_key}_{game_id}"] = game_data
+            future = self._submit_sport_refresh(sport_key, query_hint, parent_span)
+            if future:
+                futures[future] = sport_key
             else:
-                print(f"📋 {sport_key.title()} dataset is fresh")
-            
-            # Find games that match the query (teams or players)
-            if query_hint:
-                matching_games = self.find_games_by_query(query_hint, sport_key)
-                sport_matches = matching_games.get(sport_key, [])
-                print(f"🔍 Query '{query_hint}' matches {len(sport_matches)} {sport_key} games: {sport_matches}")
-                
-                # Update matching games if they're stale
-                if sport_matches:
-                    print(f"🎯 Found {len(sport_matches)} {sport_key} games matching query - checking freshness...")
-                    for game_id in sport_matches:
-                        if not self.is_individual_game_fresh(game_id, sport_key):
-                            print(f"🔄 {sport_key.title()} game {game_id} is stale (>2 min) - re-scraping...")
-                            updated_data = self.update_individual_game(game_id, sport_key)
-                            if updated_data:
-                                all_updated_games[f"{sport_key}_{game_id}"] = updated_data
-                        else:
-                            print(f"✅ {sport_key.title()} game {game_id} is fresh (<2 min) - using cached data")
-            
-            # If no specific matches, update a few stale games to keep data fresh
-            if not query_hint or not matching_games.get(sport_key, []):
-                print(f"🔍 Checking for any stale {sport_key} games to refresh...")
-                stale_games = [game_id for game_id in self.game_cache[sport_key].keys() 
-                              if not self.is_individual_game_fresh(game_id, sport_key)]
-                if stale_games:
-                    print(f"🔄 Found {len(stale_games)} stale {sport_key} games, re-scraping first 2...")
-                    # Update a few stale games to keep data fresh
-                    for game_id in stale_games[:2]:  # Limit to 2 per sport
-                        updated_data = self.update_individual_game(game_id, sport_key)
-                        if updated_data:
-                            all_updated_games[f"{sport_key}_{game_id}"] = updated_data
-                else:
-                    print(f"✅ All {sport_key} games are fresh - no re-scraping needed")
+                print(f"⏳ {sport_key.title()} refresh queue full - serving cached data")
+        done, not_done = wait(futures, timeout=deadline)
         
-        # Compile final dataset
-        total_games = sum(len(self.game_cache[sport_key]) for sport_key in sports_to_process)
+        # A cold sport has nothing to serve yet, so keep waiting for it up to the default deadline
+        cold = [future for future in not_done if not self.game_cache[futures[future]]]
+        remaining = self.smart_data_deadline_seconds - (time.monotonic() - started)
+        if cold and remaining > 0:
+            print(f"🧊 No cached {', '.join(futures[future] for future in cold)} games - waiting for the refresh")
+            done_cold, _ = wait(cold, timeout=remaining)
+            done |= done_cold
+            not_done -= done_cold
+        for future in done:
+            try:
+                all_updated_games.update(future.result())
+            except Exception as e:
+                print(f"⚠️  Error processing {futures[future]} data: {e}")
+        refreshing = sorted(futures[future] for future in not_done)
+        for sport_key in refreshing:
+            print(f"⏱️  {sport_key.title()} refresh still running after {deadline}s - serving cached data")
+        
+        # Compile final dataset (total_games counts the games actually included below)
         final_dataset = {
             'scrape_timestamp': datetime.now().isoformat(),
-            'total_games': total_games,
+            'total_games': 0,
             'sports': sports_to_process,
+            'refreshing': refreshing,
             'games': {}
         }
         
-        # Add all cached games from specified sports
+        # Add all cached games from specified sports (snapshot: a refresh past the deadline may still be writing)
         for sport_key in sports_to_process:
-            for game_id, game_entry in self.game_cache[sport_key].items():
+            for game_id, game_entry in list(self.game_cache[sport_key].items()):
                 if 'data' in game_entry:
                     final_dataset['games'][f"{sport_key}_{game_id}"] = game_entry['data']
         
+        final_dataset['total_games'] = len(final_dataset['games'])
+        final_dataset['freshness'] = self.describe_freshness(final_dataset)
         return final_dataset
     
+    def describe_freshness(self, dataset: Dict[str, Any]) -> Dict[str, Any]:
+        """Age of the cached games in a get_smart_data dataset (or a filtered copy) and which are stale"""
+        now = datetime.now()
+        ages = []
+        stale_games = []
+        for game_key in dataset.get('games', {}):
+            sport_key, game_id = game_key.split('_', 1)
+            game_entry = self.game_cache.get(sport_key, {}).get(game_id)
+            if not game_entry:
+                continue
+            ages.append((now - game_entry['timestamp']).total_seconds())
+            if not self.is_individual_game_fresh(game_id, sport_key):
+                stale_games.append(game_key)
+        
+        return {
+            'newest_age_seconds': round(min(ages), 1) if ages else None,
+            'oldest_age_seconds': round(max(ages), 1) if ages else None,
+            'stale_games': stale_games,
+            'refreshing': dataset.get('refreshing', [])
+        }
+    
     
     def get_cache_status(self) -> Dict[str, Any]:
-        """Get current cache status for debugging"""
-        # Count total players and teams across all games and sports
-        total_players = set()
-        total_teams = set()
-        status = {
-            'college': {
-                'individual_games_cached': len(self.game_cache['college']),
-                'full_dataset_fresh': self.is_full_dataset_fresh('college'),
-                'full_dataset_age_minutes': (
-                    (datetime.now() - self.full_dataset_timestamp['college']).total_seconds() / 60
-                    if self.full_dataset_timestamp['college'] else None
-                ),
-                'fresh_games': sum(1 for game_id in self.game_cache['college'].keys() 
-                                 if self.is_individual_game_fresh(game_id, 'college'))
-            },
-            'nfl': {
-                'individual_games_cached': len(self.game_cache['nfl']),
-                'full_dataset_fresh': self.is_full_dataset_fresh('nfl'),
+        """Get current cache status for debugging (O(1): reads incrementally kept aggregates)"""
+        self._expire_fresh_games()
+        
+        status = {}
+        for sport in ['college', 'nfl']:
+            status[sport] = {
+                'individual_games_cached': len(self.game_cache[sport]),
+                'full_dataset_fresh': self.is_full_dataset_fresh(sport),
                 'full_dataset_age_minutes': (
-                    (datetime.now() - self.full_dataset_timestamp['nfl']).total_seconds() / 60
-                    if self.full_dataset_timestamp['nfl'] else None
+                    (datetime.now() - self.full_dataset_timestamp[sport]).total_seconds() / 60
+                    if self.full_dataset_timestamp[sport] else None
                 ),
-                'fresh_games': sum(1 for game_id in self.game_cache['nfl'].keys() 
-                                 if self.is_individual_game_fresh(game_id, 'nfl'))
+                'fresh_games': len(self._fresh_games[sport]),
+                'scoreboard_games': len(self.scoreboard_cache[sport]['games']),
+                'scoreboard_fresh': self.is_scoreboard_fresh(sport),
+                'memory_bytes': self.cache_bytes[sport],
+                'evictions': self.eviction_count[sport]
             }
-        }
-        
-        # Count players and teams across both sports
-        for sport in ['college', 'nfl']:
-            for game_entry in self.game_cache[sport].values():
-                metadata = game_entry.get('metadata', {})
-                total_players.update(metadata.get('players', []))
-                total_teams.update(metadata.get('teams', []))
         
         status['combined'] = {
             'total_games_cached': len(self.game_cache['college']) + len(self.game_cache['nfl']),
-            'total_players_tracked': len(total_players),
-            'total_teams_tracked': len(total_teams),
-            'fresh_games': status['college']['fresh_games'] + status['nfl']['fresh_games']
+            'total_players_tracked': len(self._player_refcounts),
+            'total_teams_tracked': len(self._team_refcounts),
+            'fresh_games': status['college']['fresh_games'] + status['nfl']['fresh_games'],
+            'memory_bytes': self.cache_bytes['college'] + self.cache_bytes['nfl'],
+            'max_memory_bytes': self.max_cache_bytes,
+            'evictions': self.eviction_count['college'] + self.eviction_count['nfl']
         }
         
+        # ESPN requests, bytes, 304s, errors and parse time per sport and trigger
+        status['espn_load'] = load_accounting.summary()
+        status['espn_traffic'] = traffic_status()
+        
         return status
 
 # Global instance
-smart_cache = SmartESPNCacheManager()
+smart_cache = SmartESPNCacheManager(store=create_default_store())
 
-def get_smart_espn_data(query_hint: str = "", sport: str = None) -> Dict[str, Any]:
+def get_smart_espn_data(query_hint: str = "", sport: str = None,
+                        deadline_seconds: Optional[float] = None) -> Dict[str, Any]:
     """Main function to get ESPN data with smart caching"""
-    return smart_cache.get_smart_data(query_hint, sport)
+    return smart_cache.get_smart_data(query_hint, sport, deadline_seconds)
 
 if __name__ == "__main__":
     # Test the smart cache
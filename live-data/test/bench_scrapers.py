@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Offline scraper benchmark against the replayed ESPN fixture corpus.
+
+Measures, per sport:
+  - parse: BeautifulSoup + extraction on fixture HTML already in memory (p50/p99 latency)
+  - scrape: scrape_comprehensive_boxscore / scrape_comprehensive_nfl_boxscore via the replay server
+  - full_refresh: SmartESPNCacheManager.full_refresh (scoreboard + every boxscore + metadata)
+and reports pages/s, latency percentiles and tracemalloc peak memory for each phase.
+
+Usage:
+    python test/bench_scrapers.py [--corpus DIR] [--copies N] [--iterations N] [--json OUT]
+"""
+import argparse
+import contextlib
+import json
+import math
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+TEST_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(TEST_DIR.parent))
+sys.path.insert(0, str(TEST_DIR))
+
+# Benchmarks must never touch the persistent cache or the network
+os.environ['ESPN_CACHE_DB'] = 'none'
+# Measure the scrapers, not the outbound ESPN rate limit (override to benchmark with it)
+os.environ.setdefault('ESPN_MAX_RPS', '1000')
+os.environ.setdefault('ESPN_BURST', '1000')
+
+import espn_fixtures
+import espn_http
+import col_full_test
+import nfl_scraper
+from smart_cache_manager import SmartESPNCacheManager
+
+PARSERS = {
+    'college': col_full_test.parse_comprehensive_boxscore,
+    'nfl': nfl_scraper.parse_comprehensive_nfl_boxscore,
+}
+SCRAPERS = {
+    'college': col_full_test.scrape_comprehensive_boxscore,
+    'nfl': nfl_scraper.scrape_comprehensive_nfl_boxscore,
+}
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of a list of samples"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+def summarize(name, sport, latencies, pages, elapsed, peak_bytes):
+    return {
+        'phase': name,
+        'sport': sport,
+        'pages': pages,
+        'pages_per_second': round(pages / elapsed, 2) if elapsed else 0.0,
+        'p50_ms': round(percentile(latencies, 50) * 1000, 2),
+        'p99_ms': round(percentile(latencies, 99) * 1000, 2),
+        'peak_memory_mb': round(peak_bytes / 1024 / 1024, 2),
+        'elapsed_seconds': round(elapsed, 3),
+    }
+
+def measure(fn):
+    """
+    Run fn twice: once untraced for timing, once under tracemalloc for peak memory
+    (tracing slows allocation-heavy parsing several-fold, so it must not skew latencies).
+    Returns (result of the timed run, elapsed_seconds, peak_bytes).
+    Conditional-request bodies are dropped first so every run pays for full page downloads.
+    """
+    espn_http.body_cache.clear()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+
+    espn_http.body_cache.clear()
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, elapsed, peak
+
+def boxscore_fixtures(corpus_dir, sport):
+    """(game_id, html bytes) for every boxscore fixture of a sport"""
+    boxscore_dir = Path(corpus_dir) / espn_fixtures.SPORT_PATHS[sport] / 'boxscore' / 'gameId'
+    return [(path.stem, path.read_bytes()) for path in sorted(boxscore_dir.glob('*.html'))]
+
+def bench_parse(corpus_dir, sport, iterations):
+    fixtures = boxscore_fixtures(corpus_dir, sport)
+    parse = PARSERS[sport]
+
+    def run():
+        latencies = []
+        for _ in range(iterations):
+            for game_id, html in fixtures:
+                start = time.perf_counter()
+                parse(game_id, html)
+                latencies.append(time.perf_counter() - start)
+        return latencies
+
+    latencies, elapsed, peak = measure(run)
+    return summarize('parse', sport, latencies, len(latencies), elapsed, peak)
+
+def bench_scrape(corpus_dir, sport):
+    game_ids = [game_id for game_id, _ in boxscore_fixtures(corpus_dir, sport)]
+    scrape = SCRAPERS[sport]
+
+    def run():
+        latencies = []
+        for game_id in game_ids:
+            start = time.perf_counter()
+            if scrape(game_id) is None:
+                raise RuntimeError(f"Replay of {sport} game {game_id} failed")
+            latencies.append(time.perf_counter() - start)
+        return latencies
+
+    latencies, elapsed, peak = measure(run)
+    return summarize('scrape', sport, latencies, len(latencies), elapsed, peak)
+
+def bench_full_refresh(sport):
+    # Fresh manager per run so both passes scrape every game
+    updated, elapsed, peak = measure(lambda: SmartESPNCacheManager(store=None).full_refresh(sport))
+    # Scoreboard page + one boxscore page per game
+    pages = len(updated) + 1
+    return summarize('full_refresh', sport, [elapsed], pages, elapsed, peak)
+
+def print_table(results):
+    header = f"{'phase':<13}{'sport':<9}{'pages':>7}{'pages/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'peak MB':>10}"
+    print("\n" + header)
+    print("-" * len(header))
+    for r in results:
+        print(f"{r['phase']:<13}{r['sport']:<9}{r['pages']:>7}{r['pages_per_second']:>10}"
+              f"{r['p50_ms']:>10}{r['p99_ms']:>10}{r['peak_memory_mb']:>10}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--corpus', default=str(espn_fixtures.DEFAULT_CORPUS), help='Fixture corpus directory')
+    parser.add_argument('--copies', type=int, default=5, help='Copies per saved game when synthesizing a missing corpus')
+    parser.add_argument('--iterations', type=int, default=5, help='Parse passes over the corpus')
+    parser.add_argument('--sport', choices=list(PARSERS), help='Benchmark only one sport')
+    parser.add_argument('--json', help='Also write results to this JSON file')
+    args = parser.parse_args()
+
+    espn_fixtures.ensure_corpus(args.corpus, args.copies)
+    server, base_url = espn_fixtures.start_replay_server(args.corpus)
+    col_full_test.ESPN_BASE_URL = base_url
+    nfl_scraper.ESPN_BASE_URL = base_url
+    print(f"📼 Replaying {args.corpus} at {base_url}")
+
+    results = []
+    sports = [args.sport] if args.sport else list(PARSERS)
+    try:
+        for sport in sports:
+            results.append(bench_parse(args.corpus, sport, args.iterations))
+            results.append(bench_scrape(args.corpus, sport))
+            # Keep the cache manager's per-game progress output out of the report
+            with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                results.append(bench_full_refresh(sport))
+    finally:
+        server.shutdown()
+
+    print_table(results)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n💾 Results written to {args.json}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+ESPN fixture corpus: capture, synthesize and replay scoreboard/boxscore HTML
+so the scrapers can be exercised and benchmarked without network access.
+
+Corpus layout mirrors ESPN URL paths with the '_' segments dropped:
+    college-football/scoreboard.html
+    college-football/boxscore/gameId/401754546.html
+    nfl/scoreboard.html
+    nfl/boxscore/gameId/401772936.html
+
+Usage:
+    python test/espn_fixtures.py capture [--corpus DIR] [--sport college|nfl]
+    python test/espn_fixtures.py synthesize [--corpus DIR] [--copies N]
+    python test/espn_fixtures.py serve [--corpus DIR] [--port 8765]
+"""
+import argparse
+import glob
+import hashlib
+import html
+import json
+import sys
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+
+TEST_DIR = Path(__file__).resolve().parent
+LIVE_DATA_DIR = TEST_DIR.parent
+DEFAULT_CORPUS = TEST_DIR / 'fixtures' / 'espn'
+SPORT_PATHS = {'college': 'college-football', 'nfl': 'nfl'}
+
+sys.path.insert(0, str(LIVE_DATA_DIR))
+
+def fixture_path(corpus_dir, url_path):
+    """Map an ESPN URL path (e.g. /nfl/boxscore/_/gameId/1) to its corpus file"""
+    parts = [part for part in url_path.split('?')[0].strip('/').split('/') if part and part != '_']
+    return Path(corpus_dir).joinpath(*parts).with_suffix('.html')
+
+# --- Capture -----------------------------------------------------------------
+
+def capture_corpus(corpus_dir, sports):
+    """Download live scoreboard and boxscore pages from ESPN into the corpus"""
+    import requests
+
+    headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+    import col_full_test
+    import nfl_scraper
+
+    for sport in sports:
+        sport_path = SPORT_PATHS[sport]
+        parse_ids = nfl_scraper.parse_nfl_game_ids_from_scoreboard if sport == 'nfl' else col_full_test.parse_game_ids_from_scoreboard
+
+        scoreboard_path = f"/{sport_path}/scoreboard"
+        response = requests.get(f"https://www.espn.com{scoreboard_path}", headers=headers)
+        response.raise_for_status()
+        _write_fixture(corpus_dir, scoreboard_path, response.content)
+
+        game_ids = parse_ids(response.content)
+        print(f"📥 {sport}: scoreboard lists {len(game_ids)} games")
+        for game_id in game_ids:
+            boxscore_path = f"/{sport_path}/boxscore/_/gameId/{game_id}"
+            response = requests.get(f"https://www.espn.com{boxscore_path}", headers=headers)
+            if response.ok:
+                _write_fixture(corpus_dir, boxscore_path, response.content)
+            else:
+                print(f"⚠️  {sport} game {game_id}: HTTP {response.status_code}")
+
+def _write_fixture(corpus_dir, url_path, content):
+    path = fixture_path(corpus_dir, url_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content if isinstance(content, bytes) else content.encode('utf-8'))
+
+# --- Synthesize --------------------------------------------------------------
+
+def _esc(value):
+    return html.escape(str(value), quote=True)
+
+def render_boxscore_html(game_data, sport_path):
+    """Render scraped game data back into the markup the ESPN boxscore parsers read"""
+    game_info = game_data.get('game_info', {})
+    out = ['<html><body><div class="Gamestrip__Container">']
+
+    for team in game_info.get('teams', []):
+        out.append('<div class="mLASH VZTD rEPuv jIRH bmjsw">')
+        if any(key in team for key in ('full_name', 'short_name', 'abbreviation', 'team_id')):
+            team_id = team.get('team_id', '0')
+            out.append(f'<a data-clubhouse-uid="s:20~t:{_esc(team_id)}" href="/{sport_path}/team/_/id/{_esc(team_id)}/team">')
+            if 'full_name' in team:
+                out.append(f'<span class="NzyJW NMnSM">{_esc(team["full_name"])}</span>')
+            if 'short_name' in team:
+                out.append(f'<span class="NzyJW SQItX euiGf">{_esc(team["short_name"])}</span>')
+            if 'abbreviation' in team:
+                out.append(f'<span class="HUcap mpjVY">{_esc(team["abbreviation"])}</span>')
+            out.append('</a>')
+        if 'current_score' in team:
+            out.append(f'<div class="mxQbE JFXP VZTD jWGd vSsiS osdYE">{_esc(team["current_score"])}</div>')
+        if 'record' in team:
+            out.append(f'<div class="alYYJ QCELl VZTD FWLyZ duTyi csTyU rBhDC GpQCA tuAKv xTell bmjsw NYdiI fuwnA">{_esc(team["record"])}</div>')
+        out.append('</div>')
+
+    status = game_info.get('game_status', {})
+    if status:
+        out.append('<div class="mLASH VZTD rEPuv jIRH xWwgP YphCQ">')
+        out.append(f'<span class="hsDdd FuEs zRALO">{_esc(status.get("time_remaining", ""))}</span>')
+        out.append(f'<span class="hsDdd FuEs zRALO">{_esc(status.get("quarter", ""))}</span>')
+        out.append('</div>')
+
+    quarter_scores = game_info.get('quarter_scores', {})
+    if quarter_scores:
+        periods = list(next(iter(quarter_scores.values())).keys())
+        out.append('<table data-testid="prism-Table"><thead><tr><th></th>')
+        out.extend(f'<th>{_esc(period)}</th>' for period in periods)
+        out.append('</tr></thead><tbody>')
+        for team_name, scores in quarter_scores.items():
+            out.append(f'<tr><td><a href="/{sport_path}/team/_/id/0">{_esc(team_name)}</a></td>')
+            out.extend(f'<td>{_esc(scores.get(period, ""))}</td>' for period in periods)
+            out.append('</tr>')
+        out.append('</tbody></table>')
+    out.append('</div>')
+
+    out.append('<div class="Boxscore">')
+    categories = []
+    for team_data in game_data.get('teams', {}).values():
+        for category in team_data:
+            if category not in categories:
+                categories.append(category)
+
+    for category in categories:
+        out.append('<div class="Boxscore__Category">')
+        for team_name, team_data in game_data.get('teams', {}).items():
+            if category in team_data:
+                out.append(_render_team_category(team_name, category, team_data[category], sport_path))
+        out.append('</div>')
+    out.append('</div></body></html>')
+    return ''.join(out)
+
+def _render_team_category(team_name, category, stats, sport_path):
+    out = ['<div class="Boxscore__Team">',
+           f'<div class="TeamTitle__Name">{_esc(team_name)} {_esc(category.title())}</div>']
+
+    players = stats.get('players', [])
+    if not players and not stats.get('team_totals'):
+        out.append('<table class="EmptyBoxScore__Table"><tr>')
+        if 'message' in stats:
+            out.append(f'<td class="Empty__Message">{_esc(stats["message"])}</td>')
+        out.append('</tr></table></div>')
+        return ''.join(out)
+
+    headers = list(stats.get('team_totals', {}).keys())
+    for player in players:
+        for header in player.get('stats', {}):
+            if header not in headers:
+                headers.append(header)
+
+    out.append('<div class="ResponsiveTable"><table class="Table Table--fixed-left"><tbody>')
+    for i, player in enumerate(players):
+        out.append(f'<tr data-idx="{i}" class="Table__TR"><td><div class="Boxscore__Athlete">')
+        if 'name' in player:
+            player_url = player.get('player_url') or f"/{sport_path}/player/_/id/{player.get('player_id', '0')}/player"
+            out.append(f'<a class="Boxscore__Athlete_Name" href="{_esc(player_url)}">{_esc(player["name"])}</a>')
+        if 'jersey' in player:
+            out.append(f'<span class="Boxscore__Athlete_Jersey">#{_esc(player["jersey"])}</span>')
+        out.append('</div></td></tr>')
+    out.append(f'<tr data-idx="{len(players)}" class="Boxscore__Totals Table__TR"><td>TEAM</td></tr>')
+    out.append('</tbody></table>')
+
+    out.append('<div class="Table__Scroller"><table class="Table"><thead><tr class="Table__sub-header">')
+    out.extend(f'<th>{_esc(header)}</th>' for header in headers)
+    out.append('</tr></thead><tbody>')
+    for player in players:
+        player_stats = player.get('stats', {})
+        out.append('<tr class="Table__TR Table__TR--sm Table__even">')
+        out.extend(f'<td class="Table__TD">{_esc(player_stats.get(header, ""))}</td>' for header in headers)
+        out.append('</tr>')
+    totals = stats.get('team_totals', {})
+    if totals:
+        out.append('<tr class="Boxscore__Totals Table__TR Table__TR--sm Table__even">')
+        out.extend(f'<td class="Table__TD">{_esc(totals.get(header, ""))}</td>' for header in headers)
+        out.append('</tr>')
+    out.append('</tbody></table></div></div></div>')
+    return ''.join(out)
+
+def render_scoreboard_html(games, sport_path):
+    """Render a scoreboard page with a score card and boxscore link for every game"""
+    out = ['<html><body><div class="Scoreboard__Events">']
+    for game_id, game_data in games.items():
+        game_info = game_data.get('game_info', {})
+        status = game_info.get('game_status', {})
+        status_text = ' - '.join(part for part in (status.get('time_remaining'), status.get('quarter')) if part)
+        totals = {team: scores.get('T', '') for team, scores in game_info.get('quarter_scores', {}).items()}
+        top_score = max((int(score) for score in totals.values() if score.isdigit()), default=None)
+
+        out.append(f'<section class="Scoreboard bg-clr-white flex" id="{_esc(game_id)}">')
+        out.append(f'<div class="ScoreCell__Time ScoreboardScoreCell__Time h9">{_esc(status_text)}</div>')
+        out.append('<ul class="ScoreboardScoreCell__Competitors">')
+        for i, (team, score) in enumerate(totals.items()):
+            classes = ['ScoreboardScoreCell__Item', 'ScoreboardScoreCell__Item--home' if i else 'ScoreboardScoreCell__Item--away']
+            if status_text.startswith('Final') and score.isdigit() and int(score) == top_score:
+                classes.append('ScoreboardScoreCell__Item--winner')
+            out.append(f'<li class="{" ".join(classes)}">')
+            out.append(f'<div class="ScoreCell__TeamName ScoreCell__TeamName--shortDisplayName">{_esc(team)}</div>')
+            out.append(f'<div class="ScoreCell__Score h4">{_esc(score)}</div>')
+            out.append('</li>')
+        out.append('</ul>')
+        out.append(f'<a href="/{sport_path}/boxscore/_/gameId/{_esc(game_id)}">Box Score</a>')
+        out.append('</section>')
+    out.append('</div></body></html>')
+    return ''.join(out)
+
+def load_saved_games():
+    """Every game stored in the scraped JSON files under test/, keyed by game ID"""
+    games = {}
+    for path in sorted(glob.glob(str(TEST_DIR / 'all_college_football_games_*.json'))):
+        with open(path) as f:
+            games.update(json.load(f).get('games', {}))
+    comprehensive = TEST_DIR / 'comprehensive_boxscore_401754546.json'
+    if comprehensive.exists():
+        with open(comprehensive) as f:
+            game = json.load(f)
+        games[game['game_id']] = game
+    return games
+
+def synthesize_corpus(corpus_dir, copies=1):
+    """
+    Build a corpus from the saved JSON scrapes in test/ (no network needed).
+    NFL pages reuse the college games - the two parsers read identical markup.
+    `copies` repeats every game under new IDs to get a larger benchmark corpus.
+    """
+    saved_games = load_saved_games()
+    for sport, sport_path in SPORT_PATHS.items():
+        games = {}
+        for copy in range(copies):
+            for game_id, game_data in saved_games.items():
+                synthetic_id = game_id if copy == 0 else f"{game_id}{copy:03d}"
+                games[synthetic_id] = dict(game_data, game_id=synthetic_id)
+
+        _write_fixture(corpus_dir, f"/{sport_path}/scoreboard", render_scoreboard_html(games, sport_path))
+        for game_id, game_data in games.items():
+            _write_fixture(corpus_dir, f"/{sport_path}/boxscore/_/gameId/{game_id}",
+                           render_boxscore_html(game_data, sport_path))
+        print(f"🧪 Synthesized {len(games)} {sport} games into {corpus_dir}")
+
+# --- Replay ------------------------------------------------------------------
+
+def _make_handler(corpus_dir):
+    class FixtureHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            path = fixture_path(corpus_dir, self.path)
+            if not path.is_file():
+                self.send_error(404, f"No fixture for {self.path}")
+                return
+            body = path.read_bytes()
+            etag = f'"{hashlib.sha1(body).hexdigest()}"'
+            if self.headers.get('If-None-Match') == etag:
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('ETag', etag)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return FixtureHandler
+
+def start_replay_server(corpus_dir=DEFAULT_CORPUS, port=0):
+    """Serve the corpus on localhost in a background thread; returns (server, base_url)"""
+    server = ThreadingHTTPServer(('127.0.0.1', port), _make_handler(corpus_dir))
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, name='espn-replay', daemon=True)
+    thread.start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+def ensure_corpus(corpus_dir=DEFAULT_CORPUS, copies=1):
+    """Synthesize the corpus if it doesn't exist yet"""
+    if not (Path(corpus_dir) / 'college-football' / 'scoreboard.html').exists():
+        synthesize_corpus(corpus_dir, copies)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('command', choices=['capture', 'synthesize', 'serve'])
+    parser.add_argument('--corpus', default=str(DEFAULT_CORPUS), help='Fixture corpus directory')
+    parser.add_argument('--sport', choices=list(SPORT_PATHS), help='Capture only one sport')
+    parser.add_argument('--copies', type=int, default=1, help='Synthesize: repeat each saved game N times')
+    parser.add_argument('--port', type=int, default=8765, help='Serve: port to listen on')
+    args = parser.parse_args()
+
+    if args.command == 'capture':
+        capture_corpus(args.corpus, [args.sport] if args.sport else list(SPORT_PATHS))
+    elif args.command == 'synthesize':
+        synthesize_corpus(args.corpus, args.copies)
+    else:
+        ensure_corpus(args.corpus)
+        server, base_url = start_replay_server(args.corpus, args.port)
+        print(f"📼 Replaying {args.corpus} at {base_url}")
+        print(f"   Point the scrapers at it with: export ESPN_BASE_URL={base_url}")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            server.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+End-to-end load test for /api/chat and /api/defensive-coach.
+
+Starts api_server.py as a subprocess wired to two local stand-ins:
+  - the replayed ESPN fixture corpus (test/espn_fixtures.py) via ESPN_BASE_URL
+  - the stub OpenAI API (test/stub_openai.py) via OPENAI_BASE_URL
+then drives concurrent chat and defensive-coach traffic and reports throughput plus
+p50/p95/p99 latency overall and per stage (espn, filter, prompt_build, openai) using
+the timing breakdown each response carries in stats.timing.
+
+Every defensive-coach request posts the same formation, so the coach answer cache is
+off by default (and the formation library kept in memory); with --coach-cache it stays
+on and answers served from it are reported as a separate 'defensive-coach (hit)' row.
+
+Usage:
+    python test/load_test_chat.py [--requests 200] [--concurrency 8] [--coach-ratio 0.25]
+                                  [--first-token-ms 300] [--per-token-ms 5] [--coach-cache] [--json OUT]
+"""
+import argparse
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import requests
+
+TEST_DIR = Path(__file__).resolve().parent
+LIVE_DATA_DIR = TEST_DIR.parent
+sys.path.insert(0, str(TEST_DIR))
+
+import espn_fixtures
+import stub_openai
+from bench_scrapers import percentile
+
+COACH_COORDINATES = LIVE_DATA_DIR.parent / 'test' / 'output.json'
+STAGES = ('espn_duration', 'filter_duration', 'prompt_build_duration', 'openai_duration')
+
+CHAT_QUERIES = [
+    ("What are the latest scores?", None),
+    ("Who had the most passing yards this week?", None),
+    ("Show me the top rushers in college football", 'college'),
+    ("Which NFL receivers had over 100 yards?", 'nfl'),
+    ("How did the defense perform in the last game?", None),
+    ("Give me tackle leaders for every team", 'college'),
+    ("Which quarterback threw the most touchdowns?", 'nfl'),
+]
+COACH_QUERIES = [
+    "What coverage is the defense showing?",
+    "Where is the weak spot in this formation?",
+    "How should the safeties adjust pre-snap?",
+]
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+def start_api_server(espn_base_url, openai_base_url, port, log_file, coach_cache=False):
+    """Launch api_server.py against the local stand-ins; returns the Popen handle"""
+    env = dict(os.environ,
+               OPENAI_API_KEY='stub',
+               OPENAI_BASE_URL=openai_base_url,
+               ESPN_BASE_URL=espn_base_url,
+               ESPN_CACHE_DB='none',
+               FORMATION_LIBRARY='none',
+               COACH_CACHE_MAX_ENTRIES=os.getenv('COACH_CACHE_MAX_ENTRIES', '256') if coach_cache else '0',
+               ESPN_MAX_RPS=os.getenv('ESPN_MAX_RPS', '1000'),
+               ESPN_BURST=os.getenv('ESPN_BURST', '1000'),
+               PORT=str(port),
+               PYTHONUNBUFFERED='1')
+    return subprocess.Popen([sys.executable, str(LIVE_DATA_DIR / 'api_server.py')],
+                            cwd=str(LIVE_DATA_DIR), env=env, stdout=log_file, stderr=subprocess.STDOUT)
+
+def wait_for_health(api_url, process, timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"api_server.py exited with code {process.returncode}")
+        try:
+            if requests.get(f"{api_url}/api/health", timeout=1).ok:
+                return
+        except requests.RequestException:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"api_server.py did not become healthy within {timeout}s")
+
+def build_workload(total, coach_ratio, seed):
+    """Deterministic mix of (endpoint, payload) requests"""
+    rng = random.Random(seed)
+    coordinates = json.loads(COACH_COORDINATES.read_text())
+    workload = []
+    for _ in range(total):
+        if rng.random() < coach_ratio:
+            workload.append(('defensive-coach', {'message': rng.choice(COACH_QUERIES), 'coordinates': coordinates}))
+        else:
+            message, sport = rng.choice(CHAT_QUERIES)
+            payload = {'message': message}
+            if sport:
+                payload['sport'] = sport
+            workload.append(('chat', payload))
+    return workload
+
+def send_request(api_url, endpoint, payload):
+    """POST one request; returns (endpoint, ok, client latency seconds, stats.timing dict)"""
+    start = time.perf_counter()
+    try:
+        response = requests.post(f"{api_url}/api/{endpoint}", json=payload, timeout=120)
+        body = response.json()
+        ok = response.ok and body.get('success', False)
+        timing = body.get('stats', {}).get('timing', {}) if ok else {}
+        # Cached coach answers skip the LLM - keep them out of the miss-path percentiles
+        if ok and body.get('stats', {}).get('cache', {}).get('hit'):
+            endpoint = f"{endpoint} (hit)"
+    except (requests.RequestException, ValueError):
+        ok, timing = False, {}
+    return endpoint, ok, time.perf_counter() - start, timing
+
+def summarize(results, elapsed):
+    """Throughput and percentile report per endpoint and per stage"""
+    report = {'elapsed_seconds': round(elapsed, 3), 'endpoints': {}}
+    for endpoint in sorted({r[0] for r in results}):
+        rows = [r for r in results if r[0] == endpoint]
+        ok_rows = [r for r in rows if r[1]]
+        latencies = [r[2] for r in ok_rows]
+        stages = {}
+        for stage in STAGES:
+            samples = [r[3][stage] for r in ok_rows if stage in r[3]]
+            if samples:
+                stages[stage.replace('_duration', '')] = _percentiles(samples)
+        report['endpoints'][endpoint] = {
+            'requests': len(rows),
+            'errors': len(rows) - len(ok_rows),
+            'requests_per_second': round(len(ok_rows) / elapsed, 2) if elapsed else 0.0,
+            'latency': _percentiles(latencies),
+            'stages': stages
+        }
+    all_ok = [r[2] for r in results if r[1]]
+    report['overall'] = {
+        'requests': len(results),
+        'errors': len(results) - len(all_ok),
+        'requests_per_second': round(len(all_ok) / elapsed, 2) if elapsed else 0.0,
+        'latency': _percentiles(all_ok)
+    }
+    return report
+
+def _percentiles(samples):
+    return {f"p{p}_ms": round(percentile(samples, p) * 1000, 2) for p in (50, 95, 99)}
+
+def print_report(report):
+    header = f"{'endpoint':<23}{'stage':<14}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+    print("\n" + header)
+    print("-" * len(header))
+    for endpoint, stats in report['endpoints'].items():
+        rows = [('total', stats['latency'])] + list(stats['stages'].items())
+        for stage, pct in rows:
+            print(f"{endpoint:<23}{stage:<14}{pct['p50_ms']:>10}{pct['p95_ms']:>10}{pct['p99_ms']:>10}")
+        print(f"{endpoint:<23}{stats['requests']} requests, {stats['errors']} errors, {stats['requests_per_second']} req/s")
+    overall = report['overall']
+    print(f"\n📈 Overall: {overall['requests']} requests, {overall['errors']} errors, "
+          f"{overall['requests_per_second']} req/s, p50 {overall['latency']['p50_ms']} ms, "
+          f"p99 {overall['latency']['p99_ms']} ms in {report['elapsed_seconds']}s")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--corpus', default=str(espn_fixtures.DEFAULT_CORPUS), help='Fixture corpus directory')
+    parser.add_argument('--copies', type=int, default=5, help='Copies per saved game when synthesizing a missing corpus')
+    parser.add_argument('--requests', type=int, default=200, help='Total requests to send')
+    parser.add_argument('--concurrency', type=int, default=8, help='Concurrent client connections')
+    parser.add_argument('--coach-ratio', type=float, default=0.25, help='Share of traffic sent to /api/defensive-coach')
+    parser.add_argument('--warmup', type=int, default=2, help='Untimed requests before measuring (primes the ESPN cache)')
+    parser.add_argument('--first-token-ms', type=float, default=300.0, help='Stub LLM delay before the first token')
+    parser.add_argument('--per-token-ms', type=float, default=5.0, help='Stub LLM delay per generated token')
+    parser.add_argument('--tokens', type=int, default=120, help='Stub LLM tokens per completion')
+    parser.add_argument('--seed', type=int, default=7, help='Seed for the request mix')
+    parser.add_argument('--coach-cache', action='store_true',
+                        help='Keep the defensive-coach answer cache on (hits are reported separately)')
+    parser.add_argument('--server-log', default=os.devnull, help='Where to write api_server.py output')
+    parser.add_argument('--json', help='Also write the report to this JSON file')
+    args = parser.parse_args()
+
+    espn_fixtures.ensure_corpus(args.corpus, args.copies)
+    replay_server, espn_base_url = espn_fixtures.start_replay_server(args.corpus)
+    llm_config = stub_openai.StubLLMConfig(args.first_token_ms, args.per_token_ms, args.tokens)
+    llm_server, openai_base_url = stub_openai.start_stub_server(llm_config)
+    port = free_port()
+    api_url = f"http://127.0.0.1:{port}"
+
+    print(f"📼 ESPN replay at {espn_base_url}")
+    print(f"🤖 Stub OpenAI at {openai_base_url} ({args.first_token_ms:.0f} ms first token, "
+          f"{args.per_token_ms:.1f} ms/token x {args.tokens})")
+
+    with open(args.server_log, 'w') as server_log:
+        process = start_api_server(espn_base_url, openai_base_url, port, server_log, args.coach_cache)
+        try:
+            wait_for_health(api_url, process)
+            print(f"🚀 api_server.py healthy at {api_url}")
+
+            workload = build_workload(args.requests, args.coach_ratio, args.seed)
+            for endpoint, payload in workload[:args.warmup]:
+                send_request(api_url, endpoint, payload)
+
+            print(f"🔥 Sending {len(workload)} requests with concurrency {args.concurrency}...")
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+                results = list(pool.map(lambda item: send_request(api_url, *item), workload))
+            report = summarize(results, time.perf_counter() - start)
+            report['config'] = vars(args)
+            report['llm_requests_served'] = llm_config.requests_served
+        finally:
+            process.terminate()
+            process.wait(timeout=10)
+            llm_server.shutdown()
+            replay_server.shutdown()
+
+    print_report(report)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Report written to {args.json}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the OpenAI Chat Completions API.
+
+The openai client honours OPENAI_BASE_URL, so api_server.py can be pointed at this
+server for load tests without spending tokens or depending on OpenAI latency.
+Latency is modelled as a fixed time-to-first-token plus a per-token delay; requests
+with "stream": true receive server-sent event chunks as the tokens are "generated".
+
+Usage:
+    python test/stub_openai.py [--port 8766] [--first-token-ms 300] [--per-token-ms 5] [--tokens 120]
+    export OPENAI_BASE_URL=http://127.0.0.1:8766/v1 OPENAI_API_KEY=stub
+"""
+import argparse
+import json
+import threading
+import time
+import uuid
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+class StubLLMConfig:
+    """Latency/size model shared by all handler threads"""
+
+    def __init__(self, first_token_ms=300.0, per_token_ms=5.0, tokens=120):
+        self.first_token_ms = first_token_ms
+        self.per_token_ms = per_token_ms
+        self.tokens = tokens
+        self.requests_served = 0
+        self._lock = threading.Lock()
+
+    def count_request(self):
+        with self._lock:
+            self.requests_served += 1
+
+def _completion_tokens(messages, count):
+    """Deterministic filler answer that mentions the question it was asked"""
+    question = messages[-1].get('content', '') if messages else ''
+    words = question.split()[-8:] or ['football']
+    return [f"{words[i % len(words)]} " for i in range(count)]
+
+def _make_handler(config):
+    class StubOpenAIHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_POST(self):
+            if not self.path.rstrip('/').endswith('/chat/completions'):
+                self._send_json(404, {'error': {'message': f'Unknown path {self.path}', 'type': 'invalid_request_error'}})
+                return
+
+            length = int(self.headers.get('Content-Length', 0))
+            payload = json.loads(self.rfile.read(length) or b'{}')
+            config.count_request()
+
+            messages = payload.get('messages', [])
+            model = payload.get('model', 'stub-model')
+            tokens = _completion_tokens(messages, config.tokens)
+            prompt_tokens = sum(len(str(m.get('content', ''))) for m in messages) // 4
+            completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+
+            time.sleep(config.first_token_ms / 1000)
+            if payload.get('stream'):
+                self._stream(completion_id, model, tokens)
+                return
+
+            time.sleep(config.per_token_ms * len(tokens) / 1000)
+            self._send_json(200, {
+                'id': completion_id,
+                'object': 'chat.completion',
+                'created': int(time.time()),
+                'model': model,
+                'choices': [{
+                    'index': 0,
+                    'message': {'role': 'assistant', 'content': ''.join(tokens).strip()},
+                    'finish_reason': 'stop'
+                }],
+                'usage': {
+                    'prompt_tokens': prompt_tokens,
+                    'completion_tokens': len(tokens),
+                    'total_tokens': prompt_tokens + len(tokens)
+                }
+            })
+
+        def _stream(self, completion_id, model, tokens):
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/event-stream')
+            self.send_header('Cache-Control', 'no-cache')
+            self.send_header('Connection', 'close')
+            self.end_headers()
+
+            for i, token in enumerate(tokens + [None]):
+                delta = {'role': 'assistant', 'content': token} if i == 0 else ({'content': token} if token else {})
+                chunk = {
+                    'id': completion_id,
+                    'object': 'chat.completion.chunk',
+                    'created': int(time.time()),
+                    'model': model,
+                    'choices': [{'index': 0, 'delta': delta, 'finish_reason': None if token else 'stop'}]
+                }
+                self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+                self.wfile.flush()
+                if token:
+                    time.sleep(config.per_token_ms / 1000)
+            self.wfile.write(b"data: [DONE]\n\n")
+            self.wfile.flush()
+            self.close_connection = True
+
+        def _send_json(self, status, body):
+            data = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    return StubOpenAIHandler
+
+def start_stub_server(config=None, port=0):
+    """Serve the stub in a background thread; returns (server, base_url ending in /v1)"""
+    config = config or StubLLMConfig()
+    server = ThreadingHTTPServer(('127.0.0.1', port), _make_handler(config))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='stub-openai', daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--port', type=int, default=8766)
+    parser.add_argument('--first-token-ms', type=float, default=300.0, help='Delay before the first token')
+    parser.add_argument('--per-token-ms', type=float, default=5.0, help='Delay per generated token')
+    parser.add_argument('--tokens', type=int, default=120, help='Tokens per completion')
+    args = parser.parse_args()
+
+    server, base_url = start_stub_server(StubLLMConfig(args.first_token_ms, args.per_token_ms, args.tokens), args.port)
+    print(f"🤖 Stub OpenAI API at {base_url}")
+    print(f"   export OPENAI_BASE_URL={base_url} OPENAI_API_KEY=stub")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+if __name__ == "__main__":
+    main()
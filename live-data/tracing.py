@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Request Tracing for the NextGen Live Football Stats API
+Named spans time each stage of the request path (scoreboard fetch, game fetch,
+parse, metadata extraction, filtering, prompt build, LLM call), feed
+Prometheus histograms and are written out as structured JSON log lines
+"""
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Any, Tuple
+
+# Seconds; spans range from sub-millisecond filtering to multi-second LLM calls
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+METRIC_PREFIX = 'nextgen'
+
+class Histogram:
+    """Cumulative-bucket histogram keyed by a label tuple (Prometheus semantics)"""
+
+    def __init__(self, name: str, help_text: str, label_names: Tuple[str, ...], buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.buckets = tuple(buckets)
+        self._series: Dict[Tuple[str, ...], List] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, labels: Tuple[str, ...]):
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                # [per-bucket counts, sum, count]
+                series = self._series[labels] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[0][i] += 1
+                    break
+            series[1] += value
+            series[2] += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            snapshot = {labels: (list(s[0]), s[1], s[2]) for labels, s in self._series.items()}
+
+        for labels, (bucket_counts, total, count) in sorted(snapshot.items()):
+            label_str = _format_labels(self.label_names, labels)
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, bucket_counts):
+                cumulative += bucket_count
+                lines.append(f'{self.name}_bucket{{{label_str},le="{bound}"}} {cumulative}')
+            lines.append(f'{self.name}_bucket{{{label_str},le="+Inf"}} {count}')
+            lines.append(f"{self.name}_sum{{{label_str}}} {total:.6f}")
+            lines.append(f"{self.name}_count{{{label_str}}} {count}")
+        return lines
+
+class Counter:
+    """Monotonic counter keyed by a label tuple"""
+
+    def __init__(self, name: str, help_text: str, label_names: Tuple[str, ...]):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels: Tuple[str, ...], amount: float = 1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            snapshot = dict(self._values)
+        for labels, value in sorted(snapshot.items()):
+            lines.append(f"{self.name}{{{_format_labels(self.label_names, labels)}}} {value:g}")
+        return lines
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...]) -> str:
+    escaped = (str(v).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for v in values)
+    return ','.join(f'{name}="{value}"' for name, value in zip(names, escaped))
+
+class Span:
+    """
+    One timed stage. Use as a context manager:
+        with tracer.span('espn.game_fetch', sport='nfl', game_id=game_id) as s:
+            ...
+            s.set(bytes=len(html))
+    `sport` becomes a metric label; every other attribute only goes to the log.
+    """
+
+    __slots__ = ('tracer', 'name', 'sport', 'attrs', 'start', 'duration', 'error', 'parent', 'children', 'trace_id')
+
+    def __init__(self, tracer: 'Tracer', name: str, sport: Optional[str], attrs: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.sport = sport or 'all'
+        self.attrs = attrs
+        self.start = 0.0
+        self.duration = 0.0
+        self.error = None
+        self.parent = None
+        self.children = []
+        self.trace_id = None
+
+    def set(self, **attrs):
+        self.attrs.update(attrs)
+
+    def begin(self) -> 'Span':
+        """Start without a with-block (for stages that span large literal blocks)"""
+        return self.__enter__()
+
+    def end(self):
+        self.__exit__(None, None, None)
+
+    def __enter__(self) -> 'Span':
+        self.tracer._push(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.duration = time.perf_counter() - self.start
+        if exc_type is not None:
+            self.error = exc_type.__name__
+        self.tracer._pop(self)
+        return False
+
+    def to_dict(self, root_start: float) -> Dict[str, Any]:
+        record = {
+            'span': self.name,
+            'start_ms': round((self.start - root_start) * 1000, 3),
+            'duration_ms': round(self.duration * 1000, 3)
+        }
+        if self.sport != 'all':
+            record['sport'] = self.sport
+        if self.attrs:
+            record['attrs'] = self.attrs
+        if self.error:
+            record['error'] = self.error
+        if self.children:
+            record['spans'] = [child.to_dict(root_start) for child in self.children]
+        return record
+
+class Tracer:
+    """
+    Collects spans per thread:
+    1. Nested spans attach to the enclosing span on the same thread
+    2. Every finished span is observed into the duration histogram
+    3. When a root span finishes, the whole trace is written as one JSON log line
+    """
+
+    def __init__(self, log_target: Optional[str] = None):
+        self._local = threading.local()
+        self.span_duration = Histogram(
+            f"{METRIC_PREFIX}_span_duration_seconds",
+            "Duration of traced request stages",
+            ('span', 'sport')
+        )
+        self.span_errors = Counter(
+            f"{METRIC_PREFIX}_span_errors_total",
+            "Traced stages that raised an exception",
+            ('span', 'sport')
+        )
+        self._log_lock = threading.Lock()
+        self._log_file = None
+        self.configure_log(log_target if log_target is not None else os.getenv('TRACE_LOG', 'stdout'))
+
+    def configure_log(self, target: str):
+        """'stdout', 'off' (or empty), or a file path to append JSON lines to"""
+        with self._log_lock:
+            if self._log_file not in (None, sys.stdout):
+                self._log_file.close()
+            if not target or target.lower() == 'off':
+                self._log_file = None
+            elif target.lower() == 'stdout':
+                self._log_file = sys.stdout
+            else:
+                self._log_file = open(target, 'a', buffering=1)
+
+    def span(self, name: str, sport: str = None, **attrs) -> Span:
+        return Span(self, name, sport, attrs)
+
+    def current_span(self) -> Optional[Span]:
+        stack = getattr(self._local, 'stack', None)
+        return stack[-1] if stack else None
+
+    @contextmanager
+    def attach(self, parent: Optional[Span]):
+        """Nest spans started on this (pool) thread under `parent` from another thread"""
+        previous = getattr(self._local, 'stack', None)
+        self._local.stack = [parent] if parent is not None else []
+        try:
+            yield
+        finally:
+            self._local.stack = previous
+
+    def _push(self, span: Span):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        if stack:
+            span.parent = stack[-1]
+            span.trace_id = span.parent.trace_id
+        else:
+            span.trace_id = uuid.uuid4().hex[:16]
+        stack.append(span)
+
+    def _pop(self, span: Span):
+        stack = self._local.stack
+        if span in stack:
+            # Also drops spans begun inside this one but never ended (e.g. an exception after begin())
+            del stack[stack.index(span):]
+
+        labels = (span.name, span.sport)
+        self.span_duration.observe(span.duration, labels)
+        if span.error:
+            self.span_errors.inc(labels)
+
+        if span.parent is not None:
+            span.parent.children.append(span)
+        else:
+            self._emit(span)
+
+    def _emit(self, root: Span):
+        if self._log_file is None:
+            return
+        record = {'ts': time.time(), 'trace_id': root.trace_id}
+        record.update(root.to_dict(root.start))
+        line = json.dumps(record, separators=(',', ':'), default=str)
+        with self._log_lock:
+            if self._log_file is not None:
+                self._log_file.write(f"TRACE {line}\n")
+
+    def render_prometheus(self) -> str:
+        """All metrics in the Prometheus text exposition format"""
+        lines = self.span_duration.render() + self.span_errors.render()
+        return '\n'.join(lines) + '\n'
+
+# Process-wide tracer shared by the scrapers, cache manager and API server
+tracer = Tracer()
+
+def span(name: str, sport: str = None, **attrs) -> Span:
+    """Shorthand for tracer.span(...)"""
+    return tracer.span(name, sport, **attrs)
@@ -0,0 +1,187 @@
+"""
+Batch/video mode for the detection-to-field pipeline.
+
+Streams detection frames (Roboflow-style {"predictions": [...]} documents) from a
+JSONL file or a directory of JSON files, runs the script_w_yardage pipeline on each
+frame in a process pool - line of scrimmage, field dimensions, coordinate mapping,
+coverage classification - and writes one JSON result per line as frames finish,
+in input order. With --track, frames are first tracked in order (tracking.py): stable
+player track ids plus a line of scrimmage and scale smoothed across frames. With
+--index, every mapped frame is added to a formation library (formation_index.py).
+
+Usage:
+    python batch_pipeline.py frames.jsonl -o results.jsonl [--workers 8] [--chunk-size 32]
+    python batch_pipeline.py detections_dir/ -o - [--balanced-los] [--skip-coverage] [--track] [--index library.jsonl]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(SCRIPT_DIR))
+# The coverage classifier and formation library are shared with the API in live-data/
+sys.path.insert(0, str(SCRIPT_DIR.parent / 'live-data'))
+
+from coordinate_engine import map_frame
+from los_estimator import default_estimator
+from script_w_yardage import calculate_field_dimensions, is_player_position, balanced_los_estimator
+from defensive_coverage import classify_coverage_v2
+from formation_index import FormationIndex
+from tracking import FrameTracker
+
+def _frame_id(frame, default):
+    """frame_id, else inference_id, else default - a frame_id of 0 is a real id"""
+    for key in ('frame_id', 'inference_id'):
+        if frame.get(key) is not None:
+            return frame[key]
+    return default
+
+def iter_frames(source):
+    """
+    Yield (frame_id, detection document) from a .jsonl file (one frame per line)
+    or a directory of .json files (sorted by name). Frames are read lazily.
+    """
+    source = Path(source)
+    if source.is_dir():
+        for path in sorted(source.glob('*.json')):
+            with path.open('r', encoding='utf-8') as f:
+                frame = json.load(f)
+            yield _frame_id(frame, path.stem), frame
+        return
+
+    with source.open('r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            frame = json.loads(line)
+            yield _frame_id(frame, line_number), frame
+
+def track_frames(frames, tracker):
+    """Attach FrameTracker output to each frame; runs in order in the parent process"""
+    for frame_id, frame in frames:
+        try:
+            frame['tracking'] = tracker.update(frame.get('predictions', []))
+        except Exception as e:
+            frame['tracking'] = {'error': f'{type(e).__name__}: {e}'}
+        yield frame_id, frame
+
+def process_frame(frame_id, frame, balanced_los=False, skip_coverage=False):
+    """Full pipeline for one frame; failures are reported in the result instead of raised"""
+    try:
+        all_detections = frame.get('predictions', [])
+        players = [d for d in all_detections if is_player_position(d['class'])]
+        tracking = frame.get('tracking')
+        if tracking and 'error' in tracking:
+            return {'frame_id': frame_id, 'error': f"tracking failed - {tracking['error']}"}
+
+        if tracking:
+            line_of_scrimmage_x = tracking['line_of_scrimmage_x']
+        else:
+            estimator = balanced_los_estimator if balanced_los else default_estimator
+            line_of_scrimmage_x = estimator.estimate(players)
+        if line_of_scrimmage_x is None:
+            return {'frame_id': frame_id, 'error': f'only {len(players)} players with positions - need at least 4'}
+
+        if tracking:
+            field_dims = tracking['field_dims']
+        else:
+            field_dims = calculate_field_dimensions(all_detections, line_of_scrimmage_x, players, verbose=False)
+        mapped_data = map_frame(all_detections, line_of_scrimmage_x, field_dims)
+
+        result = {'frame_id': frame_id, 'mapped': mapped_data}
+        if tracking:
+            result['tracking'] = {
+                'raw_line_of_scrimmage_x': tracking['raw_line_of_scrimmage_x'],
+                'line_of_scrimmage_x': line_of_scrimmage_x,
+                'raw_pixels_per_yard': tracking['raw_pixels_per_yard'],
+                'pixels_per_yard': field_dims['pixels_per_yard'],
+                'track_ids': {d['detection_id']: track_id for d, track_id in zip(all_detections, tracking['track_ids'])}
+            }
+        if not skip_coverage:
+            result['coverage'] = classify_coverage_v2(mapped_data)
+        return result
+    except Exception as e:
+        return {'frame_id': frame_id, 'error': f'{type(e).__name__}: {e}'}
+
+def _process_chunk(chunk, balanced_los, skip_coverage):
+    return [process_frame(frame_id, frame, balanced_los, skip_coverage) for frame_id, frame in chunk]
+
+def _chunks(frames, size):
+    chunk = []
+    for item in frames:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def run_pipeline(frames, workers=None, chunk_size=32, balanced_los=False, skip_coverage=False, track=False):
+    """
+    Yield per-frame results in input order. Frames go to the pool in chunks (to amortise
+    pickling), with a bounded number in flight so arbitrarily long films stream in constant memory.
+    """
+    workers = workers or os.cpu_count() or 1
+    if track:
+        estimator = balanced_los_estimator if balanced_los else default_estimator
+        frames = track_frames(frames, FrameTracker(estimator))
+    if workers == 1:
+        for frame_id, frame in frames:
+            yield process_frame(frame_id, frame, balanced_los, skip_coverage)
+        return
+
+    max_in_flight = workers * 2
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in _chunks(frames, chunk_size):
+            pending.append(pool.submit(_process_chunk, chunk, balanced_los, skip_coverage))
+            if len(pending) >= max_in_flight:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('source', help='Frames as a .jsonl file or a directory of .json detection files')
+    parser.add_argument('-o', '--output', default='-', help="Output JSONL path, '-' for stdout (default)")
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: CPU count)')
+    parser.add_argument('--chunk-size', type=int, default=32, help='Frames per task sent to a worker')
+    parser.add_argument('--balanced-los', action='store_true', help='Balance-only line of scrimmage (as script_w_yardage)')
+    parser.add_argument('--skip-coverage', action='store_true', help='Skip classify_coverage_v2')
+    parser.add_argument('--track', action='store_true', help='Track players and smooth LOS/scale across consecutive frames')
+    parser.add_argument('--index', default=None, help='Formation library (.jsonl) to add every mapped frame to')
+    args = parser.parse_args()
+
+    out = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+    index = FormationIndex(args.index) if args.index else None
+    source_name = Path(args.source).stem
+    start = time.perf_counter()
+    frames = errors = indexed = 0
+    try:
+        results = run_pipeline(iter_frames(args.source), args.workers, args.chunk_size,
+                               args.balanced_los, args.skip_coverage, args.track)
+        for result in results:
+            out.write(json.dumps(result, separators=(',', ':')) + '\n')
+            frames += 1
+            errors += 'error' in result
+            if index is not None and 'mapped' in result:
+                # Frame ids repeat across films, so library ids are prefixed with the source name
+                indexed += index.add(f"{source_name}:{result['frame_id']}", result['mapped']['players'],
+                                     result.get('coverage'), meta={'source': 'batch', 'film': source_name})
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    elapsed = time.perf_counter() - start
+    print(f"Processed {frames} frames ({errors} errors) in {elapsed:.2f}s "
+          f"({frames / elapsed if elapsed else 0:.0f} frames/s)", file=sys.stderr)
+    if index is not None:
+        print(f"Added {indexed} plays to {args.index} ({len(index)} in library)", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Vectorised coordinate mapping for detection batches.
+
+Turns an (N, 4) array of detection centres and boxes (x, y, width, height in pixels)
+into yard coordinates relative to the line of scrimmage and the field centre in one
+NumPy pass, and builds the same JSON document as script_w_yardage.map_coordinates.
+"""
+from collections import Counter
+
+import numpy as np
+
+OFFENSIVE_POSITIONS = ('QB', 'RB', 'WR', 'C', 'OG', 'OT', 'FB', 'TE')
+DEFENSIVE_POSITIONS = ('DE', 'DT', 'LB', 'DB', 'S', 'CB', 'FS', 'SS')
+PLAYER_POSITIONS = OFFENSIVE_POSITIONS + DEFENSIVE_POSITIONS
+
+# Column order of the box arrays
+BOX_COLUMNS = ('x', 'y', 'width', 'height')
+
+COORDINATE_SYSTEM = {
+    "x_axis": "Line of scrimmage at x=0, offensive direction is positive",
+    "y_axis": "Field center at y=0, sidelines at ±26.65 yards",
+    "units": "yards"
+}
+
+def detections_to_arrays(predictions):
+    """
+    Split detection dicts into columns:
+    boxes (N, 4) float array in BOX_COLUMNS order, confidence (N,), classes (N,) str array
+    """
+    boxes = np.array([[d['x'], d['y'], d['width'], d['height']] for d in predictions], dtype=float).reshape(-1, 4)
+    confidence = np.array([d['confidence'] for d in predictions], dtype=float)
+    classes = np.array([d['class'] for d in predictions], dtype=str)
+    return boxes, confidence, classes
+
+def player_mask(classes):
+    """True for detections whose class is a player position"""
+    return np.isin(classes, PLAYER_POSITIONS)
+
+def offense_mask(classes, x, line_of_scrimmage_x=None):
+    """
+    Vectorised classify_offense_defense: offense by position name, unknown classes
+    by side of the line of scrimmage (defense when there is no line).
+    """
+    is_offense = np.isin(classes, OFFENSIVE_POSITIONS)
+    if line_of_scrimmage_x is not None:
+        unknown = ~is_offense & ~np.isin(classes, DEFENSIVE_POSITIONS)
+        is_offense |= unknown & (x < line_of_scrimmage_x)
+    return is_offense
+
+def map_boxes(boxes, line_of_scrimmage_x, pixels_per_yard, field_center_y):
+    """
+    (N, 4) pixel boxes -> (N, 4) yards: x from the line of scrimmage, y from the
+    field centre, then box width and height
+    """
+    origin = np.array([line_of_scrimmage_x, field_center_y, 0.0, 0.0])
+    return (np.asarray(boxes, dtype=float) - origin) / pixels_per_yard
+
+def map_frame(predictions, line_of_scrimmage_x, field_dims):
+    """
+    Map one frame of detections to the map_coordinates JSON document
+    (metadata, players, referees, team_stats) without writing any file.
+    """
+    pixels_per_yard = field_dims['pixels_per_yard']
+    field_center_y = field_dims['field_center_y']
+
+    boxes, confidence, classes = detections_to_arrays(predictions)
+    players = player_mask(classes)
+    offense = offense_mask(classes, boxes[:, 0], line_of_scrimmage_x) & players
+    yards = np.round(map_boxes(boxes, line_of_scrimmage_x, pixels_per_yard, field_center_y), 2)
+
+    player_rows = np.flatnonzero(players)
+    yard_rows = yards[player_rows].tolist()
+    is_offense = offense[player_rows].tolist()
+
+    mapped_players = []
+    for row, (x_yards, y_yards, width_yards, height_yards), on_offense in zip(player_rows.tolist(), yard_rows, is_offense):
+        detection = predictions[row]
+        mapped_players.append({
+            "detection_id": detection['detection_id'],
+            "position": detection['class'],
+            "team": "offense" if on_offense else "defense",
+            "coordinates": {
+                "x_yards": x_yards,
+                "y_yards": y_yards,
+                "original_pixel_x": detection['x'],
+                "original_pixel_y": detection['y']
+            },
+            "confidence": detection['confidence'],
+            "bounding_box": {
+                "width_pixels": detection['width'],
+                "height_pixels": detection['height'],
+                "width_yards": width_yards,
+                "height_yards": height_yards
+            }
+        })
+
+    offense_count = int(offense.sum())
+    defense_count = len(player_rows) - offense_count
+    positions = classes[player_rows]
+    player_offense = offense[player_rows]
+
+    return {
+        "metadata": {
+            "coordinate_system": dict(COORDINATE_SYSTEM),
+            "field_dimensions": {
+                "width_yards": field_dims['width_yards'],
+                "length_yards": field_dims['length_yards'],
+                "pixels_per_yard": pixels_per_yard
+            },
+            "line_of_scrimmage_pixel": line_of_scrimmage_x,
+            "field_center_y_pixel": field_center_y
+        },
+        "players": mapped_players,
+        "referees": [],
+        "team_stats": {
+            "total_players": len(mapped_players),
+            "offense_count": offense_count,
+            "defense_count": defense_count,
+            "team_balance": "balanced" if abs(offense_count - defense_count) <= 3 else "unbalanced",
+            "offensive_positions": dict(Counter(positions[player_offense].tolist())),
+            "defensive_positions": dict(Counter(positions[~player_offense].tolist()))
+        }
+    }
@@ -1,9 +1,14 @@
-import matplotlib.pyplot as plt
 import numpy as np
 import json
 import sys
 from pathlib import Path
 
+from coordinate_engine import map_frame
+from los_estimator import LineOfScrimmageEstimator
+
+# Balance-only scoring, matching the original quadratic search
+balanced_los_estimator = LineOfScrimmageEstimator(lineman_weight=0)
+
 def is_player_position(class_name):
     """Helper function to check if a class represents a player position"""
     player_positions = {'QB', 'RB', 'WR', 'C', 'OG', 'OT', 'FB', 'TE', 'DE', 'DT', 'LB', 'DB', 'S', 'CB', 'FS', 'SS'}
@@ -71,66 +76,16 @@ def classify_offense_defense(players, line_of_scrimmage_x=None):
 def estimate_line_of_scrimmage(players):
     """
     Estimate line of scrimmage to create roughly balanced teams (around 11 players each).
-    Try multiple methods to find the best split.
+    Scores every candidate split in one sorted pass (see los_estimator.py); use
+    los_estimator.default_estimator for the OL/DL-aware estimate.
     """
-    player_list = [p for p in players if is_player_position(p['class'])]
-    if len(player_list) < 4:
-        return None
-    
-    x_positions = [p['x'] for p in player_list]
-    x_sorted = sorted(x_positions)
-    
-    # Method 1: Find position that creates most balanced split
-    best_line = None
-    best_balance_score = float('inf')
-    
-    # Try different potential line positions
-    for i in range(len(x_sorted) - 1):
-        potential_line = (x_sorted[i] + x_sorted[i + 1]) / 2
-        
-        # Count players on each side
-        left_count = sum(1 for x in x_positions if x < potential_line)
-        right_count = sum(1 for x in x_positions if x >= potential_line)
-        
-        # Score based on how close to 50/50 split (ideal for football)
-        balance_score = abs(left_count - right_count)
-        
-        # Prefer splits that are closer to even
-        if balance_score < best_balance_score:
-            best_balance_score = balance_score
-            best_line = potential_line
-    
-    # Method 2: If no good balanced split found, try median approach
-    if best_line is None or best_balance_score > 6:  # Allow some imbalance but not too much
-        # Try positions around the median
-        median_x = np.median(x_positions)
-        
-        # Test a few positions around median
-        test_positions = [
-            median_x - 50, median_x - 25, median_x, 
-            median_x + 25, median_x + 50
-        ]
-        
-        for test_line in test_positions:
-            left_count = sum(1 for x in x_positions if x < test_line)
-            right_count = sum(1 for x in x_positions if x >= test_line)
-            balance_score = abs(left_count - right_count)
-            
-            if balance_score < best_balance_score:
-                best_balance_score = balance_score
-                best_line = test_line
-    
-    # Method 3: Last resort - use the position that gives closest to 50/50 split
-    if best_line is None:
-        target_left = len(player_list) // 2
-        best_line = x_sorted[target_left] if target_left < len(x_sorted) else np.median(x_positions)
-    
-    return best_line
+    return balanced_los_estimator.estimate(players)
 
-def calculate_field_dimensions(all_detections, line_of_scrimmage_x, players):
+def calculate_field_dimensions(all_detections, line_of_scrimmage_x, players, verbose=True, pixels_per_yard=None):
     """
     Calculate field dimensions and yard scaling using football-specific measurements.
     Uses the fact that offensive backfield depth is typically 0-5 yards from LOS.
+    A known pixels_per_yard (e.g. smoothed across frames by tracking.py) skips the measurement.
     """
     x_positions = [d['x'] for d in all_detections]
     y_positions = [d['y'] for d in all_detections]
@@ -139,9 +94,7 @@ def calculate_field_dimensions(all_detections, line_of_scrimmage_x, players):
     field_length_pixels = max(y_positions) - min(y_positions)
     
     # Use offensive backfield depth to calculate accurate scale
-    pixels_per_yard = None
-    
-    if line_of_scrimmage_x and players:
+    if pixels_per_yard is None and line_of_scrimmage_x and players:
         # Get offensive players (assume they're on one side of LOS)
         offense, defense = classify_offense_defense(players, line_of_scrimmage_x)
         
@@ -168,8 +121,9 @@ def calculate_field_dimensions(all_detections, line_of_scrimmage_x, players):
             
             pixels_per_yard = backfield_depth_pixels / estimated_backfield_depth_yards
             
-            print(f"Debug: Backfield depth = {backfield_depth_pixels:.1f} pixels = {estimated_backfield_depth_yards} yards")
-            print(f"Debug: Calculated scale = {pixels_per_yard:.1f} pixels per yard")
+            if verbose:
+                print(f"Debug: Backfield depth = {backfield_depth_pixels:.1f} pixels = {estimated_backfield_depth_yards} yards")
+                print(f"Debug: Calculated scale = {pixels_per_yard:.1f} pixels per yard")
     
     # Fallback method if we can't use backfield measurement
     if pixels_per_yard is None:
@@ -265,6 +219,9 @@ def create_football_diagram():
     """
     Create a 2D American football play diagram with correct field orientation and proper yard markings
     """
+    # Imported here so batch processing never loads matplotlib
+    import matplotlib.pyplot as plt
+    
     # Set up the plot - make it vertical (taller than wide) like a football field section
     fig, ax = plt.subplots(1, 1, figsize=(10, 12))
     
@@ -453,86 +410,9 @@ def map_coordinates(detection_data, line_of_scrimmage_x, field_dims):
     - Y-axis: Field center is at y=0, positive values toward one sideline, negative toward the other
     - All coordinates are in yards
     """
-    mapped_data = {
-        "metadata": {
-            "coordinate_system": {
-                "x_axis": "Line of scrimmage at x=0, offensive direction is positive",
-                "y_axis": "Field center at y=0, sidelines at ±26.65 yards",
-                "units": "yards"
-            },
-            "field_dimensions": {
-                "width_yards": field_dims['width_yards'],
-                "length_yards": field_dims['length_yards'],
-                "pixels_per_yard": field_dims['pixels_per_yard']
-            },
-            "line_of_scrimmage_pixel": line_of_scrimmage_x,
-            "field_center_y_pixel": field_dims['field_center_y']
-        },
-        "players": [],
-        "referees": []
-    }
-    
+    # One vectorised pass over all detections (see coordinate_engine.py)
+    mapped_data = map_frame(detection_data['predictions'], line_of_scrimmage_x, field_dims)
     pixels_per_yard = field_dims['pixels_per_yard']
-    field_center_y = field_dims['field_center_y']
-    
-    # Process all detections
-    all_detections = detection_data['predictions']
-    players = [d for d in all_detections if is_player_position(d['class'])]
-    
-    # Classify offense and defense
-    offense, defense = classify_offense_defense(players, line_of_scrimmage_x)
-    
-    # Map player coordinates
-    for detection in all_detections:
-        if is_player_position(detection['class']):
-            # Convert pixel coordinates to yard coordinates relative to line of scrimmage and field center
-            x_yards = (detection['x'] - line_of_scrimmage_x) / pixels_per_yard
-            y_yards = (detection['y'] - field_center_y) / pixels_per_yard
-            
-            # Determine team
-            team = "offense" if detection in offense else "defense"
-            
-            player_data = {
-                "detection_id": detection['detection_id'],
-                "position": detection['class'],  # Player position (QB, WR, DE, etc.)
-                "team": team,
-                "coordinates": {
-                    "x_yards": round(x_yards, 2),  # Distance from line of scrimmage
-                    "y_yards": round(y_yards, 2),  # Distance from field center
-                    "original_pixel_x": detection['x'],
-                    "original_pixel_y": detection['y']
-                },
-                "confidence": detection['confidence'],
-                "bounding_box": {
-                    "width_pixels": detection['width'],
-                    "height_pixels": detection['height'],
-                    "width_yards": round(detection['width'] / pixels_per_yard, 2),
-                    "height_yards": round(detection['height'] / pixels_per_yard, 2)
-                }
-            }
-            mapped_data["players"].append(player_data)
-        
-        # No referees in position-based data
-    
-    # Add team statistics with position breakdowns
-    offensive_positions = {}
-    defensive_positions = {}
-    
-    for player in mapped_data["players"]:
-        position = player["position"]
-        if player["team"] == "offense":
-            offensive_positions[position] = offensive_positions.get(position, 0) + 1
-        else:
-            defensive_positions[position] = defensive_positions.get(position, 0) + 1
-    
-    mapped_data["team_stats"] = {
-        "total_players": len(mapped_data["players"]),
-        "offense_count": len(offense),
-        "defense_count": len(defense),
-        "team_balance": "balanced" if abs(len(offense) - len(defense)) <= 3 else "unbalanced",
-        "offensive_positions": offensive_positions,
-        "defensive_positions": defensive_positions
-    }
     
     # Export to JSON file
     output_filename = "output.json"
@@ -565,7 +445,7 @@ if __name__ == "__main__":
     # Call classifier from defensive_coverage.py (if available)
     try:
         script_dir = Path(__file__).resolve().parent
-        sys.path.insert(0, str(script_dir / 'testpy'))
+        sys.path.insert(0, str(script_dir.parent / 'live-data'))
         from defensive_coverage import classify_coverage_v2
 
         coverage_result = classify_coverage_v2(mapped_data)
@@ -583,6 +463,7 @@ if __name__ == "__main__":
         print(f"Warning: could not import/run classify_coverage_v2: {e}")
     
     # Create the diagram
+    import matplotlib.pyplot as plt
     fig, ax = create_football_diagram()
     
     # Show the plot
@@ -0,0 +1,216 @@
+"""
+Batch coverage classification over many plays.
+
+Takes a columnar table of players from any number of plays (play_id, team,
+position, x, y in yards) and classifies every play at once with grouped NumPy
+operations (bincount / reduceat over play ids) instead of one
+classify_coverage_v2 call per play. Results are identical to classify_coverage_v2.
+
+Usage:
+    python coverage_batch.py plays.csv [-o results.csv]
+    python coverage_batch.py batch_results.jsonl [-o results.csv]   # batch_pipeline.py output
+"""
+import argparse
+import csv
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# The per-play classifier lives with the API in live-data/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'live-data'))
+from defensive_coverage import (
+    DEEP_ZONE_YARDS, MAN_COVERAGE_PROXIMITY_YARDS, SHALLOW_CORNER_YARDS, TAMPA_LB_DEPTH_YARDS,
+    SAFETY_POSITIONS, DB_POSITIONS, LB_POSITIONS, RECEIVER_POSITIONS
+)
+
+TABLE_COLUMNS = ('play_id', 'team', 'position', 'x', 'y')
+RESULT_COLUMNS = ('play_id', 'primary_guess', 'secondary_guess', 'shell', 'deep_safeties_found',
+                  'man_coverage_signals', 'zone_coverage_signals', 'avg_linebacker_depth_yards')
+
+def plays_to_table(plays):
+    """
+    Flatten (play_id, play_data) pairs - play_data in the map_coordinates format -
+    into a columnar table: dict of TABLE_COLUMNS -> arrays, one row per player.
+    """
+    columns = {name: [] for name in TABLE_COLUMNS}
+    play_ids = []
+    for play_id, play_data in plays:
+        play_ids.append(play_id)
+        for p in play_data.get("players", []):
+            columns['play_id'].append(play_id)
+            columns['team'].append(p.get("team"))
+            columns['position'].append(p.get("position"))
+            columns['x'].append(p['coordinates']['x_yards'])
+            columns['y'].append(p['coordinates']['y_yards'])
+
+    table = {
+        'play_id': np.array(columns['play_id'], dtype=object),
+        'team': np.array(columns['team'], dtype=object),
+        'position': np.array(columns['position'], dtype=object),
+        'x': np.array(columns['x'], dtype=float),
+        'y': np.array(columns['y'], dtype=float)
+    }
+    # Plays without any players still get a result row
+    table['plays'] = np.array(play_ids, dtype=object)
+    return table
+
+def _group_mean(values, groups, count):
+    sums = np.bincount(groups, weights=values, minlength=count)
+    sizes = np.bincount(groups, minlength=count)
+    return np.divide(sums, sizes, out=np.zeros(count), where=sizes > 0)
+
+def _nearest_distance_by_group(db_xy, db_group, receiver_xy, receiver_group, count):
+    """
+    Distance from every DB to the closest receiver of its own play, NaN when the play has none.
+    All same-play DB x receiver pairs are expanded at once, then reduced per DB.
+    """
+    order = np.argsort(receiver_group, kind='stable')
+    receiver_xy = receiver_xy[order]
+    receivers_per_group = np.bincount(receiver_group, minlength=count)
+    group_start = np.concatenate([[0], np.cumsum(receivers_per_group)[:-1]])
+
+    pairs_per_db = receivers_per_group[db_group]
+    nearest = np.full(len(db_xy), np.nan)
+    has_pairs = pairs_per_db > 0
+    if not has_pairs.any():
+        return nearest
+
+    db_rows = np.repeat(np.flatnonzero(has_pairs), pairs_per_db[has_pairs])
+    pair_start = np.concatenate([[0], np.cumsum(pairs_per_db[has_pairs])[:-1]])
+    offset_in_group = np.arange(len(db_rows)) - np.repeat(pair_start, pairs_per_db[has_pairs])
+    receiver_rows = group_start[db_group[db_rows]] + offset_in_group
+
+    delta = db_xy[db_rows] - receiver_xy[receiver_rows]
+    distances = np.sqrt(delta[:, 0]**2 + delta[:, 1]**2)
+    nearest[has_pairs] = np.minimum.reduceat(distances, pair_start)
+    return nearest
+
+def classify_coverage_table(table):
+    """
+    Classify every play in a columnar player table (see plays_to_table).
+    Returns a results table: dict of RESULT_COLUMNS -> arrays, one row per play,
+    with the same values classify_coverage_v2 gives for each play (averages are summed
+    in row order, so keep each play's players in their original order for exact equality).
+    """
+    play_ids = np.asarray(table['play_id'], dtype=object)
+    plays = table.get('plays')
+    if plays is None:
+        plays = np.array(list(dict.fromkeys(play_ids.tolist())), dtype=object)
+    count = len(plays)
+    play_index = {play_id: i for i, play_id in enumerate(plays.tolist())}
+    group = np.fromiter((play_index[p] for p in play_ids.tolist()), dtype=np.intp, count=len(play_ids))
+
+    team = np.asarray(table['team'], dtype=object)
+    position = np.asarray(table['position'], dtype=object)
+    x = np.asarray(table['x'], dtype=float)
+    y = np.asarray(table['y'], dtype=float)
+
+    # --- Role masks (one pass each instead of per-play list comprehensions) ---
+    defense = team == "defense"
+    offense = team == "offense"
+    safeties = defense & np.isin(position, SAFETY_POSITIONS)
+    dbs = defense & np.isin(position, DB_POSITIONS)
+    lbs = defense & np.isin(position, LB_POSITIONS)
+    receivers = offense & np.isin(position, RECEIVER_POSITIONS)
+
+    # --- Core Analysis ---
+    deep_safeties = np.bincount(group[safeties & (x >= DEEP_ZONE_YARDS)], minlength=count)
+    avg_lb_depth = _group_mean(x[lbs], group[lbs], count)
+    deep_lbs = np.bincount(group[lbs & (x > TAMPA_LB_DEPTH_YARDS)], minlength=count)
+
+    db_group = group[dbs]
+    nearest = _nearest_distance_by_group(np.column_stack([x[dbs], y[dbs]]), db_group,
+                                         np.column_stack([x[receivers], y[receivers]]), group[receivers], count)
+    paired = ~np.isnan(nearest)
+    man_signals = np.bincount(db_group[paired & (nearest < MAN_COVERAGE_PROXIMITY_YARDS)], minlength=count)
+    zone_signals = np.bincount(db_group[paired], minlength=count) - man_signals
+    shallow_corners = np.bincount(db_group[paired & (x[dbs] < SHALLOW_CORNER_YARDS)], minlength=count)
+
+    # --- Decision Logic ---
+    man_leaning = man_signals > zone_signals
+    single_high = deep_safeties == 1
+    two_high = deep_safeties == 2
+    tampa = two_high & (deep_lbs > 0)
+    cover_2_man = two_high & ~tampa & man_leaning & (zone_signals <= 1)
+    cover_2_zone = two_high & ~tampa & ~cover_2_man & (shallow_corners >= 2)
+    quarters = two_high & ~tampa & ~cover_2_man & ~cover_2_zone
+    conditions = [deep_safeties == 0, single_high & man_leaning, single_high & ~man_leaning,
+                  tampa, cover_2_man, cover_2_zone, quarters]
+
+    shell = np.select([deep_safeties == 0, single_high, two_high],
+                      ["Zero-High", "Single-High", "Two-High"], default="Unknown")
+    primary = np.select(conditions, [
+        "Cover 0 (Man Blitz)", "Cover 1 (Man Free)", "Cover 3 (Zone)", "Tampa 2 (Zone)",
+        "Cover 2 Man", "Cover 2 Zone", "Cover 4 / Quarters (Zone)"
+    ], default="Unknown")
+    secondary = np.select(conditions, [
+        "Cover 1 Robber (with a lurking LB/S)", "Cover 3 (Zone)", "Cover 1 (Man Free)", "Cover 2 Zone",
+        "Quarters (Man-match)", "Quarters (Trap)", "Cover 2 Zone"
+    ], default="None")
+
+    return {
+        'play_id': plays,
+        'primary_guess': primary,
+        'secondary_guess': secondary,
+        'shell': shell,
+        'deep_safeties_found': deep_safeties,
+        'man_coverage_signals': man_signals,
+        'zone_coverage_signals': zone_signals,
+        # Python's round() per play, matching classify_coverage_v2 exactly
+        'avg_linebacker_depth_yards': np.array([round(d, 2) for d in avg_lb_depth.tolist()])
+    }
+
+def result_rows(results):
+    """Results table -> list of per-play dicts"""
+    columns = [results[name].tolist() for name in RESULT_COLUMNS]
+    return [dict(zip(RESULT_COLUMNS, row)) for row in zip(*columns)]
+
+def read_table(path):
+    """
+    Load a player table from a CSV with TABLE_COLUMNS headers, or from batch_pipeline.py
+    JSONL output (one play per frame, keyed by frame_id; failed frames are skipped).
+    """
+    path = Path(path)
+    if path.suffix == '.jsonl':
+        with path.open('r', encoding='utf-8') as f:
+            frames = (json.loads(line) for line in f if line.strip())
+            return plays_to_table((frame['frame_id'], frame['mapped']) for frame in frames if 'mapped' in frame)
+
+    with path.open('r', encoding='utf-8', newline='') as f:
+        rows = list(csv.DictReader(f))
+    return {
+        'play_id': np.array([row['play_id'] for row in rows], dtype=object),
+        'team': np.array([row['team'] for row in rows], dtype=object),
+        'position': np.array([row['position'] for row in rows], dtype=object),
+        'x': np.array([float(row['x']) for row in rows], dtype=float),
+        'y': np.array([float(row['y']) for row in rows], dtype=float)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('source', help='Player table (.csv) or batch_pipeline.py results (.jsonl)')
+    parser.add_argument('-o', '--output', default='-', help="Output CSV path, '-' for stdout (default)")
+    args = parser.parse_args()
+
+    table = read_table(args.source)
+    start = time.perf_counter()
+    results = classify_coverage_table(table)
+    elapsed = time.perf_counter() - start
+
+    out = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8', newline='')
+    try:
+        writer = csv.DictWriter(out, fieldnames=RESULT_COLUMNS)
+        writer.writeheader()
+        writer.writerows(result_rows(results))
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    print(f"Classified {len(results['play_id'])} plays ({len(table['play_id'])} players) in {elapsed:.3f}s",
+          file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
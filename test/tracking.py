@@ -0,0 +1,174 @@
+"""
+Temporal smoothing and tracking across detection frames.
+
+Consecutive frames of the same snap should agree on the line of scrimmage, the
+pixels-per-yard scale and who is who. FrameTracker:
+1. Associates detections across frames by box IoU (Hungarian matching when scipy
+   is installed, greedy otherwise) and gives each player a stable track id
+2. Warm-starts the line-of-scrimmage search around the previous frame's line
+3. Smooths the line and the scale with scalar Kalman filters, resetting on jumps
+   (a new snap or camera cut) instead of dragging the old estimate along
+"""
+import numpy as np
+
+from coordinate_engine import detections_to_arrays, player_mask
+from los_estimator import default_estimator
+from script_w_yardage import calculate_field_dimensions, is_player_position
+
+try:
+    from scipy.optimize import linear_sum_assignment
+except ImportError:  # optional: greedy matching is used instead
+    linear_sum_assignment = None
+
+def box_corners(boxes):
+    """(N, 4) centre boxes (x, y, width, height) -> (N, 4) corners (x1, y1, x2, y2)"""
+    boxes = np.asarray(boxes, dtype=float).reshape(-1, 4)
+    half = boxes[:, 2:] / 2
+    return np.hstack([boxes[:, :2] - half, boxes[:, :2] + half])
+
+def iou_matrix(boxes_a, boxes_b):
+    """Pairwise IoU between two sets of centre boxes, shape (len(a), len(b))"""
+    a = box_corners(boxes_a)[:, None, :]
+    b = box_corners(boxes_b)[None, :, :]
+    overlap_w = np.clip(np.minimum(a[..., 2], b[..., 2]) - np.maximum(a[..., 0], b[..., 0]), 0, None)
+    overlap_h = np.clip(np.minimum(a[..., 3], b[..., 3]) - np.maximum(a[..., 1], b[..., 1]), 0, None)
+    intersection = overlap_w * overlap_h
+    area_a = (a[..., 2] - a[..., 0]) * (a[..., 3] - a[..., 1])
+    area_b = (b[..., 2] - b[..., 0]) * (b[..., 3] - b[..., 1])
+    union = area_a + area_b - intersection
+    return np.divide(intersection, union, out=np.zeros_like(intersection), where=union > 0)
+
+def match_boxes(iou, threshold):
+    """(row, col) pairs maximising total IoU, keeping only pairs at or above threshold"""
+    if iou.size == 0:
+        return []
+
+    if linear_sum_assignment is not None:
+        rows, cols = linear_sum_assignment(-iou)
+        return [(r, c) for r, c in zip(rows.tolist(), cols.tolist()) if iou[r, c] >= threshold]
+
+    # Greedy: take the best remaining pair until none clears the threshold
+    order = np.argsort(-iou, axis=None)
+    used_rows, used_cols, pairs = set(), set(), []
+    for flat in order.tolist():
+        r, c = divmod(flat, iou.shape[1])
+        if iou[r, c] < threshold:
+            break
+        if r not in used_rows and c not in used_cols:
+            used_rows.add(r)
+            used_cols.add(c)
+            pairs.append((r, c))
+    return pairs
+
+class ScalarKalman:
+    """
+    Random-walk Kalman filter for one slowly varying value.
+    Measurements further than reset_sigma standard deviations from the prediction
+    restart the filter at the measurement.
+    """
+
+    def __init__(self, process_std, measurement_std, reset_sigma=4.0):
+        self.process_var = process_std ** 2
+        self.measurement_var = measurement_std ** 2
+        self.reset_sigma = reset_sigma
+        self.value = None
+        self.variance = None
+        self.resets = 0
+
+    def update(self, measurement):
+        """Fold in a measurement (None just predicts) and return the smoothed value"""
+        if self.value is None:
+            if measurement is not None:
+                self.value, self.variance = float(measurement), self.measurement_var
+            return self.value
+
+        self.variance += self.process_var
+        if measurement is None:
+            return self.value
+
+        innovation = measurement - self.value
+        innovation_var = self.variance + self.measurement_var
+        if abs(innovation) > self.reset_sigma * np.sqrt(innovation_var):
+            self.value, self.variance = float(measurement), self.measurement_var
+            self.resets += 1
+            return self.value
+
+        gain = self.variance / innovation_var
+        self.value += gain * innovation
+        self.variance *= 1 - gain
+        return self.value
+
+class IoUTracker:
+    """Stable track ids for detections across frames"""
+
+    def __init__(self, iou_threshold=0.3, max_missed=5):
+        self.iou_threshold = iou_threshold
+        self.max_missed = max_missed
+        self.boxes = np.empty((0, 4))
+        self.track_ids = []
+        self.missed = []
+        self.next_id = 1
+
+    def update(self, boxes):
+        """Track ids (list, aligned with boxes) for one frame's (N, 4) centre boxes"""
+        boxes = np.asarray(boxes, dtype=float).reshape(-1, 4)
+        pairs = match_boxes(iou_matrix(self.boxes, boxes), self.iou_threshold)
+
+        ids = [None] * len(boxes)
+        matched_tracks = set()
+        for track_row, box_row in pairs:
+            ids[box_row] = self.track_ids[track_row]
+            matched_tracks.add(track_row)
+        for i, track_id in enumerate(ids):
+            if track_id is None:
+                ids[i] = self.next_id
+                self.next_id += 1
+
+        # Unmatched tracks survive a few frames (occlusion, missed detection)
+        kept = [row for row in range(len(self.track_ids))
+                if row not in matched_tracks and self.missed[row] + 1 <= self.max_missed]
+        self.boxes = np.vstack([boxes, self.boxes[kept]]) if kept else boxes
+        self.missed = [0] * len(ids) + [self.missed[row] + 1 for row in kept]
+        self.track_ids = ids + [self.track_ids[row] for row in kept]
+        return ids
+
+class FrameTracker:
+    """Per-film state: IoU tracks plus smoothed, warm-started line of scrimmage and scale"""
+
+    def __init__(self, estimator=default_estimator, los_window_pixels=60.0, iou_threshold=0.3,
+                 los_std=(3.0, 15.0), scale_std=(0.2, 3.0)):
+        self.estimator = estimator
+        self.los_window_pixels = los_window_pixels
+        self.tracker = IoUTracker(iou_threshold)
+        self.los_filter = ScalarKalman(*los_std)
+        self.scale_filter = ScalarKalman(*scale_std)
+
+    def update(self, predictions):
+        """
+        Track one frame. Returns track_ids (aligned with predictions), the raw and smoothed
+        line of scrimmage, and field dimensions rebuilt with the smoothed scale.
+        """
+        boxes, confidence, classes = detections_to_arrays(predictions)
+        track_ids = self.tracker.update(boxes)
+
+        players = player_mask(classes)
+        raw_los = self.estimator.estimate_arrays(boxes[players, 0], classes[players],
+                                                 near=self.los_filter.value, window=self.los_window_pixels)
+        line_of_scrimmage_x = self.los_filter.update(raw_los)
+        if line_of_scrimmage_x is None or not predictions:
+            return {'track_ids': track_ids, 'raw_line_of_scrimmage_x': raw_los,
+                    'line_of_scrimmage_x': None, 'raw_pixels_per_yard': None, 'field_dims': None}
+
+        player_list = [d for d in predictions if is_player_position(d['class'])]
+        raw_dims = calculate_field_dimensions(predictions, line_of_scrimmage_x, player_list, verbose=False)
+        pixels_per_yard = self.scale_filter.update(raw_dims['pixels_per_yard'])
+        field_dims = calculate_field_dimensions(predictions, line_of_scrimmage_x, player_list,
+                                                verbose=False, pixels_per_yard=pixels_per_yard)
+
+        return {
+            'track_ids': track_ids,
+            'raw_line_of_scrimmage_x': raw_los,
+            'line_of_scrimmage_x': line_of_scrimmage_x,
+            'raw_pixels_per_yard': raw_dims['pixels_per_yard'],
+            'field_dims': field_dims
+        }